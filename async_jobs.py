@@ -0,0 +1,109 @@
+# File: async_jobs.py
+# Asynchronous job manager for IBM backends (or fake_ibm_backend.FakeQueuedBackend for local testing).
+# main.py and the *_ibm_brisbane.py scripts submit one job and block on job.result().  Here many transpiled
+# circuits (a sweep, repeated trials, ...) are submitted concurrently - or as one batched job - and polled with
+# exponential backoff.  Every result is written to the results store as soon as it arrives, so an interrupted
+# run only resubmits what is missing.
+#
+# Usage:
+#   results = run_jobs(backend, transpiled_circuits, shots=1000, store=open_results_store(), experiment='brisbane_sweep')
+#
+# This is a library entry point for sweep scripts.  main.py does not use it: the jobs of a --spec file differ in code,
+# noise and backend (most are local simulations), each job is profiled and reported on its own, and its IBM path
+# already reattaches to a submitted job through result_cache.py.
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - Stored results only reused for the same backend and shots.
+
+import asyncio
+import time
+
+from results_store import get_backend_name, get_batches, get_circuit_fingerprint, get_noise_fingerprint, record_batch
+
+async def wait_for_job(job, initial_delay=1.0, max_delay=60.0, backoff=2.0):
+    # polls job.status() without blocking the event loop, waiting longer after every poll
+    from qiskit.providers.jobstatus import JOB_FINAL_STATES
+
+    delay = initial_delay
+    while True:
+        status = await asyncio.to_thread(job.status)
+        if status in JOB_FINAL_STATES:
+            return status
+        await asyncio.sleep(delay)
+        delay = min(delay * backoff, max_delay)
+
+async def run_one_job(index, backend, circuits, shots, semaphore, poll_options, run_options):
+    # returns (index, result, submitted, finished) - result is None if the job failed
+    async with semaphore:
+        submitted = time.time()
+        try:
+            job = await asyncio.to_thread(backend.run, circuits, shots=shots, **run_options)
+            status = await wait_for_job(job, **poll_options)
+            result = await asyncio.to_thread(job.result)
+        except Exception as error:
+            print('Job for circuit ' + str(index) + ' failed: ' + str(error))
+            result = None
+        return index, result, submitted, time.time()
+
+async def submit_jobs(backend, circuits, shots=1000, max_concurrent=5, batched=False, store=None, experiment='jobs',
+                      on_result=None, poll_options=None, **run_options):
+    # circuits must already be transpiled for the backend
+    # returns a list of counts in the same order as circuits (None for anything that failed)
+    # on_result(index, counts) is called as results arrive
+    if poll_options is None:
+        poll_options = {}
+
+    backend_name = get_backend_name(backend)
+    noise_hash = get_noise_fingerprint(None) # hardware noise is whatever the device has on the day
+    circuit_hashes = [get_circuit_fingerprint(circuit) for circuit in circuits]
+    all_counts = [None] * len(circuits)
+
+    # anything already in the store is not submitted again
+    stored = {}
+    if store is not None:
+        for batch in get_batches(store, experiment, noise_hash=noise_hash, shots=shots, backend=backend_name):
+            stored[(batch['circuit_hash'], batch['batch_index'])] = batch['counts']
+
+    pending = []
+    for index, circuit_hash in enumerate(circuit_hashes):
+        if (circuit_hash, index) in stored:
+            all_counts[index] = stored[(circuit_hash, index)]
+        else:
+            pending.append(index)
+
+    if not pending:
+        return all_counts
+
+    def finish(index, counts, submitted, finished):
+        all_counts[index] = counts
+        if store is not None:
+            record_batch(store, experiment, index, circuit_hashes[index], noise_hash, shots, counts,
+                         backend=backend_name, started=submitted, finished=finished)
+        if on_result is not None:
+            on_result(index, counts)
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    if batched:
+        # a single job holding every pending circuit - one trip through the queue
+        index, result, submitted, finished = await run_one_job(
+            'batch', backend, [circuits[index] for index in pending], shots, semaphore, poll_options, run_options)
+        if result is not None:
+            for position, index in enumerate(pending):
+                finish(index, result.get_counts(position), submitted, finished)
+        return all_counts
+
+    tasks = [asyncio.create_task(run_one_job(index, backend, circuits[index], shots, semaphore, poll_options, run_options))
+             for index in pending]
+
+    for task in asyncio.as_completed(tasks):
+        index, result, submitted, finished = await task
+        if result is not None:
+            finish(index, result.get_counts(), submitted, finished)
+
+    return all_counts
+
+def run_jobs(backend, circuits, shots=1000, **options):
+    # synchronous entry point for scripts
+    return asyncio.run(submit_jobs(backend, circuits, shots, **options))
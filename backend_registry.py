@@ -0,0 +1,203 @@
+# File: backend_registry.py
+# Picks the Aer simulator configuration for the local backends in main.py (choices 1 to 3) instead of hard-coding
+# AerSimulator(method='statevector', device='GPU') with blocking_qubits=22, which fails outright on CPU-only nodes.
+# The GPU is only used if Aer was built with it; otherwise the job falls back to the CPU and says so.
+#
+# Usage:
+#   config = get_simulator_config('generic_nvidia', num_qubits=circuit.num_qubits)
+#   print_simulator_config(config)
+#   simulator = new_simulator(config, noise_model)
+#   result = execute(circuit, simulator, shots=1000, **config['run_options']).result()
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - Methods without a GPU implementation (stabilizer, matrix_product_state, ...) run on the CPU.
+# October 19, 2026 - Blocking and statevector_parallel_threshold measured per host by blocking_autotuner.py.
+# October 19, 2026 - One nvidia-smi query for the GPU count and memory (also used by blocking_autotuner.py).
+
+import os
+import shutil
+import subprocess
+
+from method_selection import GPU_METHODS
+
+# Aer switches from shot/experiment parallelism to parallelizing the statevector update at this width
+STATEVECTOR_PARALLEL_THRESHOLD = 14
+
+# what each local menu choice was written for
+BACKEND_PROFILES = {
+    'mac_t600': {
+        'description': 'Apple Mac A1289 with two NVIDIA T600 GPUs',
+        'device': 'GPU',
+        'blocking_qubits': 22, # 28 qubits was the most the two T600's could hold
+    },
+    'campus_a200': {
+        'description': 'SIUE Campus Cluster with NVIDIA A200 GPUs',
+        'device': 'GPU',
+        'blocking_qubits': 26,
+    },
+    'generic_nvidia': {
+        'description': "'Generic' NVIDIA configuration",
+        'device': 'GPU',
+        'blocking_qubits': 22,
+    },
+    'cpu': {
+        'description': 'CPU only',
+        'device': 'CPU',
+        'blocking_qubits': None,
+    },
+    'auto': {
+        'description': 'Best device found on this machine',
+        'device': None,
+        'blocking_qubits': 22,
+    },
+}
+
+_available_devices = None
+_gpus = None
+
+def get_available_devices():
+    # ('CPU',) or ('CPU', 'GPU') depending on how qiskit-aer was built - only asked once per process
+    global _available_devices
+    if _available_devices is None:
+        from qiskit_aer import AerSimulator
+
+        try:
+            _available_devices = tuple(AerSimulator().available_devices())
+        except Exception: # very old Aer builds have no available_devices()
+            _available_devices = ('CPU',)
+    return _available_devices
+
+def get_cpu_count():
+    # respects taskset / cluster scheduler limits where the platform supports it
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def get_gpus():
+    # [{'name': ..., 'memory_bytes': ...}] for every GPU nvidia-smi reports, [] if it is not installed - only asked once per process
+    global _gpus
+    if _gpus is not None:
+        return _gpus
+    _gpus = []
+    if shutil.which('nvidia-smi') is None:
+        return _gpus
+    try:
+        output = subprocess.run(['nvidia-smi', '--query-gpu=name,memory.total', '--format=csv,noheader,nounits'],
+                                capture_output=True, text=True, timeout=10).stdout
+        for line in output.splitlines():
+            if line.strip():
+                name, memory = line.rsplit(',', 1)
+                _gpus.append({'name': name.strip(), 'memory_bytes': int(memory.strip()) * 1024 ** 2})
+    except (OSError, ValueError, subprocess.SubprocessError):
+        _gpus = []
+    return _gpus
+
+def get_gpu_count():
+    return len(get_gpus())
+
+def get_gpu_memory_bytes():
+    # memory of the smallest GPU, None without one
+    sizes = [gpu['memory_bytes'] for gpu in get_gpus()]
+    return min(sizes) if sizes else None
+
+def get_simulator_config(backend_name='auto', num_qubits=None, method='statevector', blocking_qubits=None, autotune=True):
+    # num_qubits is the width of the circuits that will be run, None if not known yet
+    # blocking_qubits overrides the tuned/profile value (the scripts keep their number_blocking_qubits hyperparameter)
+    # autotune=False uses the profile's blocking instead of measuring it (see blocking_autotuner.py)
+    if backend_name not in BACKEND_PROFILES:
+        raise ValueError("Unknown local backend '" + str(backend_name) + "', expected one of " +
+                         ', '.join(sorted(BACKEND_PROFILES)))
+    profile = BACKEND_PROFILES[backend_name]
+
+    devices = get_available_devices()
+    fallback_reason = None
+    device = profile['device']
+    if device is None:
+        device = 'GPU' if 'GPU' in devices else 'CPU'
+    elif device == 'GPU' and 'GPU' not in devices:
+        device = 'CPU'
+        fallback_reason = 'qiskit-aer on this machine was built without GPU support'
+    if device == 'GPU' and method not in GPU_METHODS:
+        device = 'CPU'
+        if profile['device'] == 'GPU':
+            fallback_reason = "the '" + method + "' method only runs on the CPU"
+
+    tuned_settings = None
+    if blocking_qubits is None and autotune and method == 'statevector' and num_qubits is not None:
+        from blocking_autotuner import get_tuned_settings
+        tuned_settings = get_tuned_settings(device, num_qubits)
+        blocking_qubits = tuned_settings['blocking_qubits']
+    elif blocking_qubits is None:
+        blocking_qubits = profile['blocking_qubits']
+
+    num_threads = get_cpu_count()
+    num_gpus = get_gpu_count() if device == 'GPU' else 0
+    small_circuit = num_qubits is not None and num_qubits < STATEVECTOR_PARALLEL_THRESHOLD
+
+    simulator_options = {
+        'method': method,
+        'device': device,
+        'max_parallel_threads': num_threads,
+    }
+    if device == 'CPU' and (small_circuit or method not in GPU_METHODS):
+        # a small statevector (or a stabilizer tableau / MPS) cannot keep every core busy - spread shots and
+        # circuits over the cores instead
+        simulator_options['max_parallel_experiments'] = num_threads
+        simulator_options['max_parallel_shots'] = num_threads
+    else:
+        simulator_options['max_parallel_experiments'] = 1
+        simulator_options['max_parallel_shots'] = 1
+    if tuned_settings is not None:
+        simulator_options['statevector_parallel_threshold'] = tuned_settings['statevector_parallel_threshold']
+
+    # chunking only pays off when the circuit is wider than a chunk - measured on this host if it was tuned,
+    # otherwise only used on the GPU as the profiles were written for
+    run_options = {}
+    use_blocking = tuned_settings is not None or device == 'GPU'
+    if use_blocking and blocking_qubits is not None and (num_qubits is None or num_qubits > blocking_qubits):
+        run_options['blocking_enable'] = True
+        run_options['blocking_qubits'] = blocking_qubits
+
+    return {
+        'backend': backend_name,
+        'description': profile['description'],
+        'device': device,
+        'available_devices': devices,
+        'num_threads': num_threads,
+        'num_gpus': num_gpus,
+        'num_qubits': num_qubits,
+        'fallback_reason': fallback_reason,
+        'tuned': tuned_settings is not None,
+        'simulator_options': simulator_options,
+        'run_options': run_options,
+    }
+
+def new_simulator(config, noise_model=None, **options):
+    from qiskit_aer import AerSimulator
+
+    simulator_options = dict(config['simulator_options'])
+    simulator_options.update(options)
+    return AerSimulator(noise_model=noise_model, **simulator_options)
+
+def print_simulator_config(config):
+    print("Local backend: " + config['backend'] + " (" + config['description'] + ")")
+    if config['fallback_reason'] is not None:
+        print("  GPU requested but not used (" + config['fallback_reason'] + ") - falling back to the CPU")
+    print("  Available devices: " + ', '.join(config['available_devices']))
+    device = config['device']
+    if device == 'GPU' and config['num_gpus']:
+        device = device + ' x' + str(config['num_gpus'])
+    print("  Device: " + device + ", threads: " + str(config['num_threads']))
+    options = config['simulator_options']
+    print("  Method: " + options['method'] +
+          ", max_parallel_experiments: " + str(options['max_parallel_experiments']) +
+          ", max_parallel_shots: " + str(options['max_parallel_shots']))
+    source = " (tuned for this host)" if config['tuned'] else ""
+    if config['run_options'].get('blocking_enable'):
+        print("  Blocking (chunking): " + str(config['run_options']['blocking_qubits']) + " qubits per chunk" + source)
+    else:
+        print("  Blocking (chunking): off" + source)
+    if 'statevector_parallel_threshold' in options:
+        print("  statevector_parallel_threshold: " + str(options['statevector_parallel_threshold']) + source)
@@ -3,9 +3,12 @@
 # Revision History:
 # November 14, 2023 - David Shimkus - Initial Version 
 # November 27, 2023 - David Shimkus - Commented out barriers.
+# October 19, 2026 - Stages marked for the per-stage diagrams in circuit_rendering.py.
 
 from qiskit import *
 
+from circuit_rendering import mark_stage
+
 def new_bit_flip_circuit():
     
     q = QuantumRegister(6,'q')
@@ -13,12 +16,14 @@ def new_bit_flip_circuit():
 
     circuit = QuantumCircuit(q,c)
 
+    mark_stage(circuit, 'bell')
     circuit.h(q[0]) # set into superposition
     circuit.cx(q[0],q[3]) # bell state
 
     #circuit.barrier(q)
 
     # encode the first logical qubit
+    mark_stage(circuit, 'encode')
 
     circuit.cx(q[0],q[1])
     circuit.cx(q[0],q[2])
@@ -37,6 +42,7 @@ def new_bit_flip_circuit():
     #circuit.barrier(q)
 
     #decode the first logical qubit
+    mark_stage(circuit, 'decode')
 
     circuit.cx(q[0],q[1])
     circuit.cx(q[0],q[2])
@@ -50,6 +56,7 @@ def new_bit_flip_circuit():
 
     #circuit.barrier(q)
 
+    mark_stage(circuit, 'measure')
     circuit.measure(q[0],c[0])
     circuit.measure(q[3],c[1])
 
@@ -61,12 +68,14 @@ def new_phase_flip_circuit():
 
     circuit = QuantumCircuit(q,c)
 
+    mark_stage(circuit, 'bell')
     circuit.h(q[0]) # set into superposition
     circuit.cx(q[0],q[3]) # bell state
 
     #circuit.barrier(q)
 
     # encode the first logical qubit
+    mark_stage(circuit, 'encode')
 
     circuit.cx(q[0],q[1])
     circuit.cx(q[0],q[2])
@@ -93,6 +102,7 @@ def new_phase_flip_circuit():
     #circuit.barrier(q)
 
     #decode the first logical qubit
+    mark_stage(circuit, 'decode')
 
     circuit.h(q[0])
     circuit.h(q[1])
@@ -114,6 +124,7 @@ def new_phase_flip_circuit():
 
     #circuit.barrier(q)
 
+    mark_stage(circuit, 'measure')
     circuit.measure(q[0],c[0])
     circuit.measure(q[3],c[1])
 
@@ -0,0 +1,138 @@
+# File: bell_state_with_shor.py
+# Demonstrates the 9 qubit error correction code with two entangled logical qubits forming a Bell State.
+# The gate logic is the same as shor_correction.py, wrapped in a definition to be called by main.py.
+# NOTE: this error correction code requires 9 physical qubits to form one logical qubit!
+#
+# Revision History
+# October 19, 2026 - Initial Version.  Ported from shor_correction.py, with optional syndrome recording.
+# October 19, 2026 - Stages marked for the per-stage diagrams in circuit_rendering.py.
+
+from qiskit import *
+
+from circuit_rendering import mark_stage
+
+# Shor decoding is done "in place" - there are no separate ancillas.  After the decoding CNOTs the two helper
+# qubits of every block of three hold that block's bit flip syndrome, and after the second round the helper
+# blocks hold the phase flip syndrome.  The Toffolis only target the data qubit, so these can be measured at the end.
+# Per logical qubit (8 bits): block 1, block 2, block 3 bit flip syndromes (2 bits each), then the phase flip syndrome.
+SHOR_SYNDROME_QUBITS = [
+    [1, 2, 4, 5, 7, 8, 3, 6],
+    [10, 11, 13, 14, 16, 17, 12, 15],
+]
+
+def new_shor_circuit(record_syndromes=False):
+    # heavily modified from https://quantumcomputinguk.org/tutorials/quantum-error-correction-shor-code-in-qiskit
+
+    q = QuantumRegister(18,'q')
+    c = ClassicalRegister(2,'c')
+
+    circuit = QuantumCircuit(q,c)
+
+    if record_syndromes:
+        s = ClassicalRegister(16,'s')
+        circuit.add_register(s)
+
+    mark_stage(circuit, 'bell')
+    circuit.h(q[0]) # set into superposition
+    circuit.cx(q[0],q[9]) # bell state
+
+    #circuit.barrier(q)
+
+    # encode the first logical qubit
+    mark_stage(circuit, 'encode')
+
+    circuit.cx(q[0],q[3])
+    circuit.cx(q[0],q[6])
+
+    circuit.h(q[0])
+    circuit.h(q[3])
+    circuit.h(q[6])
+
+    circuit.cx(q[0],q[1])
+    circuit.cx(q[3],q[4])
+    circuit.cx(q[6],q[7])
+
+    circuit.cx(q[0],q[2])
+    circuit.cx(q[3],q[5])
+    circuit.cx(q[6],q[8])
+
+    #circuit.barrier(q)
+
+    # encode the second logical qubit
+
+    circuit.cx(q[9],q[12]) #q9 is the second data qubit
+    circuit.cx(q[9],q[15])
+
+    circuit.h(q[9])
+    circuit.h(q[12])
+    circuit.h(q[15])
+
+    circuit.cx(q[9],q[10])
+    circuit.cx(q[12],q[13])
+    circuit.cx(q[15],q[16])
+
+    circuit.cx(q[9],q[11])
+    circuit.cx(q[12],q[14])
+    circuit.cx(q[15],q[17])
+
+    #TODO: noisy channel could/can go here...
+
+    #circuit.barrier(q)
+
+    #decode the first logical qubit
+    mark_stage(circuit, 'decode')
+
+    circuit.cx(q[0],q[1])
+    circuit.cx(q[3],q[4])
+    circuit.cx(q[6],q[7])
+
+    circuit.cx(q[0],q[2])
+    circuit.cx(q[3],q[5])
+    circuit.cx(q[6],q[8])
+
+    circuit.ccx(q[1],q[2],q[0])
+    circuit.ccx(q[4],q[5],q[3])
+    circuit.ccx(q[8],q[7],q[6])
+
+    circuit.h(q[0])
+    circuit.h(q[3])
+    circuit.h(q[6])
+
+    circuit.cx(q[0],q[3])
+    circuit.cx(q[0],q[6])
+    circuit.ccx(q[6],q[3],q[0])
+
+    #decode the second logical qubit
+
+    circuit.cx(q[9],q[10])
+    circuit.cx(q[12],q[13])
+    circuit.cx(q[15],q[16])
+
+    circuit.cx(q[9],q[11])
+    circuit.cx(q[12],q[14])
+    circuit.cx(q[15],q[17])
+
+    circuit.ccx(q[10],q[11],q[9])
+    circuit.ccx(q[13],q[14],q[12])
+    circuit.ccx(q[17],q[16],q[15])
+
+    circuit.h(q[9])
+    circuit.h(q[12])
+    circuit.h(q[15])
+
+    circuit.cx(q[9],q[12])
+    circuit.cx(q[9],q[15])
+    circuit.ccx(q[15],q[12],q[9])
+
+    #circuit.barrier(q)
+
+    mark_stage(circuit, 'measure')
+    circuit.measure(q[0],c[0])
+    circuit.measure(q[9],c[1])
+
+    if record_syndromes:
+        for logical_qubit, syndrome_qubits in enumerate(SHOR_SYNDROME_QUBITS):
+            for i, qubit_index in enumerate(syndrome_qubits):
+                circuit.measure(q[qubit_index], s[8*logical_qubit + i])
+
+    return circuit
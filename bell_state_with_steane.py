@@ -15,29 +15,38 @@
 # November 8, 2023 - David Shimkus - More work on the decoding syndrome.  
 # November 10, 2023 - David Shimkus - It is finally working.  
 # November 26, 2023 - David Shimkus - cleaned code and created definitions to be called by main.py
+# October 19, 2026 - Optional recording of the syndrome bits of every correction round.
+# October 19, 2026 - Only import what the circuit needs (no Aer or noise modules) for faster startup.
+# October 19, 2026 - Stages marked for the per-stage diagrams in circuit_rendering.py.
+# October 19, 2026 - transversal=False builds the physical Bell state version of steane_correction.py.
 
 import time
 start_time = time.time()
 
-import numpy as np
-
 from datetime import datetime
 import random 
 random.seed(datetime.now().timestamp()) #alternatively random.seed(1234), etc. for constant
 
-import qiskit
-from qiskit import *
 from qiskit import QuantumRegister
 from qiskit import ClassicalRegister
 from qiskit import QuantumCircuit
-from qiskit.circuit.library import *
-from qiskit_aer import AerSimulator
-import qiskit_aer.noise as noise
-from qiskit_aer.noise import pauli_error
 from qiskit.circuit.library.standard_gates import C3XGate
+
+from circuit_rendering import mark_stage
 #from qiskit.circuit.library.standard_gates import C3ZGate #this did not work, but for future reference: Z=HXH
 
-def new_steane_circuit():
+# the ancillas q14, q15 and q16 hold "bit2", "bit1" and "bit0" of the syndrome after each correction round
+# they are stored so that every round of s reads as the binary position of the corrected qubit
+# (the measurement happens after the correction and right before the ancillas are washed, so nothing else changes)
+def measure_syndrome(circuit, q, s, syndrome_round):
+        circuit.measure(q[16], s[3*syndrome_round])
+        circuit.measure(q[15], s[3*syndrome_round + 1])
+        circuit.measure(q[14], s[3*syndrome_round + 2])
+
+# record_syndromes adds the classical register 's' with the syndrome of every correction round:
+# round 0/1 = bit/phase flip for logical qubit 1, round 2/3 = bit/phase flip for logical qubit 2
+# transversal=False entangles the physical data qubits before encoding instead (as in steane_correction.py)
+def new_steane_circuit(record_syndromes=False, transversal=True):
         # encode the first logical qubit
         #q = QuantumRegister(18,'q') #shor code demo
         q = QuantumRegister(17,'q') #steane code demo #7 physical qubits per logical qubit, with 3 "ancilla" qubits that get rewashed
@@ -45,9 +54,19 @@ def new_steane_circuit():
 
         circuit = QuantumCircuit(q,c)
 
+        if record_syndromes:
+                s = ClassicalRegister(12,'s') #3 syndrome bits for each of the 4 correction rounds
+                circuit.add_register(s)
+
+        if not transversal:
+                mark_stage(circuit, 'bell')
+                circuit.h(q[0]) #set into superposition
+                circuit.cx(q[0],q[7]) #bell state
+
         #circuit.barrier(q)
 
         # encode the first logical qubit
+        mark_stage(circuit, 'encode')
 
         circuit.h(q[4]) #2 #these numberings align with https://cs269q.stanford.edu/projects2019/stabilizer_code_report_Y.pdf
         circuit.h(q[5]) #1
@@ -94,21 +113,22 @@ def new_steane_circuit():
 
         #the "logical"/transversal operations below 
         #this is a "logical" way of implementing the quantum bell state
-
-        circuit.h(q[0])
-        circuit.h(q[1])
-        circuit.h(q[2])
-        circuit.h(q[3])
-        circuit.h(q[4])
-        circuit.h(q[5])
-        circuit.h(q[6])
-        circuit.cx(q[0],q[7])
-        circuit.cx(q[1],q[8])
-        circuit.cx(q[2],q[9])
-        circuit.cx(q[3],q[10]) 
-        circuit.cx(q[4],q[11])
-        circuit.cx(q[5],q[12])
-        circuit.cx(q[6],q[13])
+        if transversal:
+                mark_stage(circuit, 'logical_bell')
+                circuit.h(q[0])
+                circuit.h(q[1])
+                circuit.h(q[2])
+                circuit.h(q[3])
+                circuit.h(q[4])
+                circuit.h(q[5])
+                circuit.h(q[6])
+                circuit.cx(q[0],q[7])
+                circuit.cx(q[1],q[8])
+                circuit.cx(q[2],q[9])
+                circuit.cx(q[3],q[10]) 
+                circuit.cx(q[4],q[11])
+                circuit.cx(q[5],q[12])
+                circuit.cx(q[6],q[13])
 
         #identity "noise"/errors below:
         #print("Attempting to inject errors")
@@ -132,6 +152,7 @@ def new_steane_circuit():
         #apply the syndrome onto "gimel" 
 
         #bit flip detection for logical qubit 1
+        mark_stage(circuit, 'bit_flip_syndrome_1')
 
         circuit.cx(q[0],q[14])
         circuit.cx(q[2],q[14])
@@ -166,6 +187,9 @@ def new_steane_circuit():
 
         #circuit.barrier(q)
 
+        if record_syndromes:
+                measure_syndrome(circuit, q, s, 0)
+
         #clean/wash the qubits for reuse
 
         circuit.reset(q[14]) 
@@ -175,6 +199,7 @@ def new_steane_circuit():
         #circuit.barrier(q)
 
         #phase flip detection for logical qubit 1
+        mark_stage(circuit, 'phase_flip_syndrome_1')
 
         circuit.h(q[14])
         circuit.h(q[15])
@@ -215,6 +240,9 @@ def new_steane_circuit():
 
         #circuit.barrier(q)
 
+        if record_syndromes:
+                measure_syndrome(circuit, q, s, 1)
+
         circuit.reset(q[14]) 
         circuit.reset(q[15])
         circuit.reset(q[16])
@@ -224,6 +252,7 @@ def new_steane_circuit():
         #apply the syndrome onto "gimel" 
 
         #bit flip detection for logical qubit 2
+        mark_stage(circuit, 'bit_flip_syndrome_2')
 
         circuit.cx(q[7],q[14])
         circuit.cx(q[9],q[14])
@@ -258,6 +287,9 @@ def new_steane_circuit():
 
         #circuit.barrier(q)
 
+        if record_syndromes:
+                measure_syndrome(circuit, q, s, 2)
+
         #clean the qubits for reuse
 
         circuit.reset(q[14]) 
@@ -267,6 +299,7 @@ def new_steane_circuit():
         #circuit.barrier(q)
 
         #phase flip detection for logical qubit 2
+        mark_stage(circuit, 'phase_flip_syndrome_2')
 
         circuit.h(q[14])
         circuit.h(q[15])
@@ -305,11 +338,15 @@ def new_steane_circuit():
         circuit.append(C3XGate(), [16, 15, 14, 13])
         #circuit.h(q[13])
 
+        if record_syndromes:
+                measure_syndrome(circuit, q, s, 3)
+
         #circuit.barrier(q)
 
         #################################################################################
 
         #decode the data back from logical qubit 1
+        mark_stage(circuit, 'decode')
         #idea: just "simply" the reverse operations of the encoding step... 
         
         circuit.cx(q[4],q[1]) #2, 4
@@ -354,6 +391,7 @@ def new_steane_circuit():
         circuit.h(q[13])
 
         #read the actual data
+        mark_stage(circuit, 'measure')
 
         #circuit.barrier(q)
 
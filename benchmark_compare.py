@@ -0,0 +1,150 @@
+# File: benchmark_compare.py
+# Tells whether a change made anything slower: compares a benchmark_suite.py run with the stored baseline of the
+# same host fingerprint (host, processor, Python, Qiskit and Aer versions - timings from another machine or another
+# Aer build say nothing), phase by phase.  Each phase's ratio new/baseline of the median is bootstrapped over the
+# repeats, so a change is only called a regression (or speedup) when the confidence interval is beyond the threshold.
+#
+# Usage:
+#   python benchmark_suite.py --output benchmark.json
+#   python benchmark_compare.py save benchmark.json              # store as the baseline of this host
+#   python benchmark_compare.py compare benchmark.json [--threshold 0.1] [--confidence 0.95]
+#       exit code 0: no regression, 1: a phase regressed beyond the threshold, 2: no baseline to compare with
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import statistics
+import sys
+
+BASELINE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baselines')
+
+FINGERPRINT_FIELDS = ('host', 'processor', 'python', 'qiskit', 'qiskit_aer')
+
+# ratios within 1 +- threshold are treated as noise
+DEFAULT_THRESHOLD = 0.10
+
+def load_benchmark(filename):
+    with open(filename) as f:
+        return json.load(f)
+
+def get_host_fingerprint(environment):
+    fingerprint = hashlib.sha256('|'.join(str(environment.get(field)) for field in FINGERPRINT_FIELDS).encode())
+    return fingerprint.hexdigest()[:12]
+
+def get_baseline_filename(environment, directory=BASELINE_DIRECTORY):
+    return os.path.join(directory, 'baseline_' + (environment.get('host') or 'localhost') + '_' +
+                        get_host_fingerprint(environment) + '.json')
+
+def save_baseline(benchmark, directory=BASELINE_DIRECTORY):
+    filename = get_baseline_filename(benchmark['environment'], directory)
+    os.makedirs(directory, exist_ok=True)
+    with open(filename, 'w') as f:
+        json.dump(benchmark, f, indent=2)
+    return filename
+
+def load_baseline(environment, directory=BASELINE_DIRECTORY):
+    filename = get_baseline_filename(environment, directory)
+    if not os.path.exists(filename):
+        return None
+    return load_benchmark(filename)
+
+def get_entry_key(entry):
+    return (entry['case'], entry['extra_qubits'], entry['shots'])
+
+def bootstrap_ratio(baseline_samples, new_samples, confidence=0.95, resamples=10000, seed=1234):
+    # (ratio of the medians, lower bound, upper bound) of new / baseline
+    generator = random.Random(seed)
+    ratios = []
+    for resample in range(resamples):
+        baseline_median = statistics.median(generator.choices(baseline_samples, k=len(baseline_samples)))
+        new_median = statistics.median(generator.choices(new_samples, k=len(new_samples)))
+        ratios.append(new_median / max(baseline_median, 1e-12))
+    ratios.sort()
+    tail = (1 - confidence) / 2
+    lower = ratios[int(tail * (resamples - 1))]
+    upper = ratios[int(round((1 - tail) * (resamples - 1)))]
+    return statistics.median(new_samples) / max(statistics.median(baseline_samples), 1e-12), lower, upper
+
+def get_verdict(lower, upper, threshold):
+    if lower > 1 + threshold:
+        return 'regression'
+    if upper < 1 - threshold:
+        return 'speedup'
+    return 'unchanged'
+
+def compare_benchmarks(baseline, benchmark, threshold=DEFAULT_THRESHOLD, confidence=0.95, resamples=10000):
+    # one row per (case, width, shots, phase) present in both runs
+    baseline_entries = {get_entry_key(entry): entry for entry in baseline['results']}
+    rows = []
+    for entry in benchmark['results']:
+        baseline_entry = baseline_entries.get(get_entry_key(entry))
+        if baseline_entry is None:
+            continue
+        for phase, samples in entry['samples'].items():
+            baseline_samples = baseline_entry['samples'].get(phase)
+            if not baseline_samples or not samples:
+                continue
+            ratio, lower, upper = bootstrap_ratio(baseline_samples, samples, confidence, resamples)
+            rows.append({
+                'case': entry['case'],
+                'num_qubits': entry['num_qubits'],
+                'shots': entry['shots'],
+                'phase': phase,
+                'baseline_median': statistics.median(baseline_samples),
+                'median': statistics.median(samples),
+                'ratio': ratio,
+                'lower': lower,
+                'upper': upper,
+                'verdict': get_verdict(lower, upper, threshold),
+            })
+    return rows
+
+def print_comparison(rows, confidence=0.95):
+    print("%-20s %6s %7s %-10s %12s %12s %8s %19s  %s" % (
+        'case', 'qubits', 'shots', 'phase', 'baseline s', 'new s', 'ratio', format(confidence, '.0%') + ' interval', 'verdict'))
+    for row in rows:
+        print("%-20s %6d %7d %-10s %12.5f %12.5f %8.3f  [%7.3f, %7.3f]  %s" % (
+            row['case'], row['num_qubits'], row['shots'], row['phase'], row['baseline_median'], row['median'],
+            row['ratio'], row['lower'], row['upper'], row['verdict']))
+    regressions = [row for row in rows if row['verdict'] == 'regression']
+    speedups = [row for row in rows if row['verdict'] == 'speedup']
+    print("")
+    print(str(len(regressions)) + " regressions, " + str(len(speedups)) + " speedups, " +
+          str(len(rows) - len(regressions) - len(speedups)) + " unchanged")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare a benchmark_suite.py run with the baseline of this host.')
+    parser.add_argument('action', choices=('save', 'compare'))
+    parser.add_argument('benchmark', help='JSON written by benchmark_suite.py')
+    parser.add_argument('--baseline', help='compare with this file instead of the stored baseline of the host')
+    parser.add_argument('--directory', default=BASELINE_DIRECTORY, help='where the baselines are stored')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='relative change that counts, e.g. 0.1 for 10%%')
+    parser.add_argument('--confidence', type=float, default=0.95)
+    parser.add_argument('--resamples', type=int, default=10000)
+    parser.add_argument('--output', help='also write the comparison as JSON to this file')
+    args = parser.parse_args()
+
+    benchmark = load_benchmark(args.benchmark)
+    if args.action == 'save':
+        print("Baseline written to " + save_baseline(benchmark, args.directory))
+        sys.exit(0)
+
+    baseline = load_benchmark(args.baseline) if args.baseline else load_baseline(benchmark['environment'], args.directory)
+    if baseline is None:
+        print("No baseline for this host fingerprint (" + get_baseline_filename(benchmark['environment'], args.directory) +
+              ") - store one with: python benchmark_compare.py save " + args.benchmark)
+        sys.exit(2)
+    if get_host_fingerprint(baseline['environment']) != get_host_fingerprint(benchmark['environment']):
+        print("Warning: the baseline was measured on a different host or software version")
+
+    rows = compare_benchmarks(baseline, benchmark, args.threshold, args.confidence, args.resamples)
+    print_comparison(rows, args.confidence)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(rows, f, indent=2)
+    sys.exit(1 if any(row['verdict'] == 'regression' for row in rows) else 0)
@@ -0,0 +1,168 @@
+# File: benchmark_suite.py
+# Performance benchmark for every code: times circuit construction, transpile, the simulator run and tallying the
+# results separately, at several shot counts and widths, and writes everything as JSON so a regression in any one
+# phase is visible.
+# Widths are changed by padding the circuit with idle qubits - Aer's truncation is turned off so they are simulated.
+# The defaults (builder width, 100 and 1000 shots) finish in minutes.  Wider or longer points are opt-in: noisy
+# circuits with mid-circuit measurements are simulated shot by shot, so 8 extra qubits x 10000 shots of the 18 qubit
+# Shor circuit alone takes hours.
+#
+# Usage:
+#   python benchmark_suite.py --cases steane shor --shots 100 1000 10000 --extra-qubits 0 4 8 --output benchmark.json
+#   python benchmark_compare.py compare benchmark.json      # against the stored baseline of this host
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - Runs can be compared with a per-host baseline by benchmark_compare.py.
+# October 19, 2026 - 'steane' is the builder default main.py runs, the old circuit is 'steane_non_transversal'.
+# October 19, 2026 - Smaller default grid, the padded widths and 10000 shots are opt-in.
+
+import argparse
+import importlib
+import json
+import platform
+import statistics
+import time
+
+# case name -> (module, builder, builder arguments)
+BENCHMARK_CASES = {
+    'simple': ('simple_bell_state', 'new_simple_bell_circuit', {}),
+    'bit_flip': ('bell_state_with_bit_phase', 'new_bit_flip_circuit', {}),
+    'phase_flip': ('bell_state_with_bit_phase', 'new_phase_flip_circuit', {}),
+    'shor': ('bell_state_with_shor', 'new_shor_circuit', {}),
+    'steane': ('bell_state_with_steane', 'new_steane_circuit', {}), # the transversal CNOT main.py runs
+    'steane_non_transversal': ('bell_state_with_steane', 'new_steane_circuit', {'transversal': False}),
+}
+
+PHASES = ('build', 'transpile', 'simulate', 'tally')
+
+def build_case(case, extra_qubits=0):
+    from qiskit import QuantumRegister
+
+    module_name, builder_name, arguments = BENCHMARK_CASES[case]
+    circuit = getattr(importlib.import_module(module_name), builder_name)(**arguments)
+    if extra_qubits > 0:
+        circuit.add_register(QuantumRegister(extra_qubits, 'pad'))
+    return circuit
+
+def get_noise_model(physical_error_rate):
+    if physical_error_rate <= 0:
+        return None
+    from new_noise_refused import get_model_for_probability
+    return get_model_for_probability(physical_error_rate, 'depolarizing')
+
+def time_case(case, shots, extra_qubits=0, noise_model=None, backend='auto', repeats=3, seed=1234):
+    # returns {phase: [seconds of every repeat]} plus the circuit size
+    from qiskit import transpile
+    from backend_registry import get_simulator_config, new_simulator
+    from logical_error_statistics import get_logical_error_count
+
+    samples = {phase: [] for phase in PHASES}
+    simulator = None
+
+    for repeat in range(repeats):
+        start = time.perf_counter()
+        circuit = build_case(case, extra_qubits)
+        samples['build'].append(time.perf_counter() - start)
+
+        if simulator is None: # configured once, outside of the timed phases
+            config = get_simulator_config(backend, num_qubits=circuit.num_qubits)
+            simulator = new_simulator(config, noise_model, enable_truncation=False)
+
+        start = time.perf_counter()
+        basis_gates = noise_model.basis_gates if noise_model is not None else None
+        transpiled_circuit = transpile(circuit, simulator, basis_gates=basis_gates)
+        samples['transpile'].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        result = simulator.run(transpiled_circuit, shots=shots, seed_simulator=seed + repeat,
+                               **config['run_options']).result()
+        samples['simulate'].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        counts = result.get_counts()
+        num_errors = get_logical_error_count(counts)
+        samples['tally'].append(time.perf_counter() - start)
+
+    return {
+        'case': case,
+        'shots': shots,
+        'extra_qubits': extra_qubits,
+        'num_qubits': circuit.num_qubits,
+        'depth': transpiled_circuit.depth(),
+        'size': transpiled_circuit.size(),
+        'device': config['device'],
+        'logical_error_rate': num_errors / shots,
+        'samples': samples,
+        'median': {phase: statistics.median(values) for phase, values in samples.items()},
+        'min': {phase: min(values) for phase, values in samples.items()},
+    }
+
+def get_environment():
+    import qiskit
+    import qiskit_aer
+
+    return {
+        'host': platform.node(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'python': platform.python_version(),
+        'qiskit': qiskit.__version__,
+        'qiskit_aer': qiskit_aer.__version__,
+    }
+
+def run_benchmark_suite(cases=None, shot_counts=(100, 1000), extra_qubits=(0,), physical_error_rate=0.001,
+                        backend='auto', repeats=3, seed=1234, verbose=True):
+    if cases is None:
+        cases = list(BENCHMARK_CASES)
+    noise_model = get_noise_model(physical_error_rate)
+
+    results = []
+    for case in cases:
+        for extra in extra_qubits:
+            for shots in shot_counts:
+                entry = time_case(case, shots, extra, noise_model, backend, repeats, seed)
+                results.append(entry)
+                if verbose:
+                    print_benchmark_entry(entry)
+
+    return {
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'environment': get_environment(),
+        'parameters': {
+            'shot_counts': list(shot_counts),
+            'extra_qubits': list(extra_qubits),
+            'physical_error_rate': physical_error_rate,
+            'backend': backend,
+            'repeats': repeats,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+def print_benchmark_entry(entry):
+    median = entry['median']
+    print("%-20s %3d qubits %7d shots  build %8.4f  transpile %8.4f  simulate %9.4f  tally %8.5f  (median s)" % (
+        entry['case'], entry['num_qubits'], entry['shots'],
+        median['build'], median['transpile'], median['simulate'], median['tally']))
+
+def write_benchmark(benchmark, filename):
+    with open(filename, 'w') as f:
+        json.dump(benchmark, f, indent=2)
+    print("Benchmark written to " + filename)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build / transpile / simulate / tally benchmark for every code.')
+    parser.add_argument('--cases', nargs='+', default=list(BENCHMARK_CASES), choices=list(BENCHMARK_CASES))
+    parser.add_argument('--shots', nargs='+', type=int, default=[100, 1000])
+    parser.add_argument('--extra-qubits', nargs='+', type=int, default=[0], help='idle qubits added to change the width, e.g. 0 4 8')
+    parser.add_argument('--physical-error-rate', type=float, default=0.001, help='depolarizing noise, 0 for an ideal run')
+    parser.add_argument('--backend', default='auto', help='local backend profile, see backend_registry.py')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--output', default='benchmark.json')
+    args = parser.parse_args()
+
+    benchmark = run_benchmark_suite(args.cases, args.shots, args.extra_qubits, args.physical_error_rate,
+                                    args.backend, args.repeats, args.seed)
+    write_benchmark(benchmark, args.output)
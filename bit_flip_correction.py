@@ -7,6 +7,12 @@
 # September 23, 2023 - David Shimkus - More parameters and clarity given.  
 # September 27, 2023 - David Shimkus - Tightened code.
 # October 10, 2023 - David Shimkus - Changed to 3 Qubit bit flip code.  
+# October 19, 2026 - Simulator device, threading and blocking picked by backend_registry.py (falls back to the CPU).
+# October 19, 2026 - Blocking qubits tuned per host instead of hard-coded.
+# October 19, 2026 - Circuit drawing is opt-in (draw_circuit) and runs in the background.
+# October 19, 2026 - Per-phase timing spans (instrumentation.py) instead of the single "Time elapsed" print.
+# October 19, 2026 - Optional memory tracking per phase (track_memory).
+# October 19, 2026 - Throttled progress line (realizations/s, shots/s, ETA, logical error rate) and snapshot file.
 
 import time
 start_time = time.time()
@@ -23,9 +29,16 @@ from qiskit import ClassicalRegister
 from qiskit import QuantumCircuit
 from qiskit.circuit.library import *
 from qiskit_aer import AerSimulator
+from backend_registry import get_simulator_config, new_simulator, print_simulator_config
+from circuit_rendering import render_in_background, wait_for_renders
+from instrumentation import add_span, enable_memory_tracking, end_span, print_phase_summary, span, start_span, write_chrome_trace
+from logical_error_statistics import get_logical_error_count
+from progress import ProgressReporter
 import qiskit_aer.noise as noise
 from qiskit_aer.noise import pauli_error
 
+add_span('imports', start_time, time.time() - start_time)
+
 #### circuit "hyper" parameters ######################################
 
 loops = 1000
@@ -35,7 +48,12 @@ num_loops = loops # Dr. Gamage requested this - it also works better with the "f
 #depth  = 10
 #number_qubits = 28 #max that can be done on two T600's it seems 
 #number_qubits = 24
-number_blocking_qubits = 22 #GPU specific parameter
+number_blocking_qubits = None #None: measured for this host by blocking_autotuner.py (22 was the hard-coded GPU value)
+draw_circuit = False #draw the circuit in the background when it is done (see circuit_rendering.py) - drawing can take longer than the simulation
+trace_filename = None #e.g. 'bit_flip_trace.json' - Chrome trace of every timed phase (see instrumentation.py)
+track_memory = False #record RSS and Python allocations per phase and warn about phases that keep growing (see instrumentation.py)
+progress_interval = 5 #seconds between progress lines during the loop
+progress_filename = None #e.g. 'bit_flip_progress.json' - JSON snapshot of the progress, rewritten every 30 seconds (see progress.py)
 
 ######################################################################
 
@@ -98,9 +116,17 @@ num_01 = 0
 num_10 = 0
 num_11 = 0
 
+if track_memory:
+        enable_memory_tracking()
+
 ##### "Ideal" (no errors) starts here ########
+start_span('ideal')
 
-my_simulator = AerSimulator(method='statevector',device='GPU',noise_model=noise_model)
+#GPU if qiskit-aer was built with it, otherwise the CPU
+simulator_config = get_simulator_config('auto', num_qubits=6, blocking_qubits=number_blocking_qubits)
+print_simulator_config(simulator_config)
+print("")
+my_simulator = new_simulator(simulator_config, noise_model)
 #my_simulator = AerSimulator(method='statevector')
 
 #demonstrate the noise model
@@ -126,7 +152,7 @@ circuit.measure(q[1],c[1])
 
 #multi GPU
 result = execute(circuit, my_simulator, shots=ideal_shots, 
-                blocking_enable=True, blocking_qubits=number_blocking_qubits,
+                **simulator_config['run_options'],
                 basis_gates=basis_gates
         ).result() 
 
@@ -137,16 +163,19 @@ print("Counts using the built in Qiskit 'shots'")
 #print("--------------------------------------")
 print(counts)
 #print("--------------------------------------")
-finish_time = time.time() - start_time
-print('Time elapsed: ' + str(finish_time) + ' seconds')
+end_span() #ideal
+
+progress = ProgressReporter('bit_flip', total_realizations=num_loops, interval=progress_interval,
+                snapshot_filename=progress_filename)
 
-start_time = time.time() #reset timer
 for i in range(num_loops):
+        start_span('iteration')
+        start_span('build')
 
         ##### Shor code starts here ########
         # heavily modified from https://quantumcomputinguk.org/tutorials/quantum-error-correction-shor-code-in-qiskit
 
-        my_simulator = AerSimulator(method='statevector',device='GPU',noise_model=noise_model)
+        my_simulator = new_simulator(simulator_config, noise_model)
 
         # encode the first logical qubit
         q = QuantumRegister(6,'q')
@@ -219,14 +248,19 @@ for i in range(num_loops):
         circuit.measure(q[0],c[0])
         circuit.measure(q[3],c[1])
 
+        end_span() #build
+
         #multi GPU
         backend = AerSimulator(noise_model=noise_model, #coupling_map=coupling_map,
                         basis_gates=basis_gates)
-        transpiled_circuit = transpile(circuit, backend)
+        with span('transpile'):
+                transpiled_circuit = transpile(circuit, backend)
 
-        result = execute(transpiled_circuit, my_simulator, shots=error_shots,
-                blocking_enable=True, blocking_qubits=number_blocking_qubits).result()
+        with span('execute'):
+                result = execute(transpiled_circuit, my_simulator, shots=error_shots,
+                        **simulator_config['run_options']).result()
 
+        start_span('parse')
         counts = result.get_counts()
 
         #print('\n')
@@ -246,8 +280,14 @@ for i in range(num_loops):
                 num_10 = num_10 + 1
         if key == '11':
                 num_11 = num_11 + 1
+        end_span() #parse
+        end_span() #iteration
+        progress.update(shots=error_shots, errors=get_logical_error_count(counts))
+
+progress.finish()
 
-circuit.draw(output='mpl', filename='bit_flip_correction.png')
+if draw_circuit:
+        render_in_background(circuit, 'bit_flip_correction')
 
 #print('\n')
 #print('Shots: ' + str(shots))
@@ -263,5 +303,9 @@ print('Number of 01 results: ' + str(num_01))
 print('Number of 10 results: ' + str(num_10))
 print('Number of 11 results: ' + str(num_11))
 
-finish_time = time.time() - start_time
-print('Time elapsed: ' + str(finish_time) + ' seconds')
+wait_for_renders() #let a background drawing finish before the timings are printed
+
+print("")
+print_phase_summary()
+if trace_filename is not None:
+        write_chrome_trace(trace_filename)
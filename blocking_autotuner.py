@@ -0,0 +1,244 @@
+# File: blocking_autotuner.py
+# Replaces the hard-coded number_blocking_qubits = 22 (which does nothing for the 6 to 18 qubit circuits here) with
+# settings measured on the current host.  A short Quantum Volume calibration circuit of the same width is timed with
+# blocking off and with chunk sizes around what fits in the CPU cache / GPU memory, and with the statevector update
+# parallelized or not (statevector_parallel_threshold).  The fastest settings are cached per host in
+# ~/.cache/entangled_logical_qubits/ so the calibration only runs once for each device and width.
+# If scaling_benchmark.py already measured the blocking sizes for a width on this host, its reference profile is used
+# instead of calibrating again.
+#
+# Usage:
+#   settings = get_tuned_settings('GPU', 17)     # {'blocking_qubits': None or int, 'statevector_parallel_threshold': int, ...}
+#   python blocking_autotuner.py 17 [--device GPU] [--force]
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - No calibration for widths that do not fit in memory.
+# October 19, 2026 - Best blocking sizes from the scaling benchmark's reference profile used before calibrating.
+# October 19, 2026 - Thread count, GPU memory, amplitude size and parallel threshold taken from backend_registry.py
+#                    and method_selection.py instead of keeping copies here.
+# October 19, 2026 - Reference profile check shared with resource_estimator.py.
+
+import argparse
+import json
+import math
+import os
+import platform
+import time
+
+from backend_registry import STATEVECTOR_PARALLEL_THRESHOLD, get_cpu_count, get_gpu_memory_bytes
+from method_selection import BYTES_PER_AMPLITUDE
+
+CACHE_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'entangled_logical_qubits')
+
+# chunks smaller than this never pay for the extra bookkeeping
+MIN_BLOCKING_QUBITS = 10
+
+# wider calibration circuits take too long (and too much memory) to be worth it
+MAX_CALIBRATION_QUBITS = 30
+
+def get_host_name():
+    return platform.node() or 'localhost'
+
+def get_cache_filename(host_name=None):
+    if host_name is None:
+        host_name = get_host_name()
+    return os.path.join(CACHE_DIRECTORY, 'autotune_' + host_name + '.json')
+
+def load_tuning_cache(filename=None):
+    if filename is None:
+        filename = get_cache_filename()
+    if not os.path.exists(filename):
+        return {}
+    with open(filename) as f:
+        return json.load(f)
+
+def save_tuning_cache(cache, filename=None):
+    if filename is None:
+        filename = get_cache_filename()
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    temporary_filename = filename + '.tmp'
+    with open(temporary_filename, 'w') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(temporary_filename, filename) # never leave a half written cache behind
+
+def get_cache_key(device, num_qubits):
+    # the host, Aer version and thread count are part of the key - a new build or a different allocation retunes
+    import qiskit_aer
+
+    return '|'.join([device, str(num_qubits), qiskit_aer.__version__, str(get_cpu_count())])
+
+def get_cpu_cache_bytes():
+    # the largest CPU cache (usually L3) from sysfs, None where that is not available
+    largest = None
+    base = '/sys/devices/system/cpu/cpu0/cache'
+    if not os.path.isdir(base):
+        return None
+    for index in os.listdir(base):
+        try:
+            with open(os.path.join(base, index, 'size')) as f:
+                size = f.read().strip()
+        except OSError:
+            continue
+        multiplier = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}.get(size[-1:], 1)
+        value = int(size.rstrip('KMG')) * multiplier
+        largest = value if largest is None else max(largest, value)
+    return largest
+
+def get_blocking_candidates(device, num_qubits):
+    # chunk sizes around the largest chunk that fits in the CPU cache or in (half of) one GPU's memory;
+    # a chunk as wide as the circuit is no blocking at all, so only narrower ones are tried
+    if device == 'GPU':
+        memory_bytes = get_gpu_memory_bytes()
+        center = int(math.log2(memory_bytes / BYTES_PER_AMPLITUDE)) - 1 if memory_bytes else 22
+    else:
+        cache_bytes = get_cpu_cache_bytes()
+        center = int(math.log2(cache_bytes / BYTES_PER_AMPLITUDE)) if cache_bytes else 18
+
+    candidates = set()
+    for blocking_qubits in (center - 2, center - 1, center, center + 1, num_qubits - 2, num_qubits - 1):
+        if MIN_BLOCKING_QUBITS <= blocking_qubits < num_qubits:
+            candidates.add(blocking_qubits)
+    return sorted(candidates)
+
+def new_calibration_circuit(num_qubits, depth=3, seed=1234):
+    from qiskit.circuit.library import QuantumVolume
+
+    circuit = QuantumVolume(num_qubits, depth, seed=seed).decompose()
+    circuit.measure_all()
+    return circuit
+
+def time_configuration(circuit, device, blocking_qubits, parallel_threshold, repeats=3, shots=16):
+    # best of a few runs, the first one also pays for the allocation
+    from qiskit import transpile
+    from qiskit_aer import AerSimulator
+
+    simulator = AerSimulator(method='statevector', device=device, statevector_parallel_threshold=parallel_threshold)
+    transpiled_circuit = transpile(circuit, simulator)
+    run_options = {'shots': shots, 'seed_simulator': 1}
+    if blocking_qubits is not None:
+        run_options['blocking_enable'] = True
+        run_options['blocking_qubits'] = blocking_qubits
+
+    best = None
+    for repeat in range(repeats):
+        start = time.perf_counter()
+        result = simulator.run(transpiled_circuit, **run_options).result()
+        seconds = time.perf_counter() - start
+        if not result.success:
+            return None # this chunk size does not work here (e.g. too large for the GPU)
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+def autotune(device, num_qubits, repeats=3, verbose=True):
+    circuit = new_calibration_circuit(num_qubits)
+    timings = {}
+
+    # parallelizing the update of a small statevector costs more than it saves - it is either on or off at this width
+    thresholds = {'serial': num_qubits, 'parallel': max(num_qubits - 1, 1)}
+    for label, threshold in thresholds.items():
+        timings['threshold ' + label] = time_configuration(circuit, device, None, threshold, repeats)
+    measured = [label for label in thresholds if timings['threshold ' + label] is not None]
+    best_threshold_label = min(measured, key=lambda label: timings['threshold ' + label]) if measured else 'parallel'
+    parallel_threshold = thresholds[best_threshold_label]
+
+    best_blocking = None
+    best_seconds = timings['threshold ' + best_threshold_label]
+    for blocking_qubits in get_blocking_candidates(device, num_qubits):
+        try:
+            seconds = time_configuration(circuit, device, blocking_qubits, parallel_threshold, repeats)
+        except Exception: # e.g. blocking not supported for this build
+            seconds = None
+        timings['blocking ' + str(blocking_qubits)] = seconds
+        if seconds is not None and (best_seconds is None or seconds < best_seconds):
+            best_blocking = blocking_qubits
+            best_seconds = seconds
+
+    settings = {
+        'device': device,
+        'num_qubits': num_qubits,
+        'blocking_qubits': best_blocking,
+        'statevector_parallel_threshold': parallel_threshold,
+        'seconds': best_seconds,
+        'timings': timings,
+        'host': get_host_name(),
+        'tuned': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    if verbose:
+        print_tuned_settings(settings)
+    return settings
+
+def get_default_settings(device, num_qubits):
+    return {
+        'device': device,
+        'num_qubits': num_qubits,
+        'blocking_qubits': None,
+        'statevector_parallel_threshold': STATEVECTOR_PARALLEL_THRESHOLD, # Aer's own default
+    }
+
+def get_reference_settings(device, num_qubits):
+    # settings from the scaling benchmark's reference profile, if it was measured on this host with this Aer version
+    from resource_estimator import REFERENCE_PROFILE_FILENAME, is_reference_profile_current
+
+    if not os.path.exists(REFERENCE_PROFILE_FILENAME):
+        return None
+    with open(REFERENCE_PROFILE_FILENAME) as f:
+        profile = json.load(f)
+    if not is_reference_profile_current(profile):
+        return None
+    best = profile.get('blocking', {}).get(device + '|' + str(num_qubits))
+    if best is None:
+        return None
+    settings = get_default_settings(device, num_qubits)
+    settings.update({'blocking_qubits': best['blocking_qubits'], 'seconds': best['seconds'],
+                     'host': profile['host'], 'tuned': profile.get('created'), 'source': 'reference profile'})
+    return settings
+
+def get_tuned_settings(device, num_qubits, tune=True, force=False):
+    # cached settings for this host, device and width; tunes (and caches) them if missing and tune is True
+    if num_qubits > MAX_CALIBRATION_QUBITS:
+        return get_default_settings(device, num_qubits)
+    if num_qubits <= MIN_BLOCKING_QUBITS:
+        # nothing to gain - too narrow for blocking and below Aer's own parallel threshold
+        return get_default_settings(device, num_qubits)
+
+    from resource_estimator import MEMORY_FRACTION, get_available_memory_bytes
+
+    available_bytes = get_available_memory_bytes()
+    if available_bytes is not None and BYTES_PER_AMPLITUDE * 2 ** num_qubits > available_bytes * MEMORY_FRACTION:
+        return get_default_settings(device, num_qubits) # the calibration circuit itself would not fit
+
+    cache = load_tuning_cache()
+    key = get_cache_key(device, num_qubits)
+    if key in cache and not force:
+        return cache[key]
+    settings = get_reference_settings(device, num_qubits)
+    if settings is not None and not force:
+        return settings
+    if not tune:
+        return get_default_settings(device, num_qubits)
+
+    print("Tuning blocking and parallel settings for " + str(num_qubits) + " qubits on the " + device +
+          " (only done once per host, cached in " + get_cache_filename() + ")")
+    settings = autotune(device, num_qubits, verbose=False)
+    cache = load_tuning_cache() # another process may have tuned something else meanwhile
+    cache[key] = settings
+    save_tuning_cache(cache)
+    return settings
+
+def print_tuned_settings(settings):
+    blocking = 'off' if settings['blocking_qubits'] is None else str(settings['blocking_qubits']) + ' qubits'
+    print("Tuned settings for " + str(settings['num_qubits']) + " qubits on the " + settings['device'] + ": blocking " +
+          blocking + ", statevector_parallel_threshold " + str(settings['statevector_parallel_threshold']))
+    for label, seconds in settings.get('timings', {}).items():
+        print("  %-20s %s" % (label, 'failed' if seconds is None else format(seconds, '.4f') + ' s'))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the best blocking and parallel settings for this host.")
+    parser.add_argument('num_qubits', type=int, nargs='+')
+    parser.add_argument('--device', default='CPU', choices=('CPU', 'GPU'))
+    parser.add_argument('--force', action='store_true', help="retune even if cached settings exist")
+    args = parser.parse_args()
+
+    for num_qubits in args.num_qubits:
+        print_tuned_settings(get_tuned_settings(args.device, num_qubits, force=args.force))
@@ -0,0 +1,131 @@
+# File: circuit_rendering.py
+# Opt-in circuit drawing that never holds up the experiment.
+# The matplotlib drawer often took longer than the simulation (and produced 1 MB PNGs), so drawing now runs in a
+# background thread and picks the output by size:
+#   small circuits           <name>.png (or .svg) as before
+#   large circuits           <name>_summary.txt - width, depth, gate counts per stage - instead of a huge image
+#   every circuit            one compact diagram per stage (encode, syndrome rounds, decode, ...) without idle wires,
+#                            <name>_<stage>.png for small stages, <name>_<stage>.txt otherwise
+#
+# The builders mark their stages with mark_stage(); circuits without stages are treated as one stage.
+#
+# Usage:
+#   render_in_background(circuit, 'steanecode')
+#   ... keep simulating ...
+#   wait_for_renders()
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - Drawing time recorded as a 'draw' span (instrumentation.py).
+# October 19, 2026 - matplotlib drawing serialized by a module lock (pyplot is not thread-safe).
+
+import threading
+
+from instrumentation import span
+
+# above this many operations the matplotlib drawer is slower than it is useful
+MAX_IMAGE_OPERATIONS = 300
+
+_render_threads = []
+
+# pyplot keeps global state, so overlapping renders (main.py draws the logical and the transpiled circuit, a spec
+# file draws every job) take turns on the matplotlib part
+_pyplot_lock = threading.Lock()
+
+def mark_stage(circuit, name):
+    # the stage starts with the next instruction appended to the circuit
+    if circuit.metadata is None:
+        circuit.metadata = {}
+    circuit.metadata.setdefault('stages', []).append([name, len(circuit.data)])
+
+def get_stages(circuit):
+    # [(name, first instruction, one past the last instruction)]
+    marks = (circuit.metadata or {}).get('stages') or [['circuit', 0]]
+    if marks[0][1] > 0:
+        marks = [['prepare', 0]] + marks
+    stages = []
+    for i, (name, start) in enumerate(marks):
+        end = marks[i + 1][1] if i + 1 < len(marks) else len(circuit.data)
+        if end > start:
+            stages.append((name, start, end))
+    return stages
+
+def get_stage_circuit(circuit, start, end):
+    stage_circuit = circuit.copy_empty_like()
+    for instruction in circuit.data[start:end]:
+        stage_circuit.append(instruction.operation, instruction.qubits, instruction.clbits)
+    return stage_circuit
+
+def get_circuit_summary(circuit):
+    lines = [
+        'Qubits: ' + str(circuit.num_qubits) + ', classical bits: ' + str(circuit.num_clbits),
+        'Depth: ' + str(circuit.depth()) + ', operations: ' + str(circuit.size()),
+        'Gate counts: ' + str(dict(circuit.count_ops())),
+        '',
+        'Stages:',
+    ]
+    for name, start, end in get_stages(circuit):
+        stage_circuit = get_stage_circuit(circuit, start, end)
+        lines.append('  %-28s depth %5d, %5d operations  %s' % (
+            name, stage_circuit.depth(), stage_circuit.size(), dict(stage_circuit.count_ops())))
+    return '\n'.join(lines) + '\n'
+
+def draw_image(circuit, filename, image_format='png'):
+    with _pyplot_lock:
+        import matplotlib
+        matplotlib.use('Agg') # no window, safe outside the main thread
+        import matplotlib.pyplot as plt
+
+        figure = circuit.draw(output='mpl', fold=-1, idle_wires=False)
+        figure.savefig(filename + '.' + image_format, format=image_format, bbox_inches='tight')
+        plt.close(figure)
+    return filename + '.' + image_format
+
+def draw_text(circuit, filename):
+    with open(filename + '.txt', 'w') as f:
+        f.write(str(circuit.draw(output='text', fold=-1, idle_wires=False)))
+        f.write('\n')
+    return filename + '.txt'
+
+def render_circuit(circuit, filename, image_format='png', stages=True, max_image_operations=MAX_IMAGE_OPERATIONS):
+    # returns the files written
+    written = []
+    if circuit.size() <= max_image_operations:
+        written.append(draw_image(circuit, filename, image_format))
+    else:
+        with open(filename + '_summary.txt', 'w') as f:
+            f.write(get_circuit_summary(circuit))
+        written.append(filename + '_summary.txt')
+
+    stage_list = get_stages(circuit)
+    if stages and len(stage_list) > 1:
+        for number, (name, start, end) in enumerate(stage_list):
+            stage_circuit = get_stage_circuit(circuit, start, end)
+            stage_filename = filename + '_' + str(number) + '_' + name
+            if stage_circuit.size() <= max_image_operations:
+                written.append(draw_image(stage_circuit, stage_filename, image_format))
+            else:
+                written.append(draw_text(stage_circuit, stage_filename))
+    return written
+
+def render_in_background(circuit, filename, **options):
+    # the circuit is copied so the caller can keep changing (or reusing) its own
+    circuit = circuit.copy()
+
+    def render():
+        try:
+            with span('draw', filename=filename):
+                written = render_circuit(circuit, filename, **options)
+            print("Circuit diagrams written: " + ', '.join(written))
+        except Exception as error: # a failed drawing should never take the experiment down with it
+            print("Could not draw " + filename + ": " + str(error))
+
+    thread = threading.Thread(target=render, name='render ' + filename)
+    thread.start()
+    _render_threads.append(thread)
+    return thread
+
+def wait_for_renders(timeout=None):
+    # call before the script exits so the files are complete
+    while _render_threads:
+        _render_threads.pop().join(timeout)
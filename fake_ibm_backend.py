@@ -0,0 +1,69 @@
+# File: fake_ibm_backend.py
+# Local stand-in for an IBM backend that behaves like a queue: jobs report QUEUED for a while before they are DONE.
+# Used to exercise async_jobs.py (and main.py's IBM path) without an account or a real queue.
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - No infinite recursion when _simulator is not set yet (copy, pickle).
+
+import random
+import time
+import uuid
+
+class FakeQueuedJob:
+
+    def __init__(self, backend, inner_job, queue_latency):
+        self._backend = backend
+        self._inner_job = inner_job
+        self._job_id = str(uuid.uuid4())
+        self._ready_at = time.time() + queue_latency
+
+    def job_id(self):
+        return self._job_id
+
+    def backend(self):
+        return self._backend
+
+    def status(self):
+        from qiskit.providers import JobStatus
+
+        if time.time() < self._ready_at:
+            return JobStatus.QUEUED
+        return self._inner_job.status()
+
+    def result(self, timeout=None):
+        # blocks like a real job would
+        remaining = self._ready_at - time.time()
+        if remaining > 0:
+            if timeout is not None and remaining > timeout:
+                raise TimeoutError('Job ' + self._job_id + ' is still queued')
+            time.sleep(remaining)
+        return self._inner_job.result()
+
+class FakeQueuedBackend:
+
+    def __init__(self, name='fake_ibm_brisbane', min_latency=1.0, max_latency=5.0, seed=None, simulator=None):
+        from qiskit_aer import AerSimulator
+
+        self.name = name
+        self.min_latency = min_latency
+        self.max_latency = max_latency
+        self._random = random.Random(seed)
+        self._simulator = simulator if simulator is not None else AerSimulator()
+        self._jobs = {}
+
+    def run(self, circuits, shots=1024, **run_options):
+        inner_job = self._simulator.run(circuits, shots=shots, **run_options)
+        job = FakeQueuedJob(self, inner_job, self._random.uniform(self.min_latency, self.max_latency))
+        self._jobs[job.job_id()] = job
+        return job
+
+    def retrieve_job(self, job_id):
+        return self._jobs[job_id]
+
+    # everything else (configuration, target, options, ...) comes from the simulator so transpile() works
+    # (_simulator itself is looked up here before __init__ ran, e.g. by copy and pickle - that must not recurse)
+    def __getattr__(self, attribute):
+        if attribute == '_simulator':
+            raise AttributeError(attribute)
+        return getattr(self._simulator, attribute)
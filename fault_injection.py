@@ -0,0 +1,110 @@
+# File: fault_injection.py
+# Helpers for placing Pauli faults at specific locations of an already built circuit.
+# A "location" is a (instruction index, qubit index) pair - the fault is applied right after that instruction on that qubit.
+# This mirrors how qiskit_aer applies a quantum error after the gate it is attached to in the noise model.
+#
+# For sweeps over thousands of near-identical fault circuits, prepare_transpiled_circuit() transpiles the base circuit
+# once (with a marker barrier after every fault location, so the locations can be found again after the gates were
+# translated) and inject_transpiled_faults() inserts the Paulis into a copy of it - no transpile per fault circuit.
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - Faults can be inserted into a circuit that was transpiled once.
+
+# instructions that never get a fault attached to them
+NON_FAULT_INSTRUCTIONS = ('measure', 'barrier')
+
+def get_fault_locations(circuit, gate_names=None):
+    # every (instruction index, qubit index) pair where a noise model could attach an error
+    # gate_names restricts the locations to certain gates (e.g. ['cx'] or the noise model's noise_instructions)
+    locations = []
+
+    for index, instruction in enumerate(circuit.data):
+        name = instruction.operation.name
+
+        if name in NON_FAULT_INSTRUCTIONS:
+            continue
+        if gate_names is not None and name not in gate_names:
+            continue
+
+        for qubit in instruction.qubits:
+            locations.append((index, circuit.find_bit(qubit).index))
+
+    return locations
+
+def get_location_label(circuit, location):
+    # human readable name for a location, e.g. "12:cx@q5"
+    index, qubit_index = location
+    return str(index) + ':' + circuit.data[index].operation.name + '@q' + str(qubit_index)
+
+def inject_faults(circuit, faults):
+    # faults is an iterable of (instruction index, qubit index, pauli) where pauli is 'X', 'Y' or 'Z'
+    # returns a new circuit, the original is left untouched
+    faults_by_index = {}
+    for index, qubit_index, pauli in faults:
+        faults_by_index.setdefault(index, []).append((qubit_index, pauli))
+
+    faulty_circuit = circuit.copy_empty_like()
+
+    for index, instruction in enumerate(circuit.data):
+        faulty_circuit.append(instruction.operation, instruction.qubits, instruction.clbits)
+
+        for qubit_index, pauli in faults_by_index.get(index, []):
+            qubit = faulty_circuit.qubits[qubit_index]
+            if pauli == 'X':
+                faulty_circuit.x(qubit)
+            elif pauli == 'Y':
+                faulty_circuit.y(qubit)
+            elif pauli == 'Z':
+                faulty_circuit.z(qubit)
+            else:
+                raise ValueError("Unknown Pauli fault '" + str(pauli) + "', expected 'X', 'Y' or 'Z'")
+
+    return faulty_circuit
+
+MARKER_PREFIX = 'fault_location_'
+
+def prepare_transpiled_circuit(circuit, simulator, locations):
+    # returns {'circuit': the transpiled circuit without markers, 'positions': {instruction index: position}} where
+    # position is where a fault after that builder instruction goes in the transpiled circuit
+    from qiskit import transpile
+    from qiskit.circuit import Barrier
+
+    indices = set(index for index, qubit_index in locations)
+    marked_circuit = circuit.copy_empty_like()
+    for index, instruction in enumerate(circuit.data):
+        marked_circuit.append(instruction.operation, instruction.qubits, instruction.clbits)
+        if index in indices:
+            marked_circuit.append(Barrier(len(instruction.qubits), label=MARKER_PREFIX + str(index)), instruction.qubits)
+
+    # optimization level 0 keeps the barriers and, without a coupling map, the qubit order
+    transpiled_circuit = transpile(marked_circuit, simulator, optimization_level=0)
+
+    base_circuit = transpiled_circuit.copy_empty_like()
+    positions = {}
+    for instruction in transpiled_circuit.data:
+        label = getattr(instruction.operation, 'label', None)
+        if instruction.operation.name == 'barrier' and label is not None and label.startswith(MARKER_PREFIX):
+            positions[int(label[len(MARKER_PREFIX):])] = len(base_circuit.data)
+            continue
+        base_circuit._append(instruction)
+
+    missing = indices - set(positions)
+    if missing:
+        raise ValueError("The transpiler dropped the fault location markers of instructions " + str(sorted(missing)))
+    return {'circuit': base_circuit, 'positions': positions}
+
+def inject_transpiled_faults(prepared, faults):
+    # like inject_faults(), for a circuit from prepare_transpiled_circuit()
+    from qiskit.circuit import CircuitInstruction
+    from qiskit.circuit.library import XGate, YGate, ZGate
+
+    gates = {'X': XGate(), 'Y': YGate(), 'Z': ZGate()}
+    faulty_circuit = prepared['circuit'].copy()
+    # from the back, so the positions in front are not shifted by the insertions
+    for index, qubit_index, pauli in sorted(faults, key=lambda fault: -prepared['positions'][fault[0]]):
+        if pauli not in gates:
+            raise ValueError("Unknown Pauli fault '" + str(pauli) + "', expected 'X', 'Y' or 'Z'")
+        faulty_circuit.data.insert(prepared['positions'][index],
+                                   CircuitInstruction(gates[pauli], (faulty_circuit.qubits[qubit_index],), ()))
+    return faulty_circuit
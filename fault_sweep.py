@@ -0,0 +1,199 @@
+# File: fault_sweep.py
+# Exhaustive weight-1 and weight-2 Pauli fault injection for the Bell state builders.
+# steane_correction.py only ever tests one hard-coded pattern (x(q[4]), z(q[6]), x(q[10]), z(q[12])).
+# Here every X, Y and Z fault is placed at every location of the circuit - encoding, syndrome extraction,
+# correction and decoding - and the result is summarized as a location x Pauli coverage matrix.
+#
+# Many faults are equivalent and only get simulated once:
+#  - any Pauli right before a reset (or on a qubit that is never touched or measured again) does nothing
+#  - a Z right before a measurement does nothing and a Y right before a measurement acts like an X
+#  - two faults on the same location multiply into a single Pauli (or cancel)
+#
+# The base circuit is transpiled once and the faults are inserted into the transpiled circuit (see
+# fault_injection.prepare_transpiled_circuit) - transpiling every fault circuit took almost all of the sweep's time.
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - Transpiled once, faults inserted into the transpiled circuit, simulator.run instead of execute.
+
+import csv
+
+from qiskit_aer import AerSimulator
+
+from fault_injection import get_fault_locations, get_location_label, inject_transpiled_faults, prepare_transpiled_circuit
+from logical_error_statistics import get_logical_error_count
+
+PAULIS = ('X', 'Y', 'Z')
+
+# single qubit Pauli products, ignoring the global phase
+PAULI_PRODUCTS = {
+    ('X', 'X'): None, ('Y', 'Y'): None, ('Z', 'Z'): None,
+    ('X', 'Y'): 'Z', ('Y', 'X'): 'Z',
+    ('X', 'Z'): 'Y', ('Z', 'X'): 'Y',
+    ('Y', 'Z'): 'X', ('Z', 'Y'): 'X',
+}
+
+def get_next_instruction_names(circuit, locations):
+    # name of the next instruction acting on the faulty qubit (None if there is no such instruction)
+    next_names = {}
+    for index, qubit_index in locations:
+        next_names[(index, qubit_index)] = None
+        qubit = circuit.qubits[qubit_index]
+        for instruction in circuit.data[index + 1:]:
+            if instruction.operation.name == 'barrier':
+                continue
+            if qubit in instruction.qubits:
+                next_names[(index, qubit_index)] = instruction.operation.name
+                break
+    return next_names
+
+def canonicalize_fault(fault, next_names):
+    # returns the equivalent fault, or None when the fault cannot change the measured outcome
+    index, qubit_index, pauli = fault
+    next_name = next_names[(index, qubit_index)]
+
+    if next_name is None or next_name == 'reset':
+        return None
+    if next_name == 'measure':
+        if pauli == 'Z':
+            return None
+        return (index, qubit_index, 'X')
+    return fault
+
+def canonicalize_fault_set(faults, next_names):
+    # returns a hashable key shared by every equivalent fault set
+    merged = {}
+    for fault in faults:
+        canonical = canonicalize_fault(fault, next_names)
+        if canonical is None:
+            continue
+        location = (canonical[0], canonical[1])
+        if location in merged:
+            merged[location] = PAULI_PRODUCTS[(merged[location], canonical[2])]
+            if merged[location] is None:
+                del merged[location]
+        else:
+            merged[location] = canonical[2]
+
+    # the merged Pauli may itself be trivial at this location (e.g. X*Y = Z before a measurement)
+    key = []
+    for location, pauli in merged.items():
+        canonical = canonicalize_fault((location[0], location[1], pauli), next_names)
+        if canonical is not None:
+            key.append(canonical)
+    return tuple(sorted(key))
+
+def enumerate_faults(locations, max_weight=2):
+    single_faults = [(index, qubit_index, pauli) for index, qubit_index in locations for pauli in PAULIS]
+
+    fault_sets = [(fault,) for fault in single_faults]
+    if max_weight >= 2:
+        for i in range(len(single_faults)):
+            for j in range(i + 1, len(single_faults)):
+                # two faults on the same location are just another weight-1 fault
+                if single_faults[i][:2] == single_faults[j][:2]:
+                    continue
+                fault_sets.append((single_faults[i], single_faults[j]))
+
+    return fault_sets
+
+def run_fault_sweep(circuit, max_weight=2, shots=16, gate_names=None, simulator=None, batch_size=1000, seed=None):
+    # circuit should be the noiseless builder output, e.g. new_steane_circuit()
+    if simulator is None:
+        simulator = AerSimulator(method='statevector')
+
+    locations = get_fault_locations(circuit, gate_names)
+    next_names = get_next_instruction_names(circuit, locations)
+    fault_sets = enumerate_faults(locations, max_weight)
+
+    # deduplicate - every equivalent fault set maps to the same key and is simulated once
+    keys = [canonicalize_fault_set(faults, next_names) for faults in fault_sets]
+    unique_keys = list(dict.fromkeys(keys))
+
+    prepared = prepare_transpiled_circuit(circuit, simulator, locations)
+
+    # batches keep the number of circuit objects alive at once bounded for the weight-2 sweeps
+    failure_rates = {}
+    for start in range(0, len(unique_keys), batch_size):
+        batch = unique_keys[start:start + batch_size]
+        circuits = [inject_transpiled_faults(prepared, key) for key in batch]
+        run_options = {'shots': shots}
+        if seed is not None:
+            run_options['seed_simulator'] = seed
+        result = simulator.run(circuits, **run_options).result()
+        for i, key in enumerate(batch):
+            failure_rates[key] = get_logical_error_count(result.get_counts(i)) / shots
+
+    return {
+        'locations': locations,
+        'labels': [get_location_label(circuit, location) for location in locations],
+        'fault_sets': fault_sets,
+        'failure_rates': [failure_rates[key] for key in keys],
+        'num_fault_sets': len(fault_sets),
+        'num_simulated': len(unique_keys),
+        'shots': shots,
+    }
+
+def get_coverage_matrix(sweep):
+    # rows follow sweep['locations'], columns follow PAULIS
+    # weight_one[row][col] is the failure rate of that single fault (0 means the code corrected it)
+    # weight_two[row][col] is the fraction of failing weight-2 fault sets that contain that fault
+    row_of = {location: row for row, location in enumerate(sweep['locations'])}
+
+    weight_one = [[0.0 for pauli in PAULIS] for location in sweep['locations']]
+    pair_failures = [[0 for pauli in PAULIS] for location in sweep['locations']]
+    pair_totals = [[0 for pauli in PAULIS] for location in sweep['locations']]
+
+    for faults, failure_rate in zip(sweep['fault_sets'], sweep['failure_rates']):
+        if len(faults) == 1:
+            index, qubit_index, pauli = faults[0]
+            weight_one[row_of[(index, qubit_index)]][PAULIS.index(pauli)] = failure_rate
+            continue
+
+        for index, qubit_index, pauli in faults:
+            row = row_of[(index, qubit_index)]
+            col = PAULIS.index(pauli)
+            pair_totals[row][col] = pair_totals[row][col] + 1
+            if failure_rate > 0:
+                pair_failures[row][col] = pair_failures[row][col] + 1
+
+    weight_two = [[pair_failures[row][col] / pair_totals[row][col] if pair_totals[row][col] else 0.0
+                   for col in range(len(PAULIS))] for row in range(len(sweep['locations']))]
+
+    return {'labels': sweep['labels'], 'paulis': PAULIS, 'weight_one': weight_one, 'weight_two': weight_two}
+
+def write_coverage_matrix_csv(coverage, filename):
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['location'] + ['weight1_' + p for p in coverage['paulis']] + ['weight2_' + p for p in coverage['paulis']])
+        for label, row_one, row_two in zip(coverage['labels'], coverage['weight_one'], coverage['weight_two']):
+            writer.writerow([label] + row_one + row_two)
+
+def print_coverage_summary(sweep, coverage):
+    print('Fault sets: ' + str(sweep['num_fault_sets']) + ' (' + str(sweep['num_simulated']) + ' simulated after deduplication)')
+
+    uncorrected = []
+    for label, row in zip(coverage['labels'], coverage['weight_one']):
+        for pauli, failure_rate in zip(coverage['paulis'], row):
+            if failure_rate > 0:
+                uncorrected.append(pauli + ' after ' + label)
+
+    print('Uncorrected single faults: ' + str(len(uncorrected)) + ' of ' + str(len(coverage['labels']) * len(coverage['paulis'])))
+    for fault in uncorrected:
+        print('  ' + fault)
+
+    pairs = [rate for faults, rate in zip(sweep['fault_sets'], sweep['failure_rates']) if len(faults) == 2]
+    if pairs:
+        failing_pairs = sum(1 for rate in pairs if rate > 0)
+        print('Failing weight-2 fault sets: ' + str(failing_pairs) + ' of ' + str(len(pairs)))
+
+if __name__ == '__main__':
+    import sys
+    from bell_state_with_steane import new_steane_circuit
+
+    max_weight = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+
+    sweep = run_fault_sweep(new_steane_circuit(), max_weight=max_weight)
+    coverage = get_coverage_matrix(sweep)
+    print_coverage_summary(sweep, coverage)
+    write_coverage_matrix_csv(coverage, 'steane_fault_coverage.csv')
@@ -2,14 +2,16 @@
 #
 # Revision History:
 # November 14, 2023 - David Shimkus - Initial Version 
+# October 19, 2026 - Lazy IBMQ import.
 
 #TODO: dynamically load some of the information in a file, etc.
 #TODO: check to see if the account is already "loaded" before loading (for cleaner output)
 
-from qiskit import *
-from qiskit import IBMQ
+# IBMQ is imported inside the functions - it is slow to load and local runs never need it
 
 def load_ibm_parameters_physical():
+    from qiskit import IBMQ
+
     IBMQ.save_account("e37d5b53d616af7d965cdaf92e16755f74470c0e96d7966f07920940a4f3277e9d63d1891599876a5d525857cfc1b3aa73d9d3061ada98f2b2161fda489df7ef")
     IBMQ.load_account()
     provider = IBMQ.load_account()
@@ -18,6 +20,8 @@ def load_ibm_parameters_physical():
     return backend
 
 def load_ibm_parameters_simulator():
+    from qiskit import IBMQ
+
     IBMQ.save_account("e37d5b53d616af7d965cdaf92e16755f74470c0e96d7966f07920940a4f3277e9d63d1891599876a5d525857cfc1b3aa73d9d3061ada98f2b2161fda489df7ef")
     IBMQ.load_account()
     provider = IBMQ.load_account()
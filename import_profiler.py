@@ -0,0 +1,62 @@
+# File: import_profiler.py
+# Reports how long the heavy modules take to import (python main.py --profile-imports).
+# Modules are imported one after the other, so each time is what that module adds on top of the ones before it.
+# For a full tree of every nested import use: python -X importtime main.py --version
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - IBM provider measured as qiskit.providers.ibmq, the module the repo's IBMQ imports load.
+
+import importlib
+import sys
+import time
+
+# roughly in the order main.py needs them for a local simulation
+HEAVY_MODULES = [
+    'numpy',
+    'scipy',
+    'qiskit',
+    'qiskit_aer',
+    'qiskit_aer.noise',
+    'new_noise_refused',
+    'bell_state_with_steane',
+    'bell_state_with_shor',
+    'bell_fidelity',
+    'matplotlib.pyplot',
+    'qiskit.providers.ibmq', # what "from qiskit import IBMQ" loads (qiskit-ibmq-provider) - ibm_parameters imports it lazily
+    'ibm_parameters',
+]
+
+def profile_imports(module_names=None):
+    if module_names is None:
+        module_names = HEAVY_MODULES
+
+    profile = []
+    for module_name in module_names:
+        already_loaded = module_name in sys.modules
+        start = time.perf_counter()
+        try:
+            importlib.import_module(module_name)
+            error = None
+        except Exception as exception: # a missing optional package should not stop the report
+            error = type(exception).__name__ + ': ' + str(exception)
+        profile.append({
+            'module': module_name,
+            'seconds': time.perf_counter() - start,
+            'already_loaded': already_loaded,
+            'error': error,
+        })
+    return profile
+
+def print_import_profile(profile, startup_seconds=None):
+    if startup_seconds is not None:
+        print('Startup before any heavy import (time to first prompt): ' + format(startup_seconds, '.3f') + ' seconds')
+    print('Incremental import times:')
+    for entry in sorted(profile, key=lambda entry: -entry['seconds']):
+        note = ''
+        if entry['already_loaded']:
+            note = ' (already loaded)'
+        if entry['error'] is not None:
+            note = ' (failed - ' + entry['error'] + ')'
+        print('  ' + format(entry['seconds'], '8.3f') + ' s  ' + entry['module'] + note)
+    print('Total: ' + format(sum(entry['seconds'] for entry in profile), '.3f') + ' seconds')
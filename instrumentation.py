@@ -0,0 +1,301 @@
+# File: instrumentation.py
+# Lightweight phase timing for the scripts and main.py, replacing the single start_time / "Time elapsed" print.
+# Spans nest (a 'transpile' span inside an 'iteration' span is recorded as 'iteration/transpile'), are aggregated
+# per phase (count, total, mean, percentiles) across loop iterations, and can be exported as JSON or in the Chrome
+# trace format (open in chrome://tracing or https://ui.perfetto.dev).
+#
+# With enable_memory_tracking() every span also records the resident set size (RSS) at its start and end, how much it
+# raised the process's peak RSS, and the change in Python allocations (tracemalloc).  Phases whose memory keeps
+# growing from one loop iteration to the next (e.g. a simulator rebuilt every iteration and never released) are
+# flagged by print_phase_summary() / print_memory_warnings().
+#
+# Usage:
+#   with span('transpile'):
+#       transpiled_circuit = transpile(circuit, backend)
+#
+#   start_span('build')     # for long blocks that should not be re-indented
+#   ...
+#   end_span()
+#
+#   print_phase_summary()
+#   write_chrome_trace('steane_trace.json')
+#
+#   enable_memory_tracking()     # before the first span that should be measured
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - Peak RSS, RSS and Python allocation deltas per span, memory growth across iterations.
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+_local = threading.local()
+_spans = [] # finished spans: {'name', 'path', 'start', 'seconds', 'thread', 'attributes'}
+_lock = threading.Lock()
+
+# perf_counter at import, so the Chrome trace starts near zero
+_origin = time.perf_counter()
+
+_memory_tracking = False
+
+# a phase is flagged if its RSS grows by more than this over the loop...
+MEMORY_GROWTH_BYTES = 16 * 1024 ** 2
+# ...measured over at least this many iterations
+MIN_GROWTH_ITERATIONS = 5
+
+def enable_memory_tracking(python_allocations=True):
+    # tracemalloc slows allocation-heavy Python code down noticeably, so it can be left off (RSS only)
+    global _memory_tracking
+    _memory_tracking = True
+    if python_allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def disable_memory_tracking():
+    global _memory_tracking
+    _memory_tracking = False
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+def get_rss_bytes():
+    # current resident set size, from /proc (Linux); None elsewhere
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def get_peak_rss_bytes():
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    try:
+        import resource
+    except ImportError: # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def get_memory_sample():
+    # the simulator allocates in C++, so only RSS sees it - tracemalloc only sees Python objects
+    return {
+        'rss': get_rss_bytes(),
+        'peak_rss': get_peak_rss_bytes(),
+        'python': tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None,
+    }
+
+def get_difference(end, start):
+    if end is None or start is None:
+        return None
+    return end - start
+
+def _get_stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+def start_span(name, **attributes):
+    stack = _get_stack()
+    parent_path = stack[-1]['path'] if stack else None
+    stack.append({
+        'name': name,
+        'path': name if parent_path is None else parent_path + '/' + name,
+        'start': time.perf_counter(),
+        'attributes': attributes,
+        'memory_start': get_memory_sample() if _memory_tracking else None,
+    })
+
+def end_span():
+    # ends the innermost open span, returns its duration in seconds
+    entry = _get_stack().pop()
+    entry['seconds'] = time.perf_counter() - entry['start']
+    entry['thread'] = threading.get_ident()
+    memory_start = entry.pop('memory_start')
+    if memory_start is not None:
+        memory_end = get_memory_sample()
+        entry['memory'] = {
+            'rss_end': memory_end['rss'],
+            'rss_delta': get_difference(memory_end['rss'], memory_start['rss']),
+            'peak_rss': memory_end['peak_rss'],
+            'peak_rss_growth': get_difference(memory_end['peak_rss'], memory_start['peak_rss']),
+            'python_delta': get_difference(memory_end['python'], memory_start['python']),
+        }
+    with _lock:
+        _spans.append(entry)
+    return entry['seconds']
+
+@contextmanager
+def span(name, **attributes):
+    start_span(name, **attributes)
+    try:
+        yield
+    finally:
+        end_span()
+
+def add_span(name, start, seconds, **attributes):
+    # for something that was timed before this module was imported (e.g. the imports themselves);
+    # start is a time.time() value
+    entry = {
+        'name': name,
+        'path': name,
+        'start': time.perf_counter() - (time.time() - start),
+        'seconds': seconds,
+        'thread': threading.get_ident(),
+        'attributes': attributes,
+    }
+    with _lock:
+        _spans.append(entry)
+
+def reset_spans():
+    with _lock:
+        del _spans[:]
+
+def get_spans():
+    with _lock:
+        return list(_spans)
+
+def get_percentile(sorted_values, percentile):
+    # nearest rank
+    if not sorted_values:
+        return None
+    rank = max(int(round(percentile / 100.0 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+def get_phase_summary():
+    # {path: {'count', 'total', 'mean', 'min', 'p50', 'p90', 'p99', 'max'}} in the order the phases first started,
+    # so every phase comes right after the phase it is nested in
+    # with memory tracking also 'peak_rss' (highest seen), 'peak_rss_growth' (total), 'rss_delta' and 'python_delta'
+    # (mean per occurrence)
+    durations = {}
+    memory = {}
+    for entry in sorted(get_spans(), key=lambda entry: entry['start']):
+        durations.setdefault(entry['path'], []).append(entry['seconds'])
+        if 'memory' in entry:
+            memory.setdefault(entry['path'], []).append(entry['memory'])
+
+    summary = {}
+    for path, values in durations.items():
+        values = sorted(values)
+        summary[path] = {
+            'count': len(values),
+            'total': sum(values),
+            'mean': sum(values) / len(values),
+            'min': values[0],
+            'p50': get_percentile(values, 50),
+            'p90': get_percentile(values, 90),
+            'p99': get_percentile(values, 99),
+            'max': values[-1],
+        }
+        if path in memory:
+            summary[path].update(get_memory_statistics(memory[path]))
+    return summary
+
+def get_memory_statistics(samples):
+    def values(key):
+        return [sample[key] for sample in samples if sample[key] is not None]
+
+    def mean(key):
+        return sum(values(key)) / len(values(key)) if values(key) else None
+
+    return {
+        'peak_rss': max(values('peak_rss')) if values('peak_rss') else None,
+        'peak_rss_growth': sum(values('peak_rss_growth')) if values('peak_rss_growth') else None,
+        'rss_delta': mean('rss_delta'),
+        'python_delta': mean('python_delta'),
+    }
+
+def get_slope(values):
+    # least squares slope of values against their index
+    n = len(values)
+    mean_x = (n - 1) / 2.0
+    mean_y = sum(values) / float(n)
+    denominator = sum((x - mean_x) ** 2 for x in range(n))
+    return sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values)) / denominator if denominator else 0.0
+
+def get_memory_growth(min_iterations=MIN_GROWTH_ITERATIONS, threshold_bytes=MEMORY_GROWTH_BYTES):
+    # [{'path', 'count', 'rss_growth', 'rss_per_iteration', 'python_growth'}] for every repeated phase whose RSS at
+    # the end of the phase trends upwards by more than threshold_bytes over its occurrences
+    samples = {}
+    for entry in sorted(get_spans(), key=lambda entry: entry['start']):
+        if 'memory' in entry:
+            samples.setdefault(entry['path'], []).append(entry['memory'])
+
+    growing = []
+    for path, memory in samples.items():
+        rss = [sample['rss_end'] for sample in memory if sample['rss_end'] is not None]
+        if len(rss) < min_iterations:
+            continue
+        slope = get_slope(rss)
+        if slope * (len(rss) - 1) <= threshold_bytes:
+            continue
+        python = [sample['python_delta'] for sample in memory if sample['python_delta'] is not None]
+        growing.append({
+            'path': path,
+            'count': len(rss),
+            'rss_growth': slope * (len(rss) - 1),
+            'rss_per_iteration': slope,
+            'python_growth': sum(python) if python else None,
+        })
+    return growing
+
+def format_megabytes(value):
+    return '-' if value is None else format(value / 1024.0 ** 2, '.1f')
+
+def print_memory_warnings(growth=None):
+    if growth is None:
+        growth = get_memory_growth()
+    for entry in growth:
+        message = ("Memory warning: '" + entry['path'] + "' grew by " + format_megabytes(entry['rss_growth']) +
+                   " MB over " + str(entry['count']) + " iterations (" + format_megabytes(entry['rss_per_iteration']) +
+                   " MB each)")
+        if entry['python_growth'] is not None:
+            message += ", " + format_megabytes(entry['python_growth']) + " MB of it Python objects"
+        print(message + " - is something (e.g. a simulator) rebuilt every iteration and kept alive?")
+
+def print_phase_summary(summary=None):
+    if summary is None:
+        summary = get_phase_summary()
+    print("%-40s %7s %10s %10s %10s %10s %10s" % ('phase', 'count', 'total s', 'mean s', 'p50 s', 'p90 s', 'max s'))
+    for path in summary:
+        entry = summary[path]
+        print("%-40s %7d %10.4f %10.5f %10.5f %10.5f %10.5f" % (
+            '  ' * path.count('/') + path.split('/')[-1], entry['count'], entry['total'], entry['mean'],
+            entry['p50'], entry['p90'], entry['max']))
+
+    if any('peak_rss' in entry for entry in summary.values()):
+        print("")
+        print("%-40s %12s %12s %12s %12s" % ('phase', 'peak RSS MB', 'peak +MB', 'mean RSS +MB', 'mean Py +MB'))
+        for path in summary:
+            entry = summary[path]
+            if 'peak_rss' not in entry:
+                continue
+            print("%-40s %12s %12s %12s %12s" % (
+                '  ' * path.count('/') + path.split('/')[-1], format_megabytes(entry['peak_rss']),
+                format_megabytes(entry['peak_rss_growth']), format_megabytes(entry['rss_delta']),
+                format_megabytes(entry['python_delta'])))
+        print_memory_warnings()
+
+def write_summary_json(filename, summary=None):
+    if summary is None:
+        summary = get_phase_summary()
+    with open(filename, 'w') as f:
+        json.dump(summary, f, indent=2)
+
+def write_chrome_trace(filename):
+    # complete ('X') events in microseconds, one row per thread
+    events = []
+    for entry in get_spans():
+        events.append({
+            'name': entry['name'],
+            'cat': entry['path'],
+            'ph': 'X',
+            'ts': (entry['start'] - _origin) * 1e6,
+            'dur': entry['seconds'] * 1e6,
+            'pid': os.getpid(),
+            'tid': entry['thread'],
+            'args': dict({key: str(value) for key, value in entry['attributes'].items()}, **entry.get('memory', {})),
+        })
+    with open(filename, 'w') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
@@ -0,0 +1,115 @@
+# File: job_specs.py
+# Job specification files for running main.py without the interactive prompts.
+# A spec file is JSON (or YAML if PyYAML is installed) holding one job, a list of jobs, or
+#
+#   {"defaults": {"backend": "generic_nvidia", "shots": 1000},
+#    "jobs": [{"code": "steane", "noise": "all_gates", "seed": 1, "output": "steane.json"},
+#             {"code": "shor", "noise": "none"}]}
+#
+# Every field can use either the name or the number of the matching interactive menu choice.
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - Local fake IBM backend with a simulated queue.
+# October 19, 2026 - Simulation method field (automatic by default).
+# October 19, 2026 - Optional background circuit drawing (draw).
+
+import json
+
+from method_selection import SIMULATION_METHODS
+
+# menu number -> name, in the same order as the prompts in main.py
+BACKENDS = {
+    '1': 'mac_t600',
+    '2': 'campus_a200',
+    '3': 'generic_nvidia',
+    '4': 'ibm_brisbane',
+    '5': 'ibm_simulator',
+    '6': 'fake_ibm_brisbane',
+}
+
+CODES = {
+    '1': 'simple',
+    '2': 'bit_flip',
+    '3': 'phase_flip',
+    '4': 'divincenzo',
+    '5': 'steane',
+    '6': 'shor',
+}
+
+# '1' to '3' follow the noise type menu, '4' stands for answering "No" to the noise question
+NOISE_MODELS = {
+    '1': 'ibm_brisbane',
+    '2': 'all_gates',
+    '3': 'channel_only',
+    '4': 'none',
+}
+
+# backends that go through run_ibm() in main.py
+IBM_BACKENDS = ('ibm_brisbane', 'ibm_simulator', 'fake_ibm_brisbane')
+
+IMPLEMENTED_CODES = ('simple', 'bit_flip', 'phase_flip', 'steane', 'shor')
+
+DEFAULT_SPEC = {
+    'backend': 'generic_nvidia',
+    'code': 'simple',
+    'noise': 'none',
+    'shots': 1000,
+    'seed': None,
+    'output': None,
+    'exact_fidelity': False,
+    'method': 'automatic', # or one of method_selection.SIMULATION_METHODS
+    'draw': False,
+}
+
+def normalize_choice(value, choices, field):
+    value = str(value)
+    if value in choices:
+        return choices[value]
+    if value in choices.values():
+        return value
+    raise ValueError("Unknown " + field + " '" + value + "', expected one of " +
+                     ', '.join(sorted(choices.values())) + " (or the menu numbers " + ', '.join(sorted(choices)) + ")")
+
+def normalize_spec(spec, defaults=None):
+    unknown = (set(spec) | set(defaults or {})) - set(DEFAULT_SPEC)
+    if unknown:
+        raise ValueError("Unknown job spec field(s): " + ', '.join(sorted(unknown)))
+
+    normalized = dict(DEFAULT_SPEC)
+    normalized.update(defaults or {})
+    normalized.update(spec)
+
+    normalized['backend'] = normalize_choice(normalized['backend'], BACKENDS, 'backend')
+    normalized['code'] = normalize_choice(normalized['code'], CODES, 'code')
+    normalized['noise'] = normalize_choice(normalized['noise'], NOISE_MODELS, 'noise model')
+    normalized['shots'] = int(normalized['shots'])
+    if normalized['method'] != 'automatic' and normalized['method'] not in SIMULATION_METHODS:
+        raise ValueError("Unknown simulation method '" + str(normalized['method']) + "', expected automatic or one of " +
+                         ', '.join(SIMULATION_METHODS))
+    if normalized['seed'] is not None:
+        normalized['seed'] = int(normalized['seed'])
+
+    if normalized['code'] not in IMPLEMENTED_CODES:
+        raise ValueError("Code '" + normalized['code'] + "' is not implemented yet")
+
+    return normalized
+
+def load_job_specs(filename):
+    with open(filename) as f:
+        if filename.endswith(('.yaml', '.yml')):
+            import yaml # only needed for YAML spec files
+            content = yaml.safe_load(f)
+        else:
+            content = json.load(f)
+
+    defaults = {}
+    if isinstance(content, dict) and 'jobs' in content:
+        defaults = content.get('defaults', {})
+        jobs = content['jobs']
+    elif isinstance(content, list):
+        jobs = content
+    else:
+        jobs = [content]
+
+    return [normalize_spec(job, defaults) for job in jobs]
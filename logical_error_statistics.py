@@ -0,0 +1,126 @@
+# File: logical_error_statistics.py
+# Statistics layer for the logical Bell pair experiments.
+# The logical error rate is the fraction of shots that read anything other than 00 or 11.
+# Rather than a fixed "loops = 100" or "loops = 1000", estimate_logical_error_rate() keeps sampling in
+# batches until the confidence interval is tight enough (relative to the estimate) or the shot budget is spent.
+#
+# Revision History
+# October 19, 2026 - Initial Version.  Moved the Wilson interval and error counting here from rare_event_sampling.py.
+
+import math
+from statistics import NormalDist
+
+def get_logical_error_count(counts):
+    # the logical Bell pair should only ever read 00 or 11
+    # with extra classical registers the keys look like "syndrome c", the logical register is the right-most one
+    num_errors = 0
+    for key, value in counts.items():
+        if key.split(' ')[-1] not in ('00', '11'):
+            num_errors = num_errors + value
+    return num_errors
+
+def wilson_interval(num_errors, num_trials, confidence=0.95):
+    if num_trials == 0:
+        return 0.0, 1.0
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    rate = num_errors / num_trials
+    denominator = 1 + z * z / num_trials
+    center = (rate + z * z / (2 * num_trials)) / denominator
+    half_width = z * math.sqrt(rate * (1 - rate) / num_trials + z * z / (4 * num_trials * num_trials)) / denominator
+
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+def clopper_pearson_interval(num_errors, num_trials, confidence=0.95):
+    # exact (conservative) interval - scipy is already pulled in by qiskit
+    from scipy.stats import beta
+
+    if num_trials == 0:
+        return 0.0, 1.0
+
+    alpha = 1 - confidence
+    lower = 0.0 if num_errors == 0 else beta.ppf(alpha / 2, num_errors, num_trials - num_errors + 1)
+    upper = 1.0 if num_errors == num_trials else beta.ppf(1 - alpha / 2, num_errors + 1, num_trials - num_errors)
+
+    return float(lower), float(upper)
+
+INTERVALS = {
+    'wilson': wilson_interval,
+    'clopper-pearson': clopper_pearson_interval,
+}
+
+def get_relative_error(rate, lower, upper):
+    # half width of the interval relative to the estimate - infinite until the first error is seen
+    if rate == 0:
+        return math.inf
+    return (upper - lower) / (2 * rate)
+
+def make_circuit_sampler(circuit, simulator, seed=None):
+    # transpile once and hand back a function that runs "shots" more shots of the same circuit
+    from qiskit import transpile
+
+    transpiled_circuit = transpile(circuit, simulator)
+    batch_index = [0]
+
+    def run_batch(shots):
+        run_options = {'shots': shots}
+        if seed is not None:
+            run_options['seed_simulator'] = seed + batch_index[0]
+        batch_index[0] = batch_index[0] + 1
+        return simulator.run(transpiled_circuit, **run_options).result().get_counts()
+
+    return run_batch
+
+def estimate_logical_error_rate(run_batch, batch_shots=1000, target_relative_error=0.1, max_shots=1000000,
+                                min_errors=10, confidence=0.95, interval='wilson', callback=None):
+    # run_batch(shots) must return a counts dictionary, e.g. make_circuit_sampler(circuit, simulator)
+    # sampling stops once the relative error is below the target (and at least min_errors were seen)
+    # or once max_shots is reached - whichever comes first
+    interval_function = INTERVALS[interval]
+
+    num_errors = 0
+    num_shots = 0
+    num_batches = 0
+    counts_total = {}
+
+    while num_shots < max_shots:
+        shots = min(batch_shots, max_shots - num_shots)
+        counts = run_batch(shots)
+
+        for key, value in counts.items():
+            counts_total[key] = counts_total.get(key, 0) + value
+        num_errors = num_errors + get_logical_error_count(counts)
+        num_shots = num_shots + shots
+        num_batches = num_batches + 1
+
+        rate = num_errors / num_shots
+        lower, upper = interval_function(num_errors, num_shots, confidence)
+        relative_error = get_relative_error(rate, lower, upper)
+
+        if callback is not None:
+            callback(num_shots, num_errors, rate, lower, upper)
+
+        if num_errors >= min_errors and relative_error <= target_relative_error:
+            break
+
+    rate = num_errors / num_shots if num_shots else 0.0
+    lower, upper = interval_function(num_errors, num_shots, confidence)
+
+    return {
+        'logical_error_rate': rate,
+        'lower': lower,
+        'upper': upper,
+        'confidence': confidence,
+        'interval': interval,
+        'relative_error': get_relative_error(rate, lower, upper),
+        'num_errors': num_errors,
+        'num_shots': num_shots,
+        'num_batches': num_batches,
+        'converged': num_errors >= min_errors and get_relative_error(rate, lower, upper) <= target_relative_error,
+        'counts': counts_total,
+    }
+
+def format_logical_error_rate(estimate):
+    return (str(estimate['logical_error_rate']) + ' (' + str(int(estimate['confidence'] * 100)) + '% ' +
+            estimate['interval'] + ' interval [' + str(estimate['lower']) + ', ' + str(estimate['upper']) + '], ' +
+            str(estimate['num_errors']) + ' errors in ' + str(estimate['num_shots']) + ' shots)')
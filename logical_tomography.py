@@ -0,0 +1,103 @@
+# File: logical_tomography.py
+# Logical Bell state tomography in the XX, YY and ZZ bases from a single batch.
+# The builders (new_steane_circuit, new_bit_flip_circuit, ...) only measure ZZ, which cannot tell |00> + |11>
+# from |00> - |11>.  Here the final measurements are stripped, the remaining prefix is transpiled once, and a
+# short basis-change suffix is appended for every basis.  All bases run in one simulator call.
+#
+# For |phi+> we expect <XX> = +1, <YY> = -1 and <ZZ> = +1, and the fidelity is (1 + <XX> - <YY> + <ZZ>) / 4.
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+
+import numpy as np
+
+from bell_fidelity import get_logical_qubits
+
+BASES = ('XX', 'YY', 'ZZ')
+
+def new_basis_suffix(num_qubits, logical_qubits, basis):
+    from qiskit import QuantumCircuit
+
+    suffix = QuantumCircuit(num_qubits)
+    for qubit, pauli in zip(logical_qubits, basis):
+        if pauli == 'X':
+            suffix.h(qubit)
+        elif pauli == 'Y':
+            suffix.sdg(qubit)
+            suffix.h(qubit)
+    return suffix
+
+def new_tomography_circuits(circuit, backend, basis_gates=None):
+    # returns {basis: circuit ready to run} - the expensive prefix is transpiled once and shared
+    from qiskit import ClassicalRegister, transpile
+
+    logical_qubits = get_logical_qubits(circuit)
+    prefix = circuit.remove_final_measurements(inplace=False)
+    transpiled_prefix = transpile(prefix, backend, basis_gates=basis_gates)
+
+    circuits = {}
+    for basis in BASES:
+        suffix = transpile(new_basis_suffix(prefix.num_qubits, logical_qubits, basis), backend, basis_gates=basis_gates)
+
+        tomography_circuit = transpiled_prefix.compose(suffix)
+        c = ClassicalRegister(len(logical_qubits), 'c')
+        tomography_circuit.add_register(c)
+        for i, qubit in enumerate(logical_qubits):
+            tomography_circuit.measure(qubit, c[i])
+        tomography_circuit.name = circuit.name + '_' + basis
+
+        circuits[basis] = tomography_circuit
+    return circuits
+
+def get_register_position(circuit, register_name='c'):
+    # position of the register in a counts key - Qiskit prints the last register first
+    names = [register.name for register in circuit.cregs]
+    return len(names) - 1 - names.index(register_name)
+
+def get_expectation_value(counts, register_position=0):
+    # <P P> = P(even parity) - P(odd parity), vectorized over the distinct outcomes
+    keys = list(counts.keys())
+    values = np.fromiter(counts.values(), dtype=float, count=len(keys))
+    parities = np.fromiter((key.split(' ')[register_position].count('1') % 2 for key in keys), dtype=float, count=len(keys))
+
+    shots = values.sum()
+    expectation_value = float(np.dot(values, 1 - 2 * parities) / shots)
+    standard_error = float(np.sqrt(max(0.0, 1 - expectation_value**2) / shots))
+    return expectation_value, standard_error
+
+def run_logical_tomography(circuit, simulator, shots=1000, basis_gates=None, seed=None):
+    circuits = new_tomography_circuits(circuit, simulator, basis_gates)
+
+    run_options = {'shots': shots}
+    if seed is not None:
+        run_options['seed_simulator'] = seed
+    result = simulator.run([circuits[basis] for basis in BASES], **run_options).result()
+
+    expectation_values = {}
+    standard_errors = {}
+    for i, basis in enumerate(BASES):
+        position = get_register_position(circuits[basis])
+        expectation_values[basis], standard_errors[basis] = get_expectation_value(result.get_counts(i), position)
+
+    fidelity = (1 + expectation_values['XX'] - expectation_values['YY'] + expectation_values['ZZ']) / 4
+    fidelity_error = np.sqrt(sum(error**2 for error in standard_errors.values())) / 4
+
+    return {
+        'expectation_values': expectation_values,
+        'standard_errors': standard_errors,
+        'fidelity': fidelity,
+        'fidelity_standard_error': float(fidelity_error),
+        'shots_per_basis': shots,
+    }
+
+def print_logical_tomography(tomography):
+    for basis in BASES:
+        print('<' + basis + '> = ' + str(tomography['expectation_values'][basis]) +
+              ' +/- ' + str(tomography['standard_errors'][basis]))
+    print('Bell fidelity estimate: ' + str(tomography['fidelity']) + ' +/- ' + str(tomography['fidelity_standard_error']))
+
+if __name__ == '__main__':
+    from qiskit_aer import AerSimulator
+    from bell_state_with_steane import new_steane_circuit
+
+    print_logical_tomography(run_logical_tomography(new_steane_circuit(), AerSimulator(method='statevector')))
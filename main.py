@@ -1,195 +1,411 @@
 # File: main.py
-# Wrapper for the various Python, Qiskit, Aer, cuQuantum, IBM, and more pieces of this project.  
-# This code is in support of David Shimkus' M.S. thesis defense and is provided "as-is" without support.  
-# You may be able to find out more information or contact me at https://www.davidshimkus.com or https://www.siue.edu/~dashimk/.  
-# Developed in partial fulfillment of M.S. in Computer Science at Southern Illinois University Edwardsville.  
+# Wrapper for the various Python, Qiskit, Aer, cuQuantum, IBM, and more pieces of this project.
+# This code is in support of David Shimkus' M.S. thesis defense and is provided "as-is" without support.
+# You may be able to find out more information or contact me at https://www.davidshimkus.com or https://www.siue.edu/~dashimk/.
+# Developed in partial fulfillment of M.S. in Computer Science at Southern Illinois University Edwardsville.
 #
-# NOTE: for the IBM portions to work you must provide your IBM API Key in a separate file titled IBM.key (no whitespaces, headers, etc.).  
+# NOTE: for the IBM portions to work you must provide your IBM API Key in a separate file titled IBM.key (no whitespaces, headers, etc.).
 #
-# Revision History 
-# November 13, 2023 - David Shimkus - Initial Version.  
+# Usage:
+#   python main.py                                    (interactive menus, as before)
+#   python main.py --backend 3 --code steane --noise all_gates --shots 1000 --seed 1 --output steane.json
+#   python main.py --spec jobs.json [--spec more_jobs.yaml ...]    (see job_specs.py for the format)
+#   python main.py --profile-imports                  (import time of every heavy module)
+#   python main.py --code steane --noise all_gates --dry-run    (cost of each simulation method, nothing is run)
+#
+# Revision History
+# November 13, 2023 - David Shimkus - Initial Version.
 # November 26, 2023 - David Shimkus - Fixed bug with noise generation call.
+# October 19, 2026 - Report the logical error rate with a confidence interval.
+# October 19, 2026 - Cache seeded simulations and IBM jobs.
+# October 19, 2026 - Optional exact Bell fidelity for local simulations.
+# October 19, 2026 - Command line arguments and job spec files.  Several jobs can run in one process.
+# October 19, 2026 - Heavy imports moved into the functions that need them, --profile-imports and --version.
+# October 19, 2026 - Local fake IBM backend (choice 6) for trying the IBM path without an account.
+# October 19, 2026 - Local simulator configured by backend_registry.py (GPU to CPU fallback).
+# October 19, 2026 - Simulation method chosen from the circuit content (method_selection.py), --method and --dry-run.
+# October 19, 2026 - Pre-flight memory/runtime check (resource_estimator.py) before a local simulation starts.
+# October 19, 2026 - Circuit drawing is opt-in (--draw) and runs in the background.
+# October 19, 2026 - Per-phase timing spans instead of "Time elapsed", --trace and --timings.
+# October 19, 2026 - --memory records RSS and Python allocations per phase.
+# October 19, 2026 - --profile writes a cProfile of every job's run phase and prints the hotspots.
+# October 19, 2026 - Method chosen from the builder circuit, stabilizer runs use the noise moved onto their gates.
+# October 19, 2026 - Only a refused pre-flight check (ResourceCheckError) skips a job, other errors are raised.
+# October 19, 2026 - The result cache is only opened for seeded simulations.
+# October 19, 2026 - --dry-run no longer starts the blocking calibration.
+# October 19, 2026 - A missing spec file or PyYAML reported as an invalid job spec instead of a traceback.
 
 import time
 start_time = time.time()
 
-import numpy as np
+import argparse
+import json
+import os
+import sys
 from datetime import datetime
-import random 
-
-import qiskit
-from qiskit import *
-from qiskit import QuantumRegister
-from qiskit import ClassicalRegister
-from qiskit import QuantumCircuit
-from qiskit.circuit.library import *
-from qiskit_aer import AerSimulator
-import qiskit_aer.noise as noise
-from qiskit_aer.noise import pauli_error
-from qiskit_aer.noise import thermal_relaxation_error # there are more options available here!
-
-# custom files
-from new_noise_refused import *
-from simple_bell_state import *
-from bell_state_with_bit_phase import *
-from bell_state_with_steane import *
-from ibm_parameters import *
-from new_noise_refused import *
-
-print("Imports Successful")
-print("Qiskit Information:")
-print(qiskit.__qiskit_version__)
-print("")
+import random
 
-#TODO: check for runtime arguments
+# custom files - only the light ones here
+# qiskit, Aer, the noise models, the IBM provider and matplotlib are imported by the functions that need them,
+# so the menus show up right away and local runs never load the IBM provider
+from logical_error_statistics import get_logical_error_count, wilson_interval
+from result_cache import open_result_cache, run_simulation_with_cache, run_hardware_with_cache
+from job_specs import BACKENDS, CODES, NOISE_MODELS, IBM_BACKENDS, IMPLEMENTED_CODES, load_job_specs, normalize_spec
+from method_selection import SIMULATION_METHODS
+from resource_estimator import ResourceCheckError
+from circuit_rendering import render_in_background, wait_for_renders
+from instrumentation import add_span, enable_memory_tracking, print_phase_summary, span, write_chrome_trace, write_summary_json
+from profiling import get_stats, new_profiler, print_hotspots, profile_run, write_profile
 
-print("")
-print("Welcome to my entangled logical qubits demo :)")
-print("This is provided as-is without support and is intended for academic/research purposes only")
-print("")
-print("Please enter one of the following choices: ")
-print(" 1. Apple Mac A1289 and two NVIDIA T600 GPU's - cuQuantum simulation")
-print(" 2. SIUE Campus Cluster and at least one NVIDIA A200 GPU - cuQuantum simulation")
-print(" 3. 'Generic' NVIDIA configuration")
-print(" 4. IBM Brisbane real quantum computer (Eagle architecture)")
-print(" 5. IBM simulator - 5000 qubits") 
-choice1 = input("Enter your choice: ")
-print("")
-print("Please enter one of the following choices: ")
-print(" 1. Simple Bell State with two physical qubits")
-print(" 2. Bell State with bit-flip encoding (3 physical qubits per logical qubit)")
-print(" 3. Bell State with phase-flip encoding (3 physical qubits per logical qubit)")
-print(" 4. Bell State with DiVicenzo Encoding (5 physical qubits per logical qubit and various ancillae) - NOT IMPLEMENTED")
-print(" 5. Bell State with Steane Encoding (7 physical qubits per logical qubit with 3 ancillae overall)")
-print(" 6. Bell State with Shor Encoding (9 physical qubits per logical qubit)")
-print(" 7. Complex Bell State with four physical qubits - NOT IMPLEMENTED")
-print(" 8. Complex Bell State with four logical qubits and Steane Encoding - NOT IMPLEMENTED")
-print(" 9. Complex Bell State with sixteen phsyical qubits NOT IMPLEMENTED ")
-print("10. Complex Bell State with sixteen physical qubits and Steane Encoding - NOT IMPLEMENTED")
-print("11. Factor a semiprime number with Shor's Algorithm - EXPERIMENTAL")
-choice2 = input("Enter your choice: ")
-print("")
+add_span('imports', start_time, time.time() - start_time)
 
-random.seed(datetime.now().timestamp()) # alternatively random.seed(1234) for constant
+def prompt_job_spec():
+    print("")
+    print("Welcome to my entangled logical qubits demo :)")
+    print("This is provided as-is without support and is intended for academic/research purposes only")
+    print("")
+    print("Please enter one of the following choices: ")
+    print(" 1. Apple Mac A1289 and two NVIDIA T600 GPU's - cuQuantum simulation")
+    print(" 2. SIUE Campus Cluster and at least one NVIDIA A200 GPU - cuQuantum simulation")
+    print(" 3. 'Generic' NVIDIA configuration")
+    print(" 4. IBM Brisbane real quantum computer (Eagle architecture)")
+    print(" 5. IBM simulator - 5000 qubits")
+    print(" 6. Local fake IBM backend with a simulated queue (no account needed)")
+    choice1 = input("Enter your choice: ")
+    print("")
+    print("Please enter one of the following choices: ")
+    print(" 1. Simple Bell State with two physical qubits")
+    print(" 2. Bell State with bit-flip encoding (3 physical qubits per logical qubit)")
+    print(" 3. Bell State with phase-flip encoding (3 physical qubits per logical qubit)")
+    print(" 4. Bell State with DiVicenzo Encoding (5 physical qubits per logical qubit and various ancillae) - NOT IMPLEMENTED")
+    print(" 5. Bell State with Steane Encoding (7 physical qubits per logical qubit with 3 ancillae overall)")
+    print(" 6. Bell State with Shor Encoding (9 physical qubits per logical qubit)")
+    print(" 7. Complex Bell State with four physical qubits - NOT IMPLEMENTED")
+    print(" 8. Complex Bell State with four logical qubits and Steane Encoding - NOT IMPLEMENTED")
+    print(" 9. Complex Bell State with sixteen phsyical qubits NOT IMPLEMENTED ")
+    print("10. Complex Bell State with sixteen physical qubits and Steane Encoding - NOT IMPLEMENTED")
+    print("11. Factor a semiprime number with Shor's Algorithm - EXPERIMENTAL")
+    choice2 = input("Enter your choice: ")
+    print("")
 
-shots = 1000 # TODO: seed in configuration file? 
-
-circuit = QuantumCircuit()
-counts = {}
-
-match choice2: 
-    case '1':
-        print("Creating a simple bell state with two physical qubits")
-        circuit = new_simple_bell_circuit()
-    case '2':
-        print("Creating a bell state with bit-flip encoding ONLY (6 physical qubits making up 2 logical qubits)")
-        circuit = new_bit_flip_circuit()
-    case '3':
-        print("Creating a bell state with phase-flip encoding ONLY (6 physical qubits making up 2 logical qubits)")
-        circuit = new_phase_flip_circuit()
-    case '4': 
+    if CODES.get(choice2) not in IMPLEMENTED_CODES:
         print("NOT IMPLEMENTED YET")
-    case '5':
-        print("Creating a bell state with Steane QEC methods (14 physical qubits making up 2 logical qubits)")
-        circuit = new_steane_circuit()
+        return None
 
-match choice1: 
-    case '1' | '2' | '3':
+    noise = 'none'
+    if BACKENDS.get(choice1) in ('mac_t600', 'campus_a200', 'generic_nvidia'):
         print("You have chosen to run a local simulation instead of an IBM cloud offering.  Do you want to simulate noise?")
         print(" 1. Yes")
         print(" 2. No")
         choice3 = input("Enter your choice: ")
 
-        noise_model = noise.NoiseModel()
-
-        print(choice3)
-
-        if choice3 == '1': 
+        if choice3 == '1':
             print("")
             print("What type of noisy simulator do you want to use?")
             print(" 1. IBM Brisbane")
             print(" 2. Custom Probability for ALL gates")
             print(" 3. Custom Probability in the Noisy Channel ONLY")
             choice4 = input("Enter your choice: ")
+            noise = NOISE_MODELS.get(choice4, 'none')
+
+    # TODO: seed in configuration file? - use --seed or a job spec to make local simulations reproducible (and cached)
+    return normalize_spec({'backend': choice1, 'code': choice2, 'noise': noise})
+
+def build_circuit(code):
+    match code:
+        case 'simple':
+            from simple_bell_state import new_simple_bell_circuit
+            print("Creating a simple bell state with two physical qubits")
+            return new_simple_bell_circuit()
+        case 'bit_flip':
+            from bell_state_with_bit_phase import new_bit_flip_circuit
+            print("Creating a bell state with bit-flip encoding ONLY (6 physical qubits making up 2 logical qubits)")
+            return new_bit_flip_circuit()
+        case 'phase_flip':
+            from bell_state_with_bit_phase import new_phase_flip_circuit
+            print("Creating a bell state with phase-flip encoding ONLY (6 physical qubits making up 2 logical qubits)")
+            return new_phase_flip_circuit()
+        case 'steane':
+            from bell_state_with_steane import new_steane_circuit
+            print("Creating a bell state with Steane QEC methods (14 physical qubits making up 2 logical qubits)")
+            return new_steane_circuit()
+        case 'shor':
+            from bell_state_with_shor import new_shor_circuit
+            print("Creating a bell state with Shor QEC methods (18 physical qubits making up 2 logical qubits)")
+            return new_shor_circuit()
+
+def build_noise_model(noise_name):
+    from new_noise_refused import (get_empty_model_and_gates, get_model_from_IBM, get_model_and_gates,
+                                   get_model_and_gates_bad_identities)
+
+    match noise_name:
+        case 'ibm_brisbane':
+            return get_model_from_IBM()
+        case 'all_gates':
+            return get_model_and_gates()
+        case 'channel_only':
+            return get_model_and_gates_bad_identities()
+        case _:
+            return get_empty_model_and_gates() # no noise added via this object
+
+def select_method(circuit, noise_model, spec):
+    if spec['method'] != 'automatic':
+        return spec['method']
+
+    from method_selection import print_method_report, select_simulation_method
+
+    selection = select_simulation_method(circuit, noise_model, spec['shots'])
+    print("")
+    print_method_report(selection)
+    return selection['method']
 
-            if choice4 == '1':
-                noise_model = get_model_from_IBM()
-            if choice4 == '2':
-                noise_model = get_model_and_gates()
-            if choice4 == '3':
-                noise_model = get_model_and_gates_bad_identities()
-            
-            
-
-        elif choice3 == '2':
-            noise_model = get_empty_model_and_gates() # no noise added via this object
-
-        my_simulator = AerSimulator(method='statevector',device='GPU',noise_model=noise_model)
-
-        #multi GPU
-        #TODO: tweak for specific NVIDIA configurations
-        number_blocking_qubits = 22 # GPU specific parameter
-        
-        result = execute(circuit, my_simulator, shots=shots, 
-                        blocking_enable=True, blocking_qubits=number_blocking_qubits,
-                        basis_gates=noise_model.basis_gates
-                ).result() 
-
-        counts = result.get_counts()
-    
-    case '4':
+def run_local_simulation(circuit, spec, dry_run=False):
+    from qiskit import execute
+    from backend_registry import get_simulator_config, new_simulator, print_simulator_config
+    from method_selection import get_method_noise_model
+    from resource_estimator import check_resources, print_resource_estimate
+
+    with span('noise_model'):
+        noise_model = build_noise_model(spec['noise'])
+
+    # analyzed as built - transpiled to the noise model's u1/u2/u3 gates nothing would look Clifford any more
+    with span('preflight'):
+        method = select_method(circuit, noise_model, spec)
+
+        # refuse (or switch to a cheaper method) before anything is allocated
+        device_config = get_simulator_config(spec['backend'], num_qubits=circuit.num_qubits, method=method, autotune=False)
+        estimate = check_resources(circuit, noise_model, spec['shots'], method, device_config['device'],
+                                   num_gpus=device_config['num_gpus'])
+        method = estimate['method']
+    print("")
+    print_resource_estimate(estimate)
+
+    # the stabilizer methods run in their own gates, with the noise moved onto them
+    with span('noise_model'):
+        run_noise_model, basis_gates = get_method_noise_model(noise_model, method, circuit)
+
+    # device, threading and blocking are picked for this machine - CPU-only nodes fall back instead of failing
+    # (a dry run shows the profile's settings, it never starts the blocking calibration)
+    with span('configure'):
+        simulator_config = get_simulator_config(spec['backend'], num_qubits=circuit.num_qubits, method=method,
+                                                autotune=not dry_run)
+    print("")
+    print_simulator_config(simulator_config)
+    if dry_run:
+        return None, None
+    my_simulator = new_simulator(simulator_config, run_noise_model)
+
+    shots = spec['shots']
+    seed = spec['seed']
+
+    def run():
+        with span('execute'):
+            return execute(circuit, my_simulator, shots=shots, seed_simulator=seed,
+                    basis_gates=basis_gates, **simulator_config['run_options']
+            ).result().get_counts()
+
+    # an unseeded run is never cached, so the SQLite file is not even opened
+    cache = open_result_cache() if seed is not None else None
+    counts = run_simulation_with_cache(cache, circuit, my_simulator, shots, seed, run_noise_model, run)
+
+    fidelity = None
+    if spec['exact_fidelity']:
+        from bell_fidelity import get_exact_bell_fidelity, print_bell_fidelity
+        with span('exact_fidelity'):
+            fidelity = get_exact_bell_fidelity(circuit, noise_model, device=simulator_config['device'], seed=seed)
+        print("")
+        print_bell_fidelity(fidelity)
+
+    return counts, fidelity
+
+def run_ibm(circuit, spec):
+    from qiskit import transpile
+    from ibm_parameters import load_ibm_parameters_physical, load_ibm_parameters_simulator
+
+    if spec['backend'] == 'ibm_brisbane':
         print("You have chosen to run this code against a cloud IBM physical quantum computer.  Please make sure your API key is seeded properly.")
         print("")
         backend = load_ibm_parameters_physical()
+    elif spec['backend'] == 'fake_ibm_brisbane':
+        from fake_ibm_backend import FakeQueuedBackend
+        print("You have chosen the local fake IBM backend.  Jobs wait in a simulated queue before they run.")
+        print("")
+        backend = FakeQueuedBackend(seed=spec['seed'])
+    else:
+        print("You have chosen to run this code against a cloud IBM simulator.  Please make sure your API key is seeded properly.")
+        print("")
+        backend = load_ibm_parameters_simulator() #TODO: noise simulation?
 
+    with span('transpile'):
         transpiled_circuit = transpile(circuit, backend)
 
-        #generated image may be too large
-        try:
-            transpiled_circuit.draw(output='mpl', filename='bit_flip_brisbane_transpiled.png', fold=-1)
-        except:
-            print("")
-            print("Tried to create a diagram of the transpiled circuit but it was probably too large.  Sorry!")
+    # large transpiled circuits get a text summary instead of an image (see circuit_rendering.py)
+    if spec['draw']:
+        render_in_background(transpiled_circuit, spec['code'] + '_' + spec['backend'] + '_transpiled', stages=False)
 
-        print("")
-        print("Number of operations for 'Brisbane Transpiled Circuit':")
-        print(dict(transpiled_circuit.count_ops()))
+    print("")
+    print("Number of operations for 'Brisbane Transpiled Circuit':")
+    print(dict(transpiled_circuit.count_ops()))
 
+    if spec['backend'] == 'ibm_brisbane':
         print("")
         print("Please be patient, this may take a while.  You can view the status of the job in the IBM dashboard: https://quantum-computing.ibm.com/.")
-        job = backend.run(transpiled_circuit, shots=shots)
-        counts = job.result().get_counts()
 
-    case '5':
-        print("You have chosen to run this code against a cloud IBM simulator.  Please make sure your API key is seeded properly.")
-        print("")
-        backend = load_ibm_parameters_simulator() #TODO: noise simulation? 
+    # the job id is cached as soon as it is submitted, rerunning never pays for the same job twice
+    shots = spec['shots']
+    return run_hardware_with_cache(open_result_cache(), circuit, backend, shots,
+            lambda: backend.run(transpiled_circuit, shots=shots))
 
-        transpiled_circuit = transpile(circuit, backend)
+def run_job(spec, dry_run=False):
+    job_start_time = time.time()
 
-        #generated image may be too large
-        try:
-            transpiled_circuit.draw(output='mpl', filename='bit_flip_brisbane_transpiled.png', fold=-1)
-        except:
-            print("")
-            print("Tried to create a diagram of the transpiled circuit but it was probably too large.  Sorry!")
+    with span('build'):
+        circuit = build_circuit(spec['code'])
+    if spec['draw']:
+        render_in_background(circuit, spec['code'] + '_circuit') # drawn while the job runs
+
+    fidelity = None
+    if spec['backend'] in IBM_BACKENDS:
+        if dry_run:
+            print("Dry run: nothing is submitted to " + spec['backend'] + ".  Gate counts: " + str(dict(circuit.count_ops())))
+            return None
+        counts = run_ibm(circuit, spec)
+    else:
+        counts, fidelity = run_local_simulation(circuit, spec, dry_run)
+        if dry_run:
+            return None
+
+    shots = spec['shots']
+    with span('tally'):
+        num_errors = get_logical_error_count(counts)
+        lower, upper = wilson_interval(num_errors, shots)
+
+    print("")
+    print('Shots: ' + str(shots))
+    print("")
+    print("Measurements obtained (approximately 50/50 |00> and |11> states expected): ")
+    print(counts)
+    print("Logical error rate (outcomes other than 00/11): " + str(num_errors / shots) +
+          " (95% Wilson interval [" + str(lower) + ", " + str(upper) + "])")
+    print("")
+    print("Gate counts: ")
+    print(dict(circuit.count_ops()))
+
+    return {
+        'spec': spec,
+        'counts': counts,
+        'logical_error_rate': num_errors / shots,
+        'logical_error_rate_interval': [lower, upper],
+        'gate_counts': dict(circuit.count_ops()),
+        'exact_fidelity': fidelity,
+        'seconds': time.time() - job_start_time,
+    }
+
+def get_profile_filename(spec):
+    # next to the results file if there is one
+    if spec['output']:
+        return os.path.splitext(spec['output'])[0] + '.prof'
+    return spec['code'] + '_' + spec['backend'] + '.prof'
+
+def write_job_result(job_result):
+    with open(job_result['spec']['output'], 'w') as f:
+        json.dump(job_result, f, indent=2)
+    print("Results written to " + job_result['spec']['output'])
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Entangled logical qubits demo.  Without arguments the interactive menus are shown.")
+    parser.add_argument('--spec', action='append', help="JSON/YAML job spec file, can be given more than once (see job_specs.py)")
+    parser.add_argument('--backend', help="backend name or menu number: " + ', '.join(BACKENDS.values()))
+    parser.add_argument('--code', help="code name or menu number: " + ', '.join(IMPLEMENTED_CODES))
+    parser.add_argument('--noise', help="noise model name or number: " + ', '.join(NOISE_MODELS.values()))
+    parser.add_argument('--shots', type=int)
+    parser.add_argument('--seed', type=int, help="seed the simulator - seeded runs are reproducible and cached in results.sqlite")
+    parser.add_argument('--output', help="write the results of the job as JSON to this file")
+    parser.add_argument('--method', help="simulation method for local backends: automatic (default) or one of " + ', '.join(SIMULATION_METHODS))
+    parser.add_argument('--dry-run', action='store_true', help="only report the estimated cost of each simulation method and the chosen configuration")
+    parser.add_argument('--draw', action='store_true', default=None, help="draw the circuit (per stage, and the transpiled circuit for IBM backends) in the background")
+    parser.add_argument('--exact-fidelity', action='store_true', default=None, help="also compute the logical Bell fidelity from a density matrix (local simulations only) - exact without noise and for noisy circuits up to 12 qubits; the noisy Shor and Steane circuits are averaged over noise trajectories")
+    parser.add_argument('--trace', help="write a Chrome trace (chrome://tracing, ui.perfetto.dev) of every timed phase to this file")
+    parser.add_argument('--timings', help="write the per-phase timing summary as JSON to this file")
+    parser.add_argument('--profile', action='store_true', help="profile each job's run phase (build to tally) with cProfile, write it next to the results and print the hotspots")
+    parser.add_argument('--memory', action='store_true', help="record peak RSS and Python allocations (tracemalloc) per phase and warn about phases that keep growing")
+    parser.add_argument('--version', action='store_true', help="print the Qiskit version information and exit")
+    parser.add_argument('--profile-imports', action='store_true', help="report how long each heavy module takes to import and exit")
+    return parser.parse_args()
+
+def get_job_specs(args):
+    # command line values override the same fields of every spec file
+    overrides = {}
+    for field in ('backend', 'code', 'noise', 'shots', 'seed', 'output', 'exact_fidelity', 'method', 'draw'):
+        if getattr(args, field) is not None:
+            overrides[field] = getattr(args, field)
+
+    if args.spec:
+        specs = []
+        for filename in args.spec:
+            specs.extend(load_job_specs(filename))
+        return [normalize_spec(dict(spec, **overrides)) for spec in specs]
 
+    if overrides:
+        return [normalize_spec(overrides)]
+
+    spec = prompt_job_spec()
+    return [spec] if spec is not None else []
+
+args = parse_arguments()
+
+if args.version:
+    import qiskit
+    print("Qiskit Information:")
+    print(qiskit.__qiskit_version__)
+    sys.exit(0)
+
+if args.profile_imports:
+    from import_profiler import print_import_profile, profile_imports
+    print_import_profile(profile_imports(), time.time() - start_time)
+    sys.exit(0)
+
+random.seed(datetime.now().timestamp()) # alternatively random.seed(1234) for constant
+
+try:
+    job_specs = get_job_specs(args)
+except (ValueError, OSError, ImportError) as error: # bad fields, a missing spec file, or a .yaml spec without PyYAML
+    print("Invalid job spec: " + str(error))
+    sys.exit(2)
+
+if args.memory:
+    enable_memory_tracking()
+
+exit_code = 0
+for job_number, spec in enumerate(job_specs):
+    if len(job_specs) > 1:
         print("")
-        print("Number of operations for 'Brisbane Transpiled Circuit':")
-        print(dict(transpiled_circuit.count_ops()))
+        print("Job " + str(job_number + 1) + " of " + str(len(job_specs)) + ": " + spec['code'] + " on " + spec['backend'] + " with " + spec['noise'] + " noise")
 
-        job = backend.run(transpiled_circuit, shots=shots)
-        counts = job.result().get_counts()
+    profiler = new_profiler() if args.profile else None
+
+    try:
+        with span('job', code=spec['code'], backend=spec['backend']):
+            with profile_run(profiler):
+                job_result = run_job(spec, args.dry_run)
+    except ResourceCheckError as error: # the pre-flight check refused the job
+        print(str(error))
+        exit_code = 3
+        continue
+    finally:
+        if profiler is not None:
+            print("")
+            write_profile(profiler, get_profile_filename(spec))
+            print_hotspots(get_stats(profiler))
+    if job_result is not None and spec['output']:
+        write_job_result(job_result)
+
+wait_for_renders() # the files of a background drawing are only complete once it finishes
 
 print("")
-print('Shots: ' + str(shots))
-print("")
-print("Measurements obtained (approximately 50/50 |00> and |11> states expected): ")
-print(counts)
-print("")
-print("Gate counts: ")
-print(dict(circuit.count_ops()))
-finish_time = time.time() - start_time
-print("")
-print('Time elapsed: ' + str(finish_time) + ' seconds')
-        
+print_phase_summary()
+if args.trace:
+    write_chrome_trace(args.trace)
+if args.timings:
+    write_summary_json(args.timings)
+sys.exit(exit_code)
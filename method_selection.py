@@ -0,0 +1,284 @@
+# File: method_selection.py
+# Chooses the cheapest Aer simulation method for a built circuit instead of always using statevector.
+# The circuit's gate set, width, mid-circuit measurements and the noise model's error types decide which methods
+# are exact (or acceptable, if approximate results are allowed); the rough cost of each is reported so a job can be
+# checked before it runs (python main.py ... --dry-run).
+#
+# The costs are order-of-magnitude operation counts, only meant for comparing the methods with each other:
+#   stabilizer            gates * n^2                        Clifford gates and Pauli noise only
+#   extended_stabilizer   gates * n^2 * 2^(0.23 * t)         approximate, t = number of non-Clifford gates (T-count)
+#   matrix_product_state  gates * chi^3                      chi = largest bond dimension the entangling gates allow
+#   statevector           gates * 2^n                        exact for everything (noise by trajectories)
+#   density_matrix        gates * 4^n                        exact for everything, one run covers every noise path
+#
+# The circuit is analysed as the builder made it: transpiled to a noise model's u1/u2/u3 basis every circuit looks
+# non-Clifford to Aer's stabilizer methods.  get_method_noise_model() then gives the noise model and basis gates a
+# method runs with - the stabilizer methods have no u1/u2/u3, so single qubit errors on those move to the circuit's
+# own single qubit gates.
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - Builder circuit analysed instead of the transpiled one, noise moved for the stabilizer methods,
+#                    fixed preference order between methods of equal cost.
+
+SIMULATION_METHODS = ('stabilizer', 'extended_stabilizer', 'matrix_product_state', 'statevector', 'density_matrix')
+
+# the methods Aer can run on a GPU
+GPU_METHODS = ('statevector', 'density_matrix')
+
+# ties in the estimated cost go to the method earlier in this list
+METHOD_PREFERENCE = ('stabilizer', 'statevector', 'density_matrix', 'matrix_product_state', 'extended_stabilizer')
+
+# methods without u1/u2/u3 - the circuit is translated to their own gates (see get_method_noise_model)
+STABILIZER_METHODS = ('stabilizer', 'extended_stabilizer')
+
+# instructions every method understands that are not gates
+NON_GATE_INSTRUCTIONS = ('measure', 'reset', 'barrier', 'delay')
+
+# T-count of the non-Clifford gates the builders use, anything else counts as one
+T_COUNTS = {
+    't': 1,
+    'tdg': 1,
+    'ccx': 7,
+    'ccz': 7,
+    'mcx': 14,
+    'c3x': 14,
+}
+
+# error types in a noise model the stabilizer method can sample
+PAULI_NOISE_INSTRUCTIONS = ('id', 'x', 'y', 'z', 'pauli', 'reset', 'measure')
+
+BYTES_PER_AMPLITUDE = 16 # complex double
+
+_clifford_cache = {}
+_supported_instructions = {}
+
+def get_supported_instructions(method):
+    # the instruction names Aer accepts for a method, None if that cannot be determined
+    if method not in _supported_instructions:
+        try:
+            from qiskit_aer import AerSimulator
+
+            simulator = AerSimulator(method=method)
+            try:
+                names = simulator.configuration().basis_gates
+            except AttributeError: # BackendV2 builds
+                names = simulator.target.operation_names
+            _supported_instructions[method] = set(names) | set(NON_GATE_INSTRUCTIONS)
+        except Exception:
+            _supported_instructions[method] = None
+    return _supported_instructions[method]
+
+def get_unsupported_gates(gate_names, method):
+    supported = get_supported_instructions(method)
+    if supported is None:
+        return []
+    return sorted(set(gate_names) - supported)
+
+def is_clifford_instruction(operation):
+    if operation.name in NON_GATE_INSTRUCTIONS:
+        return True
+    key = (operation.name, tuple(str(param) for param in operation.params))
+    if key not in _clifford_cache:
+        from qiskit.quantum_info import Clifford
+
+        try:
+            Clifford(operation) # raises for anything outside the Clifford group
+            _clifford_cache[key] = True
+        except Exception:
+            _clifford_cache[key] = False
+    return _clifford_cache[key]
+
+def is_pauli_noise(noise_model):
+    # True if every quantum error is a mixture of Paulis (and resets) - bit flip, phase flip, depolarizing
+    if noise_model is None or noise_model.is_ideal():
+        return True
+    for error in noise_model.to_dict().get('errors', []):
+        if error['type'] == 'roerror':
+            continue # readout errors are classical
+        for instructions in error['instructions']:
+            for instruction in instructions:
+                if instruction['name'] not in PAULI_NOISE_INSTRUCTIONS:
+                    return False
+    return True
+
+def get_max_bond_dimension(circuit):
+    # upper bound on the matrix product state bond dimension: across every cut of the qubit line it is limited by
+    # the smaller side (2^min(k, n - k)) and by the two qubit gates that cross the cut (each can at most double it)
+    num_qubits = circuit.num_qubits
+    crossings = [0] * max(num_qubits - 1, 0)
+    for instruction in circuit.data:
+        if len(instruction.qubits) < 2 or instruction.operation.name in NON_GATE_INSTRUCTIONS:
+            continue
+        indices = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+        for cut in range(min(indices), max(indices)):
+            crossings[cut] += 1
+    bond_exponent = 0
+    for cut, crossing in enumerate(crossings):
+        bond_exponent = max(bond_exponent, min(cut + 1, num_qubits - cut - 1, crossing))
+    return 2 ** bond_exponent
+
+def analyze_circuit(circuit, noise_model=None):
+    num_gates = 0
+    gate_names = set()
+    t_count = 0
+    non_clifford_gates = {}
+    mid_circuit_measurement = False
+    measured = set()
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if operation.name == 'barrier':
+            continue
+        qubits = set(circuit.find_bit(qubit).index for qubit in instruction.qubits)
+        if operation.name == 'measure':
+            measured |= qubits
+            continue
+        if qubits & measured:
+            mid_circuit_measurement = True # something happens to a qubit after it was measured
+        num_gates += 1
+        gate_names.add(operation.name)
+        if not is_clifford_instruction(operation):
+            t_count += T_COUNTS.get(operation.name, 1)
+            non_clifford_gates[operation.name] = non_clifford_gates.get(operation.name, 0) + 1
+
+    resets = any(instruction.operation.name == 'reset' for instruction in circuit.data)
+    return {
+        'num_qubits': circuit.num_qubits,
+        'num_gates': num_gates,
+        'gate_names': gate_names,
+        'clifford': t_count == 0,
+        't_count': t_count,
+        'non_clifford_gates': non_clifford_gates,
+        'mid_circuit_measurement': mid_circuit_measurement or resets,
+        'max_bond_dimension': get_max_bond_dimension(circuit),
+        'ideal': noise_model is None or noise_model.is_ideal(),
+        'pauli_noise': is_pauli_noise(noise_model),
+    }
+
+def get_method_costs(analysis, shots=1000):
+    # one entry per method: whether it can be used, whether it is exact, memory, estimated operations
+    n = analysis['num_qubits']
+    gates = max(analysis['num_gates'], 1)
+    # without noise or mid-circuit measurements Aer runs the circuit once and samples the shots from the final state
+    runs = 1 if analysis['ideal'] and not analysis['mid_circuit_measurement'] else shots
+    stabilizer_ok = analysis['clifford'] and analysis['pauli_noise']
+    chi = analysis['max_bond_dimension']
+
+    costs = []
+
+    costs.append({
+        'method': 'stabilizer',
+        'supported': stabilizer_ok,
+        'exact': True,
+        'memory_bytes': 2 * n * (2 * n + 1),
+        'operations': runs * gates * n * n,
+        'note': 'Clifford circuit with Pauli noise' if stabilizer_ok else
+                'needs Clifford gates and Pauli noise (non-Clifford: ' + ', '.join(sorted(analysis['non_clifford_gates'])) + ')'
+                if not analysis['clifford'] else 'noise model is not Pauli',
+    })
+
+    costs.append({
+        'method': 'extended_stabilizer',
+        'supported': analysis['pauli_noise'],
+        'exact': analysis['clifford'],
+        'memory_bytes': 2 * n * (2 * n + 1) * 2 ** (0.23 * analysis['t_count']),
+        'operations': runs * gates * n * n * 2 ** (0.23 * analysis['t_count']),
+        'note': 'T-count ' + str(analysis['t_count']) + ', approximate' if not analysis['clifford'] else 'reduces to stabilizer',
+    })
+
+    costs.append({
+        'method': 'matrix_product_state',
+        'supported': True,
+        'exact': True,
+        'memory_bytes': BYTES_PER_AMPLITUDE * n * 2 * chi * chi,
+        'operations': runs * gates * chi ** 3,
+        'note': 'bond dimension up to ' + str(chi),
+    })
+
+    costs.append({
+        'method': 'statevector',
+        'supported': True,
+        'exact': True,
+        'memory_bytes': BYTES_PER_AMPLITUDE * 2 ** n,
+        'operations': runs * gates * 2 ** n,
+        'note': 'noise by trajectories' if not analysis['ideal'] else '',
+    })
+
+    # one density matrix run covers every noise path; only mid-circuit measurements force a run per shot
+    density_runs = shots if analysis['mid_circuit_measurement'] else 1
+    costs.append({
+        'method': 'density_matrix',
+        'supported': True,
+        'exact': True,
+        'memory_bytes': BYTES_PER_AMPLITUDE * 4 ** n,
+        'operations': density_runs * gates * 4 ** n,
+        'note': '',
+    })
+
+    # every other gate is translated to the method's own gates by the transpiler (see get_method_noise_model), so
+    # the Clifford/Pauli requirement of the stabilizer method is the only restriction
+    return costs
+
+def select_simulation_method(circuit, noise_model=None, shots=1000, allow_approximate=False, max_memory_bytes=None):
+    # circuit should be the builder output - see get_method_noise_model() for the gates and noise it then runs with
+    # returns {'method': ..., 'analysis': ..., 'costs': ...}; the cheapest supported method that is exact
+    # (or approximate, if allowed) and fits in max_memory_bytes
+    analysis = analyze_circuit(circuit, noise_model)
+    costs = get_method_costs(analysis, shots)
+
+    candidates = [cost for cost in costs if cost['supported'] and (cost['exact'] or allow_approximate)]
+    if max_memory_bytes is not None:
+        fitting = [cost for cost in candidates if cost['memory_bytes'] <= max_memory_bytes]
+        if fitting:
+            candidates = fitting
+    best = min(candidates, key=lambda cost: (cost['operations'], METHOD_PREFERENCE.index(cost['method'])))
+
+    return {'method': best['method'], 'analysis': analysis, 'costs': costs}
+
+def get_method_noise_model(noise_model, method, circuit):
+    # (noise model, basis gates) to run the builder circuit with on `method`
+    basis_gates = noise_model.basis_gates if noise_model is not None else None
+    supported = get_supported_instructions(method)
+    if method not in STABILIZER_METHODS or supported is None:
+        return noise_model, basis_gates
+    basis_gates = sorted(supported)
+    if noise_model is None or noise_model.is_ideal() or not get_unsupported_gates(noise_model.noise_instructions, method):
+        return noise_model, basis_gates
+
+    from qiskit_aer.noise import NoiseModel
+
+    one_qubit_gates = set(instruction.operation.name for instruction in circuit.data
+                          if len(instruction.qubits) == 1 and instruction.operation.name not in NON_GATE_INSTRUCTIONS)
+    noise_dict = noise_model.to_dict()
+    for error in noise_dict.get('errors', []):
+        if error['type'] == 'roerror':
+            continue
+        num_qubits = 1 + max(qubit for instructions in error['instructions'] for instruction in instructions
+                             for qubit in instruction.get('qubits', [0]))
+        names = set(error['operations'])
+        if num_qubits == 1 and names - supported:
+            # each builder gate is one u1/u2/u3 gate after transpiling, so it carries the same error
+            error['operations'] = sorted((names & supported) | one_qubit_gates)
+    return NoiseModel.from_dict(noise_dict), basis_gates
+
+def format_bytes(num_bytes):
+    for unit in ('B', 'KB', 'MB', 'GB', 'TB', 'PB'):
+        if num_bytes < 1024:
+            return format(num_bytes, '.1f') + ' ' + unit
+        num_bytes = num_bytes / 1024
+    return format(num_bytes, '.1f') + ' EB'
+
+def print_method_report(selection):
+    analysis = selection['analysis']
+    print("Circuit: " + str(analysis['num_qubits']) + " qubits, " + str(analysis['num_gates']) + " gates, " +
+          ("Clifford" if analysis['clifford'] else "T-count " + str(analysis['t_count'])) +
+          (", mid-circuit measurement/reset" if analysis['mid_circuit_measurement'] else "") +
+          ", noise: " + ("none" if analysis['ideal'] else "Pauli" if analysis['pauli_noise'] else "general"))
+    print("  %-22s %-9s %-6s %12s %14s  %s" % ('method', 'supported', 'exact', 'memory', 'operations', 'note'))
+    for cost in selection['costs']:
+        marker = '*' if cost['method'] == selection['method'] else ' '
+        print(marker + " %-22s %-9s %-6s %12s %14s  %s" % (
+            cost['method'], 'yes' if cost['supported'] else 'no', 'yes' if cost['exact'] else 'no',
+            format_bytes(cost['memory_bytes']), '%.2e' % cost['operations'], cost['note']))
+    print("Selected method: " + selection['method'])
@@ -7,23 +7,17 @@
 # November 14, 2023 - David Shimkus - Initial Version 
 # November 26, 2023 - David Shimkus - Revisited the error generation and updated the code.  
 # November 27, 2023 - David Shimkus - Injected noise example from Qiskit documentation.  
+# October 19, 2026 - Split out get_model_for_probability() for parameter sweeps.
+# October 19, 2026 - IBMQ is only imported when it is needed, dropped unused qiskit imports.
 
 import numpy as np
 from datetime import datetime
 import random 
 
-from qiskit import *
-from qiskit import QuantumRegister
-from qiskit import ClassicalRegister
-from qiskit import QuantumCircuit
-from qiskit.circuit.library import *
-from qiskit_aer import AerSimulator
 import qiskit_aer.noise as noise
 #from qiskit_aer.noise import pauli_error
 #from qiskit_aer.noise import thermal_relaxation_error # there are more options available here!
 from qiskit_aer.noise import *
-from qiskit import *
-from qiskit import IBMQ
 
 def get_empty_model_and_gates():
 
@@ -41,6 +35,8 @@ def get_empty_model_and_gates():
     return noise_model
 
 def get_model_from_IBM():
+    from qiskit import IBMQ # only loaded when the IBM Brisbane noise model is requested
+
     IBMQ.save_account("e37d5b53d616af7d965cdaf92e16755f74470c0e96d7966f07920940a4f3277e9d63d1891599876a5d525857cfc1b3aa73d9d3061ada98f2b2161fda489df7ef")
     IBMQ.load_account()
     provider = IBMQ.load_account()
@@ -110,10 +106,23 @@ def get_model_and_gates():
     #p_meas = 0.1
     p_gate1 = 0.1
 
+    noise_model = get_model_for_probability(p_gate1)
+
+    print("Qiskit noise model: ",noise_model)
+
+    return noise_model
+
+# same construction as get_model_and_gates() for any probability - used by the threshold sweep
+# error_type is 'bit_flip' (X only, like above) or 'depolarizing'
+def get_model_for_probability(p_gate1, error_type='bit_flip'):
+
     # QuantumError objects
     #error_reset = pauli_error([('X', p_reset), ('I', 1 - p_reset)])
     #error_meas = pauli_error([('X',p_meas), ('I', 1 - p_meas)])
-    error_gate1 = pauli_error([('X',p_gate1), ('I', 1 - p_gate1)])
+    if error_type == 'depolarizing':
+        error_gate1 = depolarizing_error(p_gate1, 1)
+    else:
+        error_gate1 = pauli_error([('X',p_gate1), ('I', 1 - p_gate1)])
     error_gate2 = error_gate1.tensor(error_gate1)
 
     # add errors to noise model
@@ -123,8 +132,6 @@ def get_model_and_gates():
     noise_model.add_all_qubit_quantum_error(error_gate1, ["u1", "u2", "u3"])
     noise_model.add_all_qubit_quantum_error(error_gate2, ["cx"])
 
-    print("Qiskit noise model: ",noise_model)
-
     return noise_model
 
 def get_model_and_gates_bad_identities():
@@ -0,0 +1,113 @@
+# File: profiling.py
+# cProfile for the run phase of an experiment (circuit construction, transpile, simulation, tallying) without the
+# imports, menus and argument parsing around it - main.py --profile and threshold_sweep.py --profile, instead of
+# wrapping a script in python -m cProfile by hand.
+# The profile is written as a .prof file (pstats, snakeviz, ...) next to the results, and the hotspots are split by
+# self time into:
+#   simulator   qiskit_aer, including the time spent waiting for Aer's worker thread (the C++ simulation runs there,
+#               so cProfile only sees the main thread waiting on a lock)
+#   qiskit      circuit building and transpiling inside Qiskit
+#   project     the code in this repository (builders, dict tallying of the counts, ...)
+#   other       the standard library and everything else
+#
+# Usage:
+#   profiler = new_profiler()
+#   with profile_run(profiler):
+#       ... the run phase ...
+#   write_profile(profiler, 'steane.prof')
+#   print_hotspots(get_stats(profiler))
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+
+import cProfile
+import os
+import pstats
+from contextlib import contextmanager
+
+CATEGORIES = ('simulator', 'qiskit', 'project', 'other')
+
+PROJECT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# built-ins the main thread spends its time in while Aer simulates in its own thread
+SIMULATOR_WAIT_FUNCTIONS = ("<method 'acquire' of '_thread.lock' objects>", "<method 'wait' of '_thread.lock' objects>")
+
+def new_profiler():
+    return cProfile.Profile()
+
+@contextmanager
+def profile_run(profiler):
+    # profiler None: no profiling, so callers do not need two code paths
+    if profiler is None:
+        yield
+        return
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+
+def write_profile(profiler, filename):
+    profiler.dump_stats(filename)
+    print("Profile written to " + filename + " (python -m pstats " + filename + ")")
+    return filename
+
+def get_stats(profiler_or_filenames):
+    # a profiler, or .prof files (e.g. one per worker process) that are merged
+    if isinstance(profiler_or_filenames, cProfile.Profile):
+        return pstats.Stats(profiler_or_filenames)
+    filenames = [filename for filename in profiler_or_filenames if os.path.exists(filename)]
+    stats = pstats.Stats(filenames[0])
+    for filename in filenames[1:]:
+        stats.add(filename)
+    return stats
+
+def get_category(filename, function_name):
+    normalized = filename.replace('\\', '/')
+    if 'qiskit_aer' in normalized or 'qiskit_aer' in function_name or function_name in SIMULATOR_WAIT_FUNCTIONS:
+        return 'simulator'
+    if '/qiskit/' in normalized:
+        return 'qiskit'
+    if normalized.startswith(PROJECT_DIRECTORY.replace('\\', '/')) and '/site-packages/' not in normalized:
+        return 'project'
+    return 'other'
+
+def get_hotspots(stats, limit=10):
+    # {'categories': {category: self seconds}, 'total', 'functions': {category: [the slowest functions by self time]}}
+    categories = {category: 0.0 for category in CATEGORIES}
+    functions = {category: [] for category in CATEGORIES}
+    for (filename, line, function_name), (primitive_calls, calls, self_seconds, cumulative_seconds, callers) in stats.stats.items():
+        category = get_category(filename, function_name)
+        categories[category] += self_seconds
+        functions[category].append({
+            'function': function_name,
+            'location': filename if filename == '~' else os.path.basename(filename) + ':' + str(line),
+            'calls': calls,
+            'self_seconds': self_seconds,
+            'cumulative_seconds': cumulative_seconds,
+        })
+    for category in CATEGORIES:
+        functions[category] = sorted(functions[category], key=lambda entry: -entry['self_seconds'])[:limit]
+    return {'categories': categories, 'total': sum(categories.values()), 'functions': functions}
+
+def print_hotspots(stats, limit=10):
+    hotspots = get_hotspots(stats, limit)
+    total = hotspots['total'] or 1.0
+    print("Profile of the run phase: %.3f s" % hotspots['total'])
+    python_seconds = sum(hotspots['categories'][category] for category in CATEGORIES if category != 'simulator')
+    print("  simulator %10.3f s (%5.1f%%)" % (hotspots['categories']['simulator'], 100 * hotspots['categories']['simulator'] / total))
+    print("  python    %10.3f s (%5.1f%%)" % (python_seconds, 100 * python_seconds / total))
+    for category in CATEGORIES:
+        if category == 'simulator' or hotspots['categories'][category] == 0:
+            continue
+        print("    %-8s %9.3f s (%5.1f%%)" % (category, hotspots['categories'][category], 100 * hotspots['categories'][category] / total))
+
+    for category in CATEGORIES:
+        if not hotspots['functions'][category]:
+            continue
+        print("")
+        print("Top %s functions by self time:" % category)
+        print("  %10s %10s %9s  %s" % ('self s', 'cumul. s', 'calls', 'function'))
+        for entry in hotspots['functions'][category]:
+            print("  %10.4f %10.4f %9d  %s (%s)" % (entry['self_seconds'], entry['cumulative_seconds'], entry['calls'],
+                                                   entry['function'], entry['location']))
@@ -0,0 +1,153 @@
+# File: progress.py
+# Progress and throughput for long runs - a 1000 iteration loop used to print nothing until the end.
+# At most once every `interval` seconds one line is printed with the realizations/sec, shots/sec, the ETA and the
+# current logical error rate (with its Wilson interval).  With a snapshot file the same numbers are also written as
+# JSON every `snapshot_interval` seconds (atomically, so it can be read at any time), so a cluster job can be watched
+# with `cat` or `watch` instead of attaching to its terminal.
+#
+# Usage:
+#   progress = ProgressReporter('steane', total_realizations=num_loops, snapshot_filename='steane_progress.json')
+#   for i in range(num_loops):
+#       ...
+#       progress.update(shots=error_shots, errors=get_logical_error_count(counts))
+#   progress.finish()
+#
+#   estimate_logical_error_rate(run_batch, callback=ProgressReporter('steane', total_shots=max_shots).estimator_callback)
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+
+import json
+import os
+import platform
+import time
+
+from logical_error_statistics import wilson_interval
+
+def format_duration(seconds):
+    if seconds is None:
+        return '?'
+    seconds = int(round(seconds))
+    if seconds >= 3600:
+        return '%dh%02dm' % (seconds // 3600, seconds % 3600 // 60)
+    if seconds >= 60:
+        return '%dm%02ds' % (seconds // 60, seconds % 60)
+    return '%ds' % seconds
+
+class ProgressReporter:
+
+    def __init__(self, label, total_realizations=None, total_shots=None, interval=5.0, snapshot_filename=None,
+                 snapshot_interval=30.0, confidence=0.95):
+        # the ETA comes from total_realizations if given, otherwise from total_shots
+        self.label = label
+        self.total_realizations = total_realizations
+        self.total_shots = total_shots
+        self.interval = interval
+        self.snapshot_filename = snapshot_filename
+        self.snapshot_interval = snapshot_interval
+        self.confidence = confidence
+
+        self.realizations = 0
+        self.shots = 0
+        self.errors = 0
+        self.started = time.time()
+        self._start = time.perf_counter()
+        self._last_print = self._start
+        self._last_snapshot = self._start
+
+    def update(self, realizations=1, shots=0, errors=0):
+        # call once per realization (loop iteration) with its shots and logical errors
+        self.realizations = self.realizations + realizations
+        self.shots = self.shots + shots
+        self.errors = self.errors + errors
+        self._report()
+
+    def set_totals(self, shots, errors, realizations=None):
+        # for callers that keep their own running totals
+        self.shots = shots
+        self.errors = errors
+        if realizations is not None:
+            self.realizations = realizations
+        self._report()
+
+    def estimator_callback(self, num_shots, num_errors, rate, lower, upper):
+        # matches the callback of logical_error_statistics.estimate_logical_error_rate(), one realization per batch
+        self.set_totals(num_shots, num_errors, self.realizations + 1)
+
+    def _report(self):
+        now = time.perf_counter()
+        if now - self._last_print >= self.interval:
+            self._last_print = now
+            self.print_progress()
+        if self.snapshot_filename is not None and now - self._last_snapshot >= self.snapshot_interval:
+            self._last_snapshot = now
+            self.write_snapshot()
+
+    def get_snapshot(self):
+        elapsed = time.perf_counter() - self._start
+        realizations_per_second = self.realizations / elapsed if elapsed > 0 else None
+        shots_per_second = self.shots / elapsed if elapsed > 0 else None
+
+        fraction = None
+        if self.total_realizations:
+            fraction = self.realizations / float(self.total_realizations)
+        elif self.total_shots:
+            fraction = self.shots / float(self.total_shots)
+        eta_seconds = None
+        if fraction:
+            eta_seconds = max(elapsed / fraction - elapsed, 0.0)
+
+        rate = self.errors / float(self.shots) if self.shots else None
+        lower, upper = wilson_interval(self.errors, self.shots, self.confidence)
+        return {
+            'label': self.label,
+            'host': platform.node(),
+            'pid': os.getpid(),
+            'started': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started)),
+            'updated': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'elapsed_seconds': elapsed,
+            'realizations': self.realizations,
+            'total_realizations': self.total_realizations,
+            'shots': self.shots,
+            'total_shots': self.total_shots,
+            'errors': self.errors,
+            'fraction_done': fraction,
+            'realizations_per_second': realizations_per_second,
+            'shots_per_second': shots_per_second,
+            'eta_seconds': eta_seconds,
+            'logical_error_rate': rate,
+            'lower': lower,
+            'upper': upper,
+            'confidence': self.confidence,
+        }
+
+    def write_snapshot(self, filename=None):
+        if filename is None:
+            filename = self.snapshot_filename
+        temporary_filename = filename + '.tmp'
+        with open(temporary_filename, 'w') as f:
+            json.dump(self.get_snapshot(), f, indent=2)
+        os.replace(temporary_filename, filename) # readers never see a half written file
+
+    def print_progress(self, snapshot=None):
+        if snapshot is None:
+            snapshot = self.get_snapshot()
+        done = str(snapshot['realizations'])
+        if snapshot['total_realizations']:
+            done += '/' + str(snapshot['total_realizations'])
+        if snapshot['fraction_done'] is not None:
+            done += ' (%.1f%%)' % (100 * snapshot['fraction_done'])
+        line = "[%s] %s  %.2f realizations/s  %.1f shots/s  ETA %s" % (
+            snapshot['label'], done, snapshot['realizations_per_second'] or 0, snapshot['shots_per_second'] or 0,
+            format_duration(snapshot['eta_seconds']))
+        if snapshot['logical_error_rate'] is not None:
+            line += "  logical error rate %.4g [%.4g, %.4g] (%d/%d)" % (
+                snapshot['logical_error_rate'], snapshot['lower'], snapshot['upper'], snapshot['errors'], snapshot['shots'])
+        print(line, flush=True)
+
+    def finish(self):
+        snapshot = self.get_snapshot()
+        self.print_progress(snapshot)
+        if self.snapshot_filename is not None:
+            self.write_snapshot()
+        return snapshot
@@ -0,0 +1,158 @@
+# File: rare_event_sampling.py
+# Stratified ("rare event") estimator for the logical error rate at very small physical error rates.
+# With p_gate1 = 0.000001 (see get_model_and_gates_bad_identities in new_noise_refused.py) almost every
+# naive shot is error free, so plain sampling needs on the order of 1e8 shots to see anything.
+# Instead we sample configurations with exactly k faults, estimate the failure rate f_k for each k, and
+# weight the strata with the binomial probability of k faults occurring:
+#
+#       P_L = sum_k  Binomial(k; N, p) * f_k       (N = number of fault locations in the circuit)
+#
+# Strata above k_max are not simulated - their total probability is added to the upper confidence bound.
+# The fault-free circuit is deterministic (it never fails), so f_0 = 0 exactly and k = 0 is not simulated.
+# Every sampled configuration is distinct (a repeated configuration would only repeat the same trial); when a stratum
+# has no more configurations than samples, all of them are simulated.  The interval is the normal interval of the
+# stratified estimator, sum_k w_k^2 f_k (1 - f_k) / n_k, with Agresti-Coull f_k so strata without errors still count.
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - f_0 = 0 exactly, distinct configurations only, stratified variance instead of summed Wilson bounds.
+# October 19, 2026 - Paulis drawn uniformly, so a biased channel is weighted by its probabilities once instead of twice.
+
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+from qiskit import execute
+from qiskit_aer import AerSimulator
+
+from fault_injection import get_fault_locations, inject_faults
+from logical_error_statistics import get_logical_error_count
+
+def binomial_probability(k, n, p):
+    # computed in log space - comb(n, k) alone overflows a float for the larger circuits
+    if k < 0 or k > n:
+        return 0.0
+    if p == 0:
+        return 1.0 if k == 0 else 0.0
+
+    log_probability = (math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+                       + k * math.log(p) + (n - k) * math.log1p(-p))
+    return math.exp(log_probability)
+
+def get_num_configurations(num_locations, k, num_paulis):
+    return math.comb(num_locations, k) * num_paulis ** k
+
+def sample_fault_configurations(num_locations, k, num_samples, paulis, rng, max_attempts_factor=20):
+    # up to num_samples distinct configurations, drawn uniformly - locations and Paulis alike; the caller weights each
+    # configuration by the probability of its Paulis (drawing them from paulis as well would count that twice)
+    labels = [label for label, probability in paulis.items() if probability > 0]
+
+    num_samples = min(num_samples, get_num_configurations(num_locations, k, len(labels)))
+    configurations = set()
+    attempts = 0
+    while len(configurations) < num_samples and attempts < max_attempts_factor * num_samples:
+        attempts = attempts + 1
+        chosen_locations = rng.choice(num_locations, size=k, replace=False)
+        chosen_paulis = rng.choice(len(labels), size=k)
+        configurations.add(tuple(sorted(zip(chosen_locations.tolist(), [labels[j] for j in chosen_paulis]))))
+
+    return sorted(configurations)
+
+def estimate_rare_event_logical_error_rate(circuit, p, paulis=None, k_max=4, samples_per_stratum=250,
+                                           shots_per_sample=1, gate_names=None, simulator=None,
+                                           seed=None, confidence=0.95):
+    # circuit should be the noiseless builder output (new_steane_circuit(), new_bit_flip_circuit(), ...)
+    # p is the probability of a (non-identity) fault at each location
+    # paulis is the conditional distribution of the fault, e.g. {'X': 1.0} for the bit flip models in
+    # new_noise_refused.py or {'X': 1/3, 'Y': 1/3, 'Z': 1/3} for a depolarizing channel
+    if paulis is None:
+        paulis = {'X': 1.0}
+    if simulator is None:
+        simulator = AerSimulator(method='statevector')
+
+    rng = np.random.default_rng(seed)
+
+    locations = get_fault_locations(circuit, gate_names)
+    num_locations = len(locations)
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    strata = [{
+        'k': 0,
+        'weight': binomial_probability(0, num_locations, p),
+        'num_errors': 0,
+        'num_trials': 0,
+        'num_unique_configurations': 1,
+        'failure_rate': 0.0, # without a fault the circuit always prepares the logical Bell pair
+        'variance': 0.0,
+    }]
+    num_simulations = 0
+
+    for k in range(1, min(k_max, num_locations) + 1):
+        weight = binomial_probability(k, num_locations, p)
+        configurations = sample_fault_configurations(num_locations, k, samples_per_stratum, paulis, rng)
+
+        circuits = []
+        for configuration in configurations:
+            faults = [(locations[location][0], locations[location][1], pauli) for location, pauli in configuration]
+            circuits.append(inject_faults(circuit, faults))
+
+        # one batched call per stratum - Aer spreads the experiments over the available threads
+        result = execute(circuits, simulator, shots=shots_per_sample,
+                         seed_simulator=int(rng.integers(2**31))).result()
+        num_simulations = num_simulations + len(circuits)
+
+        # each distinct configuration weighted by the probability of its Paulis (all equal for {'X': 1.0} or a
+        # symmetric depolarizing channel); num_trials is the effective sample size of that weighted mean
+        probabilities = [math.prod(paulis[pauli] for location, pauli in configuration) for configuration in configurations]
+        fractions = [get_logical_error_count(result.get_counts(i)) / shots_per_sample for i in range(len(circuits))]
+        failure_rate = sum(q * f for q, f in zip(probabilities, fractions)) / sum(probabilities)
+        num_trials = sum(probabilities) ** 2 / sum(q * q for q in probabilities) * shots_per_sample
+        num_errors = failure_rate * num_trials
+
+        # Agresti-Coull adjusted rate for the variance, so a stratum without errors is not "exactly zero"
+        adjusted_rate = (num_errors + z * z / 2) / (num_trials + z * z)
+        strata.append({
+            'k': k,
+            'weight': weight,
+            'num_errors': num_errors,
+            'num_trials': num_trials,
+            'num_unique_configurations': len(configurations),
+            'failure_rate': failure_rate,
+            'variance': adjusted_rate * (1 - adjusted_rate) / (num_trials + z * z),
+        })
+
+    # probability of more faults than we simulated - assume the worst (always fails) for the upper bound
+    tail_probability = max(0.0, 1.0 - sum(stratum['weight'] for stratum in strata))
+
+    logical_error_rate = sum(stratum['weight'] * stratum['failure_rate'] for stratum in strata)
+    half_width = z * math.sqrt(sum(stratum['weight'] ** 2 * stratum['variance'] for stratum in strata))
+    lower = max(0.0, logical_error_rate - half_width)
+    upper = logical_error_rate + half_width + tail_probability
+
+    return {
+        'logical_error_rate': logical_error_rate,
+        'lower': lower,
+        'upper': min(1.0, upper),
+        'confidence': confidence,
+        'physical_error_rate': p,
+        'num_locations': num_locations,
+        'tail_probability': tail_probability,
+        'num_simulations': num_simulations,
+        'strata': strata,
+    }
+
+if __name__ == '__main__':
+    from bell_state_with_steane import new_steane_circuit
+
+    # same probability as get_model_and_gates_bad_identities()
+    estimate = estimate_rare_event_logical_error_rate(new_steane_circuit(), p=0.000001, paulis={'X': 1.0}, seed=1234)
+
+    print("Fault locations: " + str(estimate['num_locations']))
+    for stratum in estimate['strata']:
+        print('k=' + str(stratum['k']) + ' weight=' + str(stratum['weight']) +
+              ' failure rate=' + str(stratum['failure_rate']) +
+              ' (' + str(stratum['num_unique_configurations']) + ' unique configurations)')
+    print('Logical error rate: ' + str(estimate['logical_error_rate']))
+    print(str(int(estimate['confidence'] * 100)) + '% interval: [' + str(estimate['lower']) + ', ' + str(estimate['upper']) + ']')
+    print('Simulations: ' + str(estimate['num_simulations']))
@@ -0,0 +1,154 @@
+# File: resource_estimator.py
+# Pre-flight check before a local simulation allocates anything: predicts memory and runtime from the circuit
+# (width, gates, mid-circuit measurements), the method, the noise type and the shots, and compares them with what
+# this machine has.  A run that cannot fit is either rerouted to the cheapest method that does, or refused with a
+# clear message - instead of finding out 20 minutes in (see the "#number_qubits = 28 #max that can be done on two
+# T600's" notes in the scripts).
+#
+# Runtime = overhead_seconds + seconds_per_operation * operations, with the operation counts from method_selection.py
+# and the coefficients from the benchmark reference profile (reference_profile.json, see scaling_benchmark.py) or
+# the rough defaults below.
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - Memory estimates scaled by the measured memory_factor / memory_base_bytes of the reference profile.
+# October 19, 2026 - ResourceCheckError, so callers can tell a refused run from any other RuntimeError.
+# October 19, 2026 - GPU memory from backend_registry.py.
+# October 19, 2026 - Reference profile only used on the host and Aer version it was measured with.
+
+import json
+import os
+
+from method_selection import analyze_circuit, format_bytes, get_method_costs
+
+REFERENCE_PROFILE_FILENAME = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reference_profile.json')
+
+# seconds per estimated operation (see method_selection.py) - order of magnitude only, replaced by measured values
+DEFAULT_COEFFICIENTS = {
+    'stabilizer': {'CPU': {'seconds_per_operation': 2e-9, 'overhead_seconds': 0.05}},
+    'extended_stabilizer': {'CPU': {'seconds_per_operation': 5e-9, 'overhead_seconds': 0.05}},
+    'matrix_product_state': {'CPU': {'seconds_per_operation': 2e-9, 'overhead_seconds': 0.05}},
+    'statevector': {'CPU': {'seconds_per_operation': 1e-9, 'overhead_seconds': 0.05},
+                    'GPU': {'seconds_per_operation': 1e-10, 'overhead_seconds': 0.5}},
+    'density_matrix': {'CPU': {'seconds_per_operation': 1e-9, 'overhead_seconds': 0.05},
+                       'GPU': {'seconds_per_operation': 1e-10, 'overhead_seconds': 0.5}},
+}
+
+# leave room for Python, Qiskit and the operating system
+MEMORY_FRACTION = 0.8
+
+class ResourceCheckError(RuntimeError):
+    # the run does not fit this machine (and could not be rerouted)
+    pass
+
+def is_reference_profile_current(profile):
+    # measured values only hold for the host and the Aer build they were measured with
+    import qiskit_aer
+    from blocking_autotuner import get_host_name
+
+    return profile.get('host') == get_host_name() and profile.get('qiskit_aer') == qiskit_aer.__version__
+
+def load_coefficients(filename=None):
+    # the defaults, overridden by whatever the reference profile measured
+    if filename is None:
+        filename = REFERENCE_PROFILE_FILENAME
+    coefficients = {method: dict(devices) for method, devices in DEFAULT_COEFFICIENTS.items()}
+    if os.path.exists(filename):
+        with open(filename) as f:
+            profile = json.load(f)
+        measured = profile.get('coefficients', {}) if is_reference_profile_current(profile) else {}
+        for method, devices in measured.items():
+            coefficients.setdefault(method, {}).update(devices)
+    return coefficients
+
+def get_available_memory_bytes():
+    # MemAvailable from /proc/meminfo (Linux), otherwise the free physical pages
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def get_available_gpu_memory_bytes(num_gpus=1):
+    # with blocking Aer spreads the chunks over every GPU, so the usable memory is the total
+    from backend_registry import get_gpu_memory_bytes
+
+    memory_bytes = get_gpu_memory_bytes()
+    if memory_bytes is None:
+        return None
+    return memory_bytes * max(num_gpus, 1)
+
+def estimate_resources(analysis, method, device='CPU', shots=1000, coefficients=None):
+    if coefficients is None:
+        coefficients = load_coefficients()
+    cost = next(cost for cost in get_method_costs(analysis, shots) if cost['method'] == method)
+    device_coefficients = coefficients.get(method, {})
+    coefficient = device_coefficients.get(device) or device_coefficients.get('CPU') or DEFAULT_COEFFICIENTS['statevector']['CPU']
+    return {
+        'method': method,
+        'device': device,
+        'supported': cost['supported'],
+        'exact': cost['exact'],
+        'memory_bytes': coefficient.get('memory_base_bytes', 0) + coefficient.get('memory_factor', 1) * cost['memory_bytes'],
+        'seconds': coefficient['overhead_seconds'] + coefficient['seconds_per_operation'] * cost['operations'],
+    }
+
+def check_resources(circuit, noise_model=None, shots=1000, method='statevector', device='CPU', num_gpus=1,
+                    max_seconds=None, reroute=True, allow_approximate=False):
+    # returns the estimate for the method that will run (estimate['rerouted_from'] is set if that is not `method`);
+    # raises ResourceCheckError if nothing fits
+    analysis = analyze_circuit(circuit, noise_model)
+    coefficients = load_coefficients()
+
+    cpu_available_bytes = get_available_memory_bytes()
+    available_bytes = cpu_available_bytes
+    if device == 'GPU':
+        available_bytes = get_available_gpu_memory_bytes(num_gpus) or cpu_available_bytes
+
+    def fits(estimate, available_bytes):
+        if available_bytes is not None and estimate['memory_bytes'] > available_bytes * MEMORY_FRACTION:
+            return False
+        return max_seconds is None or estimate['seconds'] <= max_seconds
+
+    estimate = estimate_resources(analysis, method, device, shots, coefficients)
+    estimate['available_bytes'] = available_bytes
+    estimate['rerouted_from'] = None
+    if fits(estimate, available_bytes):
+        return estimate
+
+    problem = (method + " on the " + device + " needs about " + format_bytes(estimate['memory_bytes']) +
+               " and " + format(estimate['seconds'], '.1f') + " seconds for " + str(analysis['num_qubits']) + " qubits")
+    if available_bytes is not None:
+        problem += ", " + format_bytes(available_bytes * MEMORY_FRACTION) + " is available"
+    if max_seconds is not None:
+        problem += ", the limit is " + format(max_seconds, '.1f') + " seconds"
+
+    if reroute:
+        alternatives = []
+        for cost in get_method_costs(analysis, shots):
+            if cost['method'] == method or not cost['supported'] or not (cost['exact'] or allow_approximate):
+                continue
+            # the cheaper methods only run on the CPU (see method_selection.GPU_METHODS)
+            alternative = estimate_resources(analysis, cost['method'], 'CPU', shots, coefficients)
+            if fits(alternative, cpu_available_bytes):
+                alternatives.append(alternative)
+        if alternatives:
+            best = min(alternatives, key=lambda alternative: alternative['seconds'])
+            best['available_bytes'] = cpu_available_bytes
+            best['rerouted_from'] = method
+            print("Pre-flight: " + problem + " - switching to " + best['method'])
+            return best
+
+    raise ResourceCheckError("Pre-flight check failed: " + problem + ".  Try fewer qubits, another method or a larger machine.")
+
+def print_resource_estimate(estimate):
+    available = 'unknown' if estimate['available_bytes'] is None else format_bytes(estimate['available_bytes'])
+    print("Pre-flight estimate (" + estimate['method'] + " on the " + estimate['device'] + "): " +
+          format_bytes(estimate['memory_bytes']) + " of " + available + " available, about " +
+          format(estimate['seconds'], '.2f') + " seconds")
@@ -0,0 +1,103 @@
+# File: result_cache.py
+# Result cache keyed by (circuit fingerprint, backend, noise fingerprint, shots, seed).
+# A seeded simulation is deterministic, so rerunning main.py with the same choices can return the stored counts
+# instead of simulating again.  Hardware runs are never deterministic, but paying twice for the same job is worse:
+# the job id is stored as soon as the job is submitted and the counts once they are retrieved, so a rerun
+# (even after a crash while waiting in the queue) picks up the existing job instead of resubmitting.
+# The cache lives in the same SQLite file as the results store.
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - IBM submit and queue wait timed as spans (instrumentation.py).
+# October 19, 2026 - A stored job id that can no longer be retrieved is dropped and the job resubmitted.
+
+import hashlib
+import json
+import time
+
+from instrumentation import span
+from results_store import get_backend_name, get_circuit_fingerprint, get_noise_fingerprint, open_results_store
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cached_results (
+    key TEXT PRIMARY KEY,
+    backend TEXT,
+    shots INTEGER,
+    seed INTEGER,
+    job_id TEXT,
+    counts TEXT,
+    created REAL
+);
+"""
+
+def open_result_cache(path='results.sqlite'):
+    connection = open_results_store(path)
+    connection.executescript(SCHEMA)
+    return connection
+
+def get_cache_key(circuit, backend, shots, seed=None, noise_model=None):
+    parts = [get_circuit_fingerprint(circuit), get_backend_name(backend), get_noise_fingerprint(noise_model),
+             str(shots), str(seed)]
+    return hashlib.sha256('|'.join(parts).encode()).hexdigest()
+
+def get_cached_entry(connection, key):
+    row = connection.execute('SELECT job_id, counts FROM cached_results WHERE key = ?', (key,)).fetchone()
+    if row is None:
+        return None
+    return {'job_id': row[0], 'counts': json.loads(row[1]) if row[1] is not None else None}
+
+def store_entry(connection, key, backend_name, shots, seed=None, job_id=None, counts=None):
+    # keeps an already stored job id/counts if the new values are missing
+    connection.execute(
+        'INSERT INTO cached_results (key, backend, shots, seed, job_id, counts, created) VALUES (?, ?, ?, ?, ?, ?, ?) '
+        'ON CONFLICT(key) DO UPDATE SET job_id = COALESCE(excluded.job_id, job_id), counts = COALESCE(excluded.counts, counts)',
+        (key, backend_name, shots, seed, job_id, json.dumps(counts, sort_keys=True) if counts is not None else None, time.time()))
+    connection.commit()
+
+def delete_entry(connection, key):
+    connection.execute('DELETE FROM cached_results WHERE key = ?', (key,))
+    connection.commit()
+
+def run_simulation_with_cache(connection, circuit, simulator, shots, seed, noise_model, run):
+    # run() performs the simulation and returns the counts
+    # without a seed the simulation is not reproducible, so nothing is cached (connection may then be None)
+    if seed is None:
+        return run()
+
+    key = get_cache_key(circuit, simulator, shots, seed, noise_model)
+    entry = get_cached_entry(connection, key)
+    if entry is not None and entry['counts'] is not None:
+        print("Using cached counts (same circuit, simulator, noise model, shots and seed)")
+        return entry['counts']
+
+    counts = run()
+    store_entry(connection, key, get_backend_name(simulator), shots, seed, counts=counts)
+    return counts
+
+def run_hardware_with_cache(connection, circuit, backend, shots, submit):
+    # submit() sends the job and returns it; the key ignores the seed since hardware is never seeded
+    key = get_cache_key(circuit, backend, shots)
+    entry = get_cached_entry(connection, key)
+
+    if entry is not None and entry['counts'] is not None:
+        print("Using the stored result of job " + str(entry['job_id']) + " instead of resubmitting")
+        return entry['counts']
+
+    job = None
+    if entry is not None and entry['job_id'] is not None:
+        print("Reattaching to previously submitted job " + entry['job_id'])
+        try:
+            job = backend.retrieve_job(entry['job_id'])
+        except Exception as error: # expired on the provider, another account, or a FakeQueuedBackend from an earlier run
+            print("Could not retrieve job " + entry['job_id'] + " (" + repr(error) + "), resubmitting")
+            delete_entry(connection, key)
+
+    if job is None:
+        with span('ibm_submit'):
+            job = submit()
+        store_entry(connection, key, get_backend_name(backend), shots, job_id=job.job_id())
+
+    with span('ibm_queue_wait'): # queue plus run time on the device
+        counts = job.result().get_counts()
+    store_entry(connection, key, get_backend_name(backend), shots, job_id=job.job_id(), counts=counts)
+    return counts
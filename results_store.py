@@ -0,0 +1,192 @@
+# File: results_store.py
+# Append-only SQLite store for experiment results so that long runs can be resumed.
+# Every batch of shots is written as its own row (circuit hash, noise hash, seed, counts, timings) as soon as
+# it finishes.  When a 1000-loop run or an IBM job dies halfway, rerunning the same experiment skips the
+# batches that are already in the store.
+# SQLite ships with Python, and the indexes below keep lookups fast across thousands of sweep points.
+#
+# A batch is only reused by a run with the same backend, shots per batch and base seed - a rerun with other --shots
+# or another seed starts its own batches instead of mixing the old ones into its totals.
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - Backend, shots and base seed are part of a batch's key.
+# October 19, 2026 - Totals only count the batches the run asked for; first_batch so a loop can resume batch by batch.
+
+import hashlib
+import json
+import sqlite3
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    experiment TEXT NOT NULL,
+    batch_index INTEGER NOT NULL,
+    circuit_hash TEXT NOT NULL,
+    noise_hash TEXT NOT NULL,
+    backend TEXT NOT NULL DEFAULT '',
+    base_seed INTEGER NOT NULL DEFAULT -1,
+    seed INTEGER,
+    shots INTEGER NOT NULL,
+    counts TEXT NOT NULL,
+    parameters TEXT,
+    started REAL,
+    finished REAL,
+    duration REAL,
+    UNIQUE (experiment, circuit_hash, noise_hash, backend, shots, base_seed, batch_index)
+);
+CREATE INDEX IF NOT EXISTS batches_by_point ON batches (experiment, circuit_hash, noise_hash);
+CREATE INDEX IF NOT EXISTS batches_by_noise ON batches (noise_hash);
+"""
+
+# base_seed of unseeded batches (hardware) - NULL would make every row unique in SQLite
+NO_SEED = -1
+
+COLUMNS = ('experiment', 'batch_index', 'circuit_hash', 'noise_hash', 'backend', 'base_seed', 'seed', 'shots', 'counts',
+           'parameters', 'started', 'finished', 'duration')
+
+def get_circuit_fingerprint(circuit):
+    # OpenQASM text is a stable description of the circuit, hash it
+    try:
+        from qiskit import qasm2
+        text = qasm2.dumps(circuit)
+    except ImportError:
+        text = circuit.qasm()
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def get_noise_fingerprint(noise_model):
+    if noise_model is None or noise_model.is_ideal():
+        return 'ideal'
+    text = json.dumps(noise_model.to_dict(serializable=True), sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+def get_backend_name(backend):
+    # BackendV1 (IBMQ, older Aer) has name(), BackendV2 has a name attribute
+    return backend.name if isinstance(backend.name, str) else backend.name()
+
+def open_results_store(path='results.sqlite'):
+    connection = sqlite3.connect(path)
+    connection.execute('PRAGMA journal_mode=WAL') # readers do not block the running experiment
+    migrate_results_store(connection)
+    connection.executescript(SCHEMA)
+    return connection
+
+def migrate_results_store(connection):
+    # stores from before base_seed existed: rebuilt with the new key, the base seed recovered from seed - batch_index
+    columns = [row[1] for row in connection.execute('PRAGMA table_info(batches)')]
+    if not columns or 'base_seed' in columns:
+        return
+    connection.executescript(
+        'DROP INDEX IF EXISTS batches_by_point; DROP INDEX IF EXISTS batches_by_noise; '
+        'ALTER TABLE batches RENAME TO batches_before_base_seed;' + SCHEMA +
+        "INSERT OR IGNORE INTO batches (" + ', '.join(COLUMNS) + ") SELECT experiment, batch_index, circuit_hash, "
+        "noise_hash, COALESCE(backend, ''), COALESCE(seed - batch_index, " + str(NO_SEED) + "), seed, shots, counts, "
+        "parameters, started, finished, duration FROM batches_before_base_seed; "
+        'DROP TABLE batches_before_base_seed;')
+    connection.commit()
+
+def record_batch(connection, experiment, batch_index, circuit_hash, noise_hash, shots, counts,
+                 seed=None, backend=None, parameters=None, started=None, finished=None, base_seed=None):
+    # rows are never updated - a batch that is already recorded is left alone
+    duration = finished - started if started is not None and finished is not None else None
+    connection.execute(
+        'INSERT OR IGNORE INTO batches (' + ', '.join(COLUMNS) + ') VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        (experiment, batch_index, circuit_hash, noise_hash, backend or '', NO_SEED if base_seed is None else base_seed,
+         seed, shots, json.dumps(counts, sort_keys=True),
+         json.dumps(parameters, sort_keys=True) if parameters is not None else None, started, finished, duration))
+    connection.commit() # commit every batch, a crash should lose at most the batch in flight
+
+def get_completed_batches(connection, experiment, circuit_hash, noise_hash, shots, base_seed=None, backend=None):
+    rows = connection.execute(
+        'SELECT batch_index FROM batches WHERE experiment = ? AND circuit_hash = ? AND noise_hash = ? AND shots = ? '
+        'AND base_seed = ? AND backend = ?',
+        (experiment, circuit_hash, noise_hash, shots, NO_SEED if base_seed is None else base_seed, backend or ''))
+    return set(row[0] for row in rows)
+
+def get_batches(connection, experiment=None, circuit_hash=None, noise_hash=None, shots=None, base_seed=None, backend=None):
+    query = 'SELECT ' + ', '.join(COLUMNS) + ' FROM batches'
+    conditions = []
+    arguments = []
+    for column, value in (('experiment', experiment), ('circuit_hash', circuit_hash), ('noise_hash', noise_hash),
+                          ('shots', shots), ('base_seed', base_seed), ('backend', backend)):
+        if value is not None:
+            conditions.append(column + ' = ?')
+            arguments.append(value)
+    if conditions:
+        query = query + ' WHERE ' + ' AND '.join(conditions)
+    query = query + ' ORDER BY experiment, circuit_hash, noise_hash, backend, shots, base_seed, batch_index'
+
+    batches = []
+    for row in connection.execute(query, arguments):
+        batch = dict(zip(COLUMNS, row))
+        batch['counts'] = json.loads(batch['counts'])
+        batch['parameters'] = json.loads(batch['parameters']) if batch['parameters'] is not None else None
+        batches.append(batch)
+    return batches
+
+def get_total_counts(connection, experiment, circuit_hash=None, noise_hash=None, shots=None, base_seed=None, backend=None,
+                     batch_indices=None):
+    # batch_indices (e.g. a range) leaves out batches an earlier, longer run stored under the same key
+    total_counts = {}
+    for batch in get_batches(connection, experiment, circuit_hash, noise_hash, shots, base_seed, backend):
+        if batch_indices is not None and batch['batch_index'] not in batch_indices:
+            continue
+        for key, value in batch['counts'].items():
+            total_counts[key] = total_counts.get(key, 0) + value
+    return total_counts
+
+def get_experiment_summary(connection):
+    # one row per sweep point - aggregated in SQLite so this stays fast for large stores
+    rows = connection.execute(
+        'SELECT experiment, circuit_hash, noise_hash, backend, base_seed, COUNT(*), SUM(shots), SUM(duration) FROM batches '
+        'GROUP BY experiment, circuit_hash, noise_hash, backend, shots, base_seed ORDER BY experiment')
+    return [{'experiment': row[0], 'circuit_hash': row[1], 'noise_hash': row[2], 'backend': row[3], 'base_seed': row[4],
+             'num_batches': row[5], 'shots': row[6], 'duration': row[7]} for row in rows]
+
+def run_batches_with_resume(connection, experiment, circuit, simulator, num_batches, shots,
+                            noise_model=None, base_seed=0, parameters=None, run_options=None, first_batch=0, verbose=True):
+    # runs batch first_batch..num_batches-1 with seed base_seed + batch_index, skipping whatever is already stored
+    # returns the counts summed over those batches (stored and new)
+    # a loop that needs every batch's counts on its own calls this once per iteration with first_batch=i, num_batches=i + 1
+    from qiskit import transpile
+
+    if run_options is None:
+        run_options = {}
+
+    circuit_hash = get_circuit_fingerprint(circuit)
+    noise_hash = get_noise_fingerprint(noise_model)
+    backend_name = get_backend_name(simulator)
+    batch_indices = range(first_batch, num_batches)
+    completed = get_completed_batches(connection, experiment, circuit_hash, noise_hash, shots, base_seed, backend_name)
+    completed = set(batch_index for batch_index in completed if batch_index in batch_indices)
+
+    if completed and verbose:
+        print('Resuming ' + experiment + ': ' + str(len(completed)) + ' of ' + str(len(batch_indices)) + ' batches already done')
+
+    transpiled_circuit = None
+    for batch_index in batch_indices:
+        if batch_index in completed:
+            continue
+        if transpiled_circuit is None:
+            transpiled_circuit = transpile(circuit, simulator)
+
+        seed = base_seed + batch_index
+        started = time.time()
+        counts = simulator.run(transpiled_circuit, shots=shots, seed_simulator=seed, **run_options).result().get_counts()
+        finished = time.time()
+
+        record_batch(connection, experiment, batch_index, circuit_hash, noise_hash, shots, counts, seed=seed,
+                     backend=backend_name, parameters=parameters, started=started, finished=finished,
+                     base_seed=base_seed)
+
+    return get_total_counts(connection, experiment, circuit_hash, noise_hash, shots, base_seed, backend_name, batch_indices)
+
+if __name__ == '__main__':
+    import sys
+
+    connection = open_results_store(sys.argv[1] if len(sys.argv) > 1 else 'results.sqlite')
+    for point in get_experiment_summary(connection):
+        print(point['experiment'] + ' circuit=' + point['circuit_hash'][:12] + ' noise=' + point['noise_hash'][:12] +
+              ' backend=' + point['backend'] + ' base seed=' + str(point['base_seed']) + ' batches=' + str(point['num_batches']) + ' shots=' + str(point['shots']) +
+              ' seconds=' + str(point['duration']))
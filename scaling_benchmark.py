@@ -0,0 +1,227 @@
+# File: scaling_benchmark.py
+# CPU scaling benchmark, generalized from old/divincenzo_correction.py (one QuantumVolume(24, 10) circuit with
+# blocking_qubits=22 and a single printed time).  Sweeps qubit count, depth, thread count, blocking size and method,
+# runs every point in a fresh process so its peak memory can be measured, fits the time and memory scaling and
+# stores the result as the reference profile used by resource_estimator.py (runtime/memory coefficients) and
+# blocking_autotuner.py (best blocking size per width).
+#
+# Usage:
+#   python scaling_benchmark.py --qubits 12 16 17 18 20 24 --depths 5 10 --threads 1 0 --blocking none 14 18 22 \
+#       --methods statevector matrix_product_state --output reference_profile.json
+#   (--threads 0 means every core)
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - Peak RSS from instrumentation.py.
+# October 19, 2026 - 17 and 18 qubits (the Steane and Shor circuits) in the default widths, host named like the autotuner.
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from instrumentation import get_peak_rss_bytes
+from resource_estimator import MEMORY_FRACTION, REFERENCE_PROFILE_FILENAME, get_available_memory_bytes
+
+BLOCKING_METHODS = ('statevector', 'density_matrix')
+
+def run_point(point):
+    # runs inside the child process
+    from qiskit import transpile
+    from qiskit.circuit.library import QuantumVolume
+    from qiskit_aer import AerSimulator
+    from method_selection import analyze_circuit, get_method_costs
+
+    simulator_options = {'method': point['method'], 'max_parallel_threads': point['threads']}
+    simulator = AerSimulator(**simulator_options)
+
+    circuit = QuantumVolume(point['num_qubits'], point['depth'], seed=point['seed'])
+    circuit.measure_all()
+    transpiled_circuit = transpile(circuit, simulator)
+
+    analysis = analyze_circuit(transpiled_circuit)
+    cost = next(cost for cost in get_method_costs(analysis, point['shots']) if cost['method'] == point['method'])
+
+    run_options = {'shots': point['shots'], 'seed_simulator': point['seed']}
+    if point['blocking_qubits'] is not None:
+        run_options['blocking_enable'] = True
+        run_options['blocking_qubits'] = point['blocking_qubits']
+
+    baseline_bytes = get_peak_rss_bytes()
+    start = time.perf_counter()
+    result = simulator.run(transpiled_circuit, **run_options).result()
+    seconds = time.perf_counter() - start
+
+    return dict(point,
+                success=bool(result.success),
+                seconds=seconds,
+                peak_rss_bytes=get_peak_rss_bytes(),
+                memory_bytes=max(get_peak_rss_bytes() - baseline_bytes, 0),
+                estimated_memory_bytes=cost['memory_bytes'],
+                operations=cost['operations'],
+                transpiled_depth=transpiled_circuit.depth())
+
+def run_point_in_subprocess(point, timeout=None):
+    # a fresh interpreter per point so the peak memory belongs to that point only
+    try:
+        completed = subprocess.run([sys.executable, __file__, '--point', json.dumps(point)],
+                                   capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return dict(point, success=False, error='timed out after ' + str(timeout) + ' seconds')
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else 'exit code ' + str(completed.returncode)
+        return dict(point, success=False, error=error)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def get_points(qubits, depths, threads, blocking, methods, shots=100, seed=12354):
+    # every combination that makes sense and fits in memory
+    available_bytes = get_available_memory_bytes()
+    points = []
+    for method in methods:
+        for num_qubits in qubits:
+            amplitudes = 4 ** num_qubits if method == 'density_matrix' else 2 ** num_qubits
+            if method in BLOCKING_METHODS and available_bytes is not None and 16 * amplitudes > available_bytes * MEMORY_FRACTION:
+                print("Skipping " + method + " with " + str(num_qubits) + " qubits - it does not fit in memory")
+                continue
+            for depth in depths:
+                for thread_count in threads:
+                    for blocking_qubits in blocking:
+                        if blocking_qubits is not None and (method not in BLOCKING_METHODS or blocking_qubits >= num_qubits):
+                            continue
+                        points.append({
+                            'method': method,
+                            'num_qubits': num_qubits,
+                            'depth': depth,
+                            'threads': thread_count,
+                            'blocking_qubits': blocking_qubits,
+                            'shots': shots,
+                            'seed': seed,
+                        })
+    return points
+
+def fit_linear(x, y):
+    # y = intercept + slope * x with both non-negative
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if len(x) >= 2 and np.ptp(x) > 0:
+        slope, intercept = np.polyfit(x, y, 1)
+        if slope > 0 and intercept >= 0:
+            return float(intercept), float(slope)
+    # through the origin
+    return 0.0, float(np.sum(x * y) / np.sum(x * x)) if np.sum(x * x) > 0 else 0.0
+
+def fit_reference_profile(points):
+    # coefficients per method on the CPU, from the points that used every core and no blocking (the defaults)
+    finished = [point for point in points if point.get('success')]
+    max_threads = {}
+    for point in finished:
+        max_threads[point['method']] = max(max_threads.get(point['method'], 0), point['threads'] or 10 ** 6)
+
+    coefficients = {}
+    scaling = {}
+    for method in sorted(set(point['method'] for point in finished)):
+        default_points = [point for point in finished if point['method'] == method and point['blocking_qubits'] is None
+                          and (point['threads'] or 10 ** 6) == max_threads[method]]
+        if not default_points:
+            continue
+        overhead, per_operation = fit_linear([point['operations'] for point in default_points],
+                                             [point['seconds'] for point in default_points])
+        memory_base, memory_factor = fit_linear([point['estimated_memory_bytes'] for point in default_points],
+                                                [point['memory_bytes'] for point in default_points])
+        coefficients[method] = {'CPU': {
+            'seconds_per_operation': per_operation,
+            'overhead_seconds': overhead,
+            'memory_factor': memory_factor if memory_factor > 0 else 1.0,
+            'memory_base_bytes': memory_base,
+            'num_points': len(default_points),
+        }}
+
+        # how many qubits it takes for the runtime to double, from log2(seconds) against width at the largest depth
+        depth = max(point['depth'] for point in default_points)
+        widths = [point['num_qubits'] for point in default_points if point['depth'] == depth]
+        times = [point['seconds'] for point in default_points if point['depth'] == depth]
+        if len(set(widths)) >= 2:
+            slope = np.polyfit(widths, np.log2(times), 1)[0]
+            scaling[method] = {'time_doubling_qubits': float(1 / slope) if slope > 0 else None, 'depth': depth}
+
+    # the fastest blocking size (None is no blocking) per width for the statevector, at the largest depth measured
+    blocking = {}
+    statevector_points = [point for point in finished if point['method'] == 'statevector']
+    for num_qubits in sorted(set(point['num_qubits'] for point in statevector_points)):
+        width_points = [point for point in statevector_points if point['num_qubits'] == num_qubits]
+        depth = max(point['depth'] for point in width_points)
+        threads = max(point['threads'] or 10 ** 6 for point in width_points)
+        candidates = [point for point in width_points if point['depth'] == depth and (point['threads'] or 10 ** 6) == threads]
+        best = min(candidates, key=lambda point: point['seconds'])
+        blocking['CPU|' + str(num_qubits)] = {'blocking_qubits': best['blocking_qubits'], 'seconds': best['seconds']}
+
+    return {'coefficients': coefficients, 'scaling': scaling, 'blocking': blocking}
+
+def run_scaling_benchmark(qubits, depths, threads, blocking, methods, shots=100, timeout=None):
+    import qiskit_aer
+    from blocking_autotuner import get_host_name
+
+    points = get_points(qubits, depths, threads, blocking, methods, shots)
+    measured = []
+    for number, point in enumerate(points):
+        result = run_point_in_subprocess(point, timeout)
+        measured.append(result)
+        print_point(number + 1, len(points), result)
+
+    profile = {
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'host': get_host_name(),
+        'qiskit_aer': qiskit_aer.__version__,
+        'points': measured,
+    }
+    profile.update(fit_reference_profile(measured))
+    return profile
+
+def print_point(number, total, point):
+    settings = "%-20s %3d qubits depth %3d threads %3s blocking %4s" % (
+        point['method'], point['num_qubits'], point['depth'], point['threads'] or 'all', point['blocking_qubits'] or '-')
+    if point.get('success'):
+        print("[%d/%d] %s  %9.4f s  %10.1f MB" % (number, total, settings, point['seconds'], point['memory_bytes'] / 1024 ** 2))
+    else:
+        print("[%d/%d] %s  failed: %s" % (number, total, settings, point.get('error', 'unsuccessful result')))
+
+def print_reference_profile(profile):
+    for method, devices in profile['coefficients'].items():
+        coefficient = devices['CPU']
+        doubling = profile['scaling'].get(method, {}).get('time_doubling_qubits')
+        print("%-22s %.3e s/operation + %.3f s, memory x%.2f%s" % (
+            method, coefficient['seconds_per_operation'], coefficient['overhead_seconds'], coefficient['memory_factor'],
+            ", time doubles every %.2f qubits" % doubling if doubling else ""))
+    for key, best in profile['blocking'].items():
+        print("Best blocking for " + key.split('|')[1] + " qubits: " + str(best['blocking_qubits'] or 'off'))
+
+def parse_blocking(value):
+    return None if value.lower() in ('none', 'off', '0') else int(value)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='CPU scaling benchmark with QuantumVolume circuits.')
+    parser.add_argument('--qubits', nargs='+', type=int, default=[12, 16, 17, 18, 20, 24]) # 17 and 18 are the Steane and Shor circuits
+    parser.add_argument('--depths', nargs='+', type=int, default=[5, 10])
+    parser.add_argument('--threads', nargs='+', type=int, default=[1, 0], help='0 means every core')
+    parser.add_argument('--blocking', nargs='+', type=parse_blocking, default=[None, 14, 18, 22], help="'none' or a number of qubits")
+    parser.add_argument('--methods', nargs='+', default=['statevector', 'matrix_product_state'])
+    parser.add_argument('--shots', type=int, default=100)
+    parser.add_argument('--timeout', type=float, default=600, help='seconds per point')
+    parser.add_argument('--output', default=REFERENCE_PROFILE_FILENAME)
+    parser.add_argument('--point', help=argparse.SUPPRESS) # used for the child processes
+    args = parser.parse_args()
+
+    if args.point:
+        print(json.dumps(run_point(json.loads(args.point))))
+        sys.exit(0)
+
+    profile = run_scaling_benchmark(args.qubits, args.depths, args.threads, args.blocking, args.methods,
+                                    args.shots, args.timeout)
+    print("")
+    print_reference_profile(profile)
+    with open(args.output, 'w') as f:
+        json.dump(profile, f, indent=2)
+    print("Reference profile written to " + args.output)
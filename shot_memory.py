@@ -0,0 +1,98 @@
+# File: shot_memory.py
+# Per-shot measurement capture stored as bit-packed NumPy arrays.
+# get_counts() only keeps the histogram, which throws away any correlation between shots, and large
+# string-keyed dictionaries are expensive.  Here the backend is asked for its per-shot memory (memory=True),
+# each shot becomes one row of packed bits, and long runs are written batch by batch into a memory-mapped
+# .npy file so 1e8 shots of the 2-bit Bell pair take about 100 MB and can be sliced without loading everything.
+#
+# Column/bit j of a row is classical bit j of the circuit (Qiskit bitstrings are printed right to left).
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+
+import json
+
+import numpy as np
+
+def get_num_bytes(num_bits, dtype='uint8'):
+    num_bytes = (num_bits + 7) // 8
+    if dtype == 'uint64':
+        num_bytes = ((num_bytes + 7) // 8) * 8 # whole 64 bit words
+    return num_bytes
+
+def get_row_shape(num_bits, dtype='uint8'):
+    if dtype == 'uint64':
+        return (get_num_bytes(num_bits, dtype) // 8,)
+    return (get_num_bytes(num_bits, dtype),)
+
+def memory_to_bits(memory):
+    # memory is result.get_memory(), e.g. ['00', '11', ...] or ['010 11', ...] with several registers
+    # returns a (shots, num_bits) uint8 array of 0/1 with column j holding classical bit j
+    text = ''.join(memory).replace(' ', '')
+    num_shots = len(memory)
+    bits = np.frombuffer(text.encode('ascii'), dtype=np.uint8) - ord('0')
+    bits = bits.reshape(num_shots, -1)
+    return bits[:, ::-1]
+
+def pack_bits(bits, dtype='uint8'):
+    num_bits = bits.shape[1]
+    packed = np.packbits(bits, axis=1, bitorder='little')
+
+    if dtype == 'uint64':
+        padded = np.zeros((bits.shape[0], get_num_bytes(num_bits, dtype)), dtype=np.uint8)
+        padded[:, :packed.shape[1]] = packed
+        return padded.view('<u8')
+    return packed
+
+def unpack_bits(packed, num_bits):
+    # accepts uint8 or uint64 rows (including slices of a memory-mapped file)
+    as_bytes = np.ascontiguousarray(packed).view(np.uint8).reshape(packed.shape[0], -1)
+    return np.unpackbits(as_bytes, axis=1, count=num_bits, bitorder='little')
+
+def pack_memory(memory, dtype='uint8'):
+    return pack_bits(memory_to_bits(memory), dtype)
+
+def get_counts_from_packed(packed, num_bits):
+    # rebuilds the usual get_counts() dictionary from packed rows
+    bits = unpack_bits(packed, num_bits)
+    rows, counts = np.unique(bits, axis=0, return_counts=True)
+    return {''.join(str(bit) for bit in row[::-1]): int(count) for row, count in zip(rows, counts)}
+
+def run_with_memory(circuit, backend, shots, dtype='uint8', **run_options):
+    # single run, returns the packed (shots, bytes) array
+    result = backend.run(circuit, shots=shots, memory=True, **run_options).result()
+    return pack_memory(result.get_memory(), dtype)
+
+def capture_shot_memory(circuit, backend, total_shots, filename, batch_shots=1000000, dtype='uint8', seed=None, **run_options):
+    # runs total_shots in batches and writes every shot into a memory-mapped .npy file as it arrives
+    from qiskit import transpile
+
+    transpiled_circuit = transpile(circuit, backend)
+    num_bits = transpiled_circuit.num_clbits
+
+    shot_memory = np.lib.format.open_memmap(filename, mode='w+', dtype=np.dtype(dtype),
+                                            shape=(total_shots,) + get_row_shape(num_bits, dtype))
+
+    written = 0
+    batch_index = 0
+    while written < total_shots:
+        shots = min(batch_shots, total_shots - written)
+        if seed is not None:
+            run_options['seed_simulator'] = seed + batch_index
+        shot_memory[written:written + shots] = run_with_memory(transpiled_circuit, backend, shots, dtype, **run_options)
+        shot_memory.flush()
+        written = written + shots
+        batch_index = batch_index + 1
+
+    # the .npy header only knows the byte layout, keep the number of classical bits next to it
+    with open(filename + '.json', 'w') as f:
+        json.dump({'num_bits': num_bits, 'dtype': dtype, 'shots': total_shots}, f)
+
+    return shot_memory
+
+def load_shot_memory(filename):
+    # memory-mapped and read only - slicing only touches the pages that are needed
+    # returns the packed array and the number of classical bits per shot
+    with open(filename + '.json') as f:
+        info = json.load(f)
+    return np.load(filename, mmap_mode='r'), info['num_bits']
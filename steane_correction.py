@@ -14,6 +14,14 @@
 # November 2, 2023 - David Shimkus - Massive overhaul of syndrome measurements.  No longer reading to classical register.  "In-place" correction implemented.  
 # November 8, 2023 - David Shimkus - More work on the decoding syndrome.  
 # November 10, 2023 - David Shimkus - It is finally working.  
+# October 19, 2026 - Optional syndrome recording (record_syndromes).
+# October 19, 2026 - Simulator device, threading and blocking picked by backend_registry.py (falls back to the CPU).
+# October 19, 2026 - Blocking qubits tuned per host instead of hard-coded.
+# October 19, 2026 - Circuit drawing is opt-in (draw_circuit) and runs in the background.
+# October 19, 2026 - Per-phase timing spans (instrumentation.py) instead of the single "Time elapsed" print.
+# October 19, 2026 - Optional memory tracking per phase (track_memory).
+# October 19, 2026 - Throttled progress line (realizations/s, shots/s, ETA, logical error rate) and snapshot file.
+# October 19, 2026 - Optional results store (results_filename) - an interrupted loop resumes where it stopped.
 
 import time
 start_time = time.time()
@@ -31,9 +39,17 @@ from qiskit import ClassicalRegister
 from qiskit import QuantumCircuit
 from qiskit.circuit.library import *
 from qiskit_aer import AerSimulator
+from backend_registry import get_simulator_config, new_simulator, print_simulator_config
+from circuit_rendering import render_in_background, wait_for_renders
+from instrumentation import add_span, enable_memory_tracking, end_span, print_phase_summary, span, start_span, write_chrome_trace
+from logical_error_statistics import get_logical_error_count
+from progress import ProgressReporter
+from results_store import open_results_store, run_batches_with_resume
 import qiskit_aer.noise as noise
 from qiskit_aer.noise import pauli_error
 from qiskit.circuit.library.standard_gates import C3XGate
+from bell_state_with_steane import measure_syndrome
+from syndrome_histograms import get_syndrome_histogram, print_syndrome_histogram
 #from qiskit.circuit.library.standard_gates import C3ZGate #this did not work, but for future reference: Z=HXH
 
 print("Imports Successful")
@@ -41,6 +57,8 @@ print("Qiskit Version:")
 print(qiskit.__qiskit_version__)
 print("")
 
+add_span('imports', start_time, time.time() - start_time)
+
 #### circuit "hyper" parameters ######################################
 
 #TODO: wrap into runtime parameters, etc. 
@@ -51,7 +69,15 @@ num_loops = loops # Dr. Gamage requested this - it also works better with the "f
 #depth  = 10
 #number_qubits = 28 #max that can be done on two T600's it seems 
 #number_qubits = 24
-number_blocking_qubits = 22 #GPU specific parameter
+number_blocking_qubits = None #None: measured for this host by blocking_autotuner.py (22 was the hard-coded GPU value)
+record_syndromes = False #store the syndrome of every correction round in an extra 's' register (see syndrome_histograms.py)
+draw_circuit = False #draw the circuit in the background when it is done (see circuit_rendering.py) - drawing can take longer than the simulation
+trace_filename = None #e.g. 'steane_trace.json' - Chrome trace of every timed phase (see instrumentation.py)
+track_memory = False #record RSS and Python allocations per phase and warn about phases that keep growing (see instrumentation.py)
+progress_interval = 5 #seconds between progress lines during the loop
+progress_filename = None #e.g. 'steane_progress.json' - JSON snapshot of the progress, rewritten every 30 seconds (see progress.py)
+results_filename = None #e.g. 'results.sqlite' - every loop iteration is stored, a rerun skips the ones already done (see results_store.py)
+base_seed = 1234 #with results_filename, iteration i is seeded with base_seed + i so a resumed run is the same run
 
 ######################################################################
 
@@ -113,10 +139,19 @@ num_00 = 0
 num_01 = 0
 num_10 = 0
 num_11 = 0
+syndrome_counts = {}
+
+if track_memory:
+        enable_memory_tracking()
 
 ##### "Ideal" (no errors) starts here ########
+start_span('ideal')
 
-my_simulator = AerSimulator(method='statevector', device='GPU', noise_model=noise_model)
+#GPU if qiskit-aer was built with it, otherwise the CPU
+simulator_config = get_simulator_config('auto', num_qubits=17, blocking_qubits=number_blocking_qubits)
+print_simulator_config(simulator_config)
+print("")
+my_simulator = new_simulator(simulator_config, noise_model)
 #my_simulator = AerSimulator(method='statevector')
 
 #demonstrate the noise model
@@ -142,7 +177,7 @@ circuit.measure(q[1],c[1])
 
 #multi GPU
 result = execute(circuit, my_simulator, shots=ideal_shots, 
-                blocking_enable=True, blocking_qubits=number_blocking_qubits,
+                **simulator_config['run_options'],
                 basis_gates=basis_gates
         ).result() 
 
@@ -153,15 +188,23 @@ print("Counts using the built in Qiskit 'shots'")
 #print("--------------------------------------")
 print(counts)
 #print("--------------------------------------")
-finish_time = time.time() - start_time
-print('Time elapsed: ' + str(finish_time) + ' seconds')
+end_span() #ideal
+
+progress = ProgressReporter('steane', total_realizations=num_loops, interval=progress_interval,
+                snapshot_filename=progress_filename)
+
+results_store = None
+if results_filename is not None:
+        results_store = open_results_store(results_filename)
+        print("Storing every iteration in " + results_filename + " - iterations already stored there are not simulated again")
 
-start_time = time.time() #reset timer
 for i in range(num_loops):
+        start_span('iteration')
+        start_span('build')
 
         ##### Steane code starts here ########
 
-        my_simulator = AerSimulator(method='statevector',device='GPU',noise_model=noise_model)
+        my_simulator = new_simulator(simulator_config, noise_model)
 
         # encode the first logical qubit
         #q = QuantumRegister(18,'q') #shor code demo
@@ -170,6 +213,10 @@ for i in range(num_loops):
 
         circuit = QuantumCircuit(q,c)
 
+        if record_syndromes:
+                s = ClassicalRegister(12,'s') #3 syndrome bits for each of the 4 correction rounds
+                circuit.add_register(s)
+
         #### this is our precious quantum bell state ##########
 
         circuit.h(q[0]) #set into superposition
@@ -278,6 +325,9 @@ for i in range(num_loops):
 
         circuit.barrier(q)
 
+        if record_syndromes:
+                measure_syndrome(circuit, q, s, 0)
+
         #clean/wash the qubits for reuse
 
         circuit.reset(q[14]) 
@@ -327,6 +377,9 @@ for i in range(num_loops):
 
         circuit.barrier(q)
 
+        if record_syndromes:
+                measure_syndrome(circuit, q, s, 1)
+
         circuit.reset(q[14]) 
         circuit.reset(q[15])
         circuit.reset(q[16])
@@ -370,6 +423,9 @@ for i in range(num_loops):
 
         circuit.barrier(q)
 
+        if record_syndromes:
+                measure_syndrome(circuit, q, s, 2)
+
         #clean the qubits for reuse
 
         circuit.reset(q[14]) 
@@ -417,6 +473,9 @@ for i in range(num_loops):
         circuit.append(C3XGate(), [16, 15, 14, 13])
         #circuit.h(q[13])
 
+        if record_syndromes:
+                measure_syndrome(circuit, q, s, 3)
+
         circuit.barrier(q)
 
         #################################################################################
@@ -472,15 +531,26 @@ for i in range(num_loops):
         circuit.measure(q[0],c[0])
         circuit.measure(q[7],c[1])
 
-        #multi GPU
-        backend = AerSimulator(noise_model=noise_model, #coupling_map=coupling_map,
-                        basis_gates=basis_gates)
-        transpiled_circuit = transpile(circuit, backend)
+        end_span() #build
+
+        if results_store is None:
+                #multi GPU
+                backend = AerSimulator(noise_model=noise_model, #coupling_map=coupling_map,
+                                basis_gates=basis_gates)
+                with span('transpile'):
+                        transpiled_circuit = transpile(circuit, backend)
 
-        result = execute(transpiled_circuit, my_simulator, shots=error_shots,
-                blocking_enable=True, blocking_qubits=number_blocking_qubits).result()
+                with span('execute'):
+                        result = execute(transpiled_circuit, my_simulator, shots=error_shots,
+                                **simulator_config['run_options']).result()
+                counts = result.get_counts()
+        else:
+                #iteration i is batch i of the stored experiment - read back if it is there, simulated and stored if not
+                with span('execute'):
+                        counts = run_batches_with_resume(results_store, 'steane_loop', circuit, my_simulator, i + 1, error_shots,
+                                noise_model, base_seed, run_options=simulator_config['run_options'], first_batch=i, verbose=False)
 
-        counts = result.get_counts()
+        start_span('parse')
 
         #print('\n')
         #print("----------------------------------------")
@@ -491,6 +561,9 @@ for i in range(num_loops):
         #TODO: there are better ways to do this...
         key, value = list(counts.items())[0]
         #print(key)
+        if record_syndromes:
+                syndrome_counts[key] = syndrome_counts.get(key, 0) + value
+                key = key.split(' ')[-1] #the logical result is the 'c' register
         if key == '00':
                 num_00 = num_00 + 1
         if key == '01':
@@ -499,15 +572,22 @@ for i in range(num_loops):
                 num_10 = num_10 + 1
         if key == '11':
                 num_11 = num_11 + 1
+        end_span() #parse
+        end_span() #iteration
+        progress.update(shots=error_shots, errors=get_logical_error_count(counts))
+
+progress.finish()
 
-circuit.draw(output='mpl', filename='steanecode.png', fold=-1)
+if draw_circuit:
+        render_in_background(circuit, 'steanecode')
 
 #running it again with "shots"
 
-result = execute(circuit, my_simulator, shots=ideal_shots, 
-                blocking_enable=True, blocking_qubits=number_blocking_qubits,
-                basis_gates=basis_gates
-        ).result() 
+with span('shots_run'):
+        result = execute(circuit, my_simulator, shots=ideal_shots, 
+                        **simulator_config['run_options'],
+                        basis_gates=basis_gates
+                ).result() 
 
 counts = result.get_counts()
 
@@ -530,5 +610,13 @@ print('Number of 01 results: ' + str(num_01))
 print('Number of 10 results: ' + str(num_10))
 print('Number of 11 results: ' + str(num_11))
 
-finish_time = time.time() - start_time
-print('Time elapsed: ' + str(finish_time) + ' seconds')
+if record_syndromes:
+        print("")
+        print_syndrome_histogram(get_syndrome_histogram(syndrome_counts, 'steane'), 'steane')
+
+wait_for_renders() #let a background drawing finish before the timings are printed
+
+print("")
+print_phase_summary()
+if trace_filename is not None:
+        write_chrome_trace(trace_filename)
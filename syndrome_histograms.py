@@ -0,0 +1,96 @@
+# File: syndrome_histograms.py
+# Syndrome x logical outcome histograms for circuits built with record_syndromes=True
+# (new_steane_circuit(record_syndromes=True) or new_shor_circuit(record_syndromes=True)).
+# Everything is aggregated from the counts dictionary, which has one entry per distinct outcome rather than
+# per shot, so diagnosing decoder failures needs no extra full-circuit runs.
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+
+# (round name, number of bits) in the order they are stored in the 's' register
+SYNDROME_LAYOUTS = {
+    'steane': [
+        ('logical qubit 1 bit flip', 3),
+        ('logical qubit 1 phase flip', 3),
+        ('logical qubit 2 bit flip', 3),
+        ('logical qubit 2 phase flip', 3),
+    ],
+    'shor': [
+        ('logical qubit 1 block 1 bit flip', 2),
+        ('logical qubit 1 block 2 bit flip', 2),
+        ('logical qubit 1 block 3 bit flip', 2),
+        ('logical qubit 1 phase flip', 2),
+        ('logical qubit 2 block 1 bit flip', 2),
+        ('logical qubit 2 block 2 bit flip', 2),
+        ('logical qubit 2 block 3 bit flip', 2),
+        ('logical qubit 2 phase flip', 2),
+    ],
+}
+
+def split_syndrome_key(key, layout):
+    # counts keys look like "<s register> <c register>"; Qiskit prints bit 0 of every register on the right
+    syndrome_text, logical = key.split(' ')
+    syndrome_bits = syndrome_text[::-1] # now index j is s[j]
+
+    rounds = []
+    start = 0
+    for name, width in layout:
+        rounds.append(syndrome_bits[start:start + width][::-1]) # each round printed most significant bit first
+        start = start + width
+
+    return tuple(rounds), logical
+
+def get_syndrome_histogram(counts, layout):
+    # {(round syndromes...): {logical outcome: count}}
+    if isinstance(layout, str):
+        layout = SYNDROME_LAYOUTS[layout]
+
+    histogram = {}
+    for key, value in counts.items():
+        syndromes, logical = split_syndrome_key(key, layout)
+        outcomes = histogram.setdefault(syndromes, {})
+        outcomes[logical] = outcomes.get(logical, 0) + value
+    return histogram
+
+def get_round_statistics(histogram, layout):
+    # per round: how often the correction fired (non-zero syndrome) and the logical error rate with / without it
+    if isinstance(layout, str):
+        layout = SYNDROME_LAYOUTS[layout]
+
+    statistics = []
+    for round_index, (name, width) in enumerate(layout):
+        fired = {'shots': 0, 'errors': 0}
+        quiet = {'shots': 0, 'errors': 0}
+
+        for syndromes, outcomes in histogram.items():
+            group = fired if '1' in syndromes[round_index] else quiet
+            for logical, value in outcomes.items():
+                group['shots'] = group['shots'] + value
+                if logical not in ('00', '11'):
+                    group['errors'] = group['errors'] + value
+
+        total = fired['shots'] + quiet['shots']
+        statistics.append({
+            'round': name,
+            'fired': fired['shots'],
+            'fired_fraction': fired['shots'] / total if total else 0.0,
+            'logical_error_rate_when_fired': fired['errors'] / fired['shots'] if fired['shots'] else 0.0,
+            'logical_error_rate_when_quiet': quiet['errors'] / quiet['shots'] if quiet['shots'] else 0.0,
+        })
+    return statistics
+
+def print_syndrome_histogram(histogram, layout):
+    if isinstance(layout, str):
+        layout = SYNDROME_LAYOUTS[layout]
+
+    print('Syndromes (' + ', '.join(name for name, width in layout) + ') -> logical outcomes:')
+    # most frequent syndrome patterns first
+    for syndromes, outcomes in sorted(histogram.items(), key=lambda item: -sum(item[1].values())):
+        print('  ' + ' '.join(syndromes) + ' -> ' + str(dict(sorted(outcomes.items()))))
+
+    print('Correction rounds:')
+    for round_statistics in get_round_statistics(histogram, layout):
+        print('  ' + round_statistics['round'] + ': fired in ' + str(round_statistics['fired']) + ' shots (' +
+              str(round_statistics['fired_fraction']) + '), logical error rate when fired ' +
+              str(round_statistics['logical_error_rate_when_fired']) + ', otherwise ' +
+              str(round_statistics['logical_error_rate_when_quiet']))
@@ -0,0 +1,199 @@
+# File: threshold_sweep.py
+# Logical vs. physical error rate curves for every code family in one run.
+# Comparing the bit-flip, phase-flip, Shor and Steane constructions used to mean running separate scripts and
+# copying their printed counts.  This driver sweeps physical error rate x code over a process pool, estimates
+# each point with the adaptive estimator from logical_error_statistics.py, fits the pseudo-threshold (where the
+# logical error rate equals the physical error rate) and writes a CSV and a plot.
+#
+# Usage: python threshold_sweep.py --codes bit_flip phase_flip shor steane --points 20 --workers 32 [--profile]
+#
+# Revision History
+# October 19, 2026 - Initial Version.
+# October 19, 2026 - --profile profiles every point in its worker and merges them into <output>.prof.
+
+import argparse
+import csv
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+CODE_BUILDERS = {
+    'bit_flip': ('bell_state_with_bit_phase', 'new_bit_flip_circuit'),
+    'phase_flip': ('bell_state_with_bit_phase', 'new_phase_flip_circuit'),
+    'shor': ('bell_state_with_shor', 'new_shor_circuit'),
+    'steane': ('bell_state_with_steane', 'new_steane_circuit'),
+}
+
+# per worker process: transpiled circuits are reused for every point of the same code
+_transpiled_circuits = {}
+
+def get_transpiled_circuit(code, basis_gates):
+    import importlib
+    from qiskit import transpile
+
+    key = (code, tuple(basis_gates))
+    if key not in _transpiled_circuits:
+        module_name, builder_name = CODE_BUILDERS[code]
+        circuit = getattr(importlib.import_module(module_name), builder_name)()
+        _transpiled_circuits[key] = transpile(circuit, basis_gates=basis_gates)
+    return _transpiled_circuits[key]
+
+def run_sweep_point(task):
+    # runs in a worker process - one (code, physical error rate) point
+    from qiskit_aer import AerSimulator
+    from new_noise_refused import get_model_for_probability
+    from logical_error_statistics import estimate_logical_error_rate
+
+    from profiling import new_profiler, profile_run
+
+    started = time.time()
+    profiler = new_profiler() if task.get('profile_filename') else None
+
+    noise_model = get_model_for_probability(task['p'], task['error_type'])
+    transpiled_circuit = get_transpiled_circuit(task['code'], noise_model.basis_gates)
+
+    # one thread per point, the parallelism comes from the process pool
+    simulator = AerSimulator(method='statevector', noise_model=noise_model, max_parallel_threads=1)
+
+    batch_index = [0]
+    def run_batch(shots):
+        batch_index[0] = batch_index[0] + 1
+        return simulator.run(transpiled_circuit, shots=shots, seed_simulator=task['seed'] + batch_index[0]).result().get_counts()
+
+    with profile_run(profiler): # the run phase - the noise model and transpiled circuit are set up above
+        estimate = estimate_logical_error_rate(run_batch, batch_shots=task['batch_shots'], max_shots=task['max_shots'],
+                                               target_relative_error=task['target_relative_error'])
+    if profiler is not None:
+        profiler.dump_stats(task['profile_filename'])
+
+    return {
+        'code': task['code'],
+        'physical_error_rate': task['p'],
+        'logical_error_rate': estimate['logical_error_rate'],
+        'lower': estimate['lower'],
+        'upper': estimate['upper'],
+        'num_errors': estimate['num_errors'],
+        'num_shots': estimate['num_shots'],
+        'seconds': time.time() - started,
+    }
+
+def run_threshold_sweep(codes, physical_error_rates, error_type='bit_flip', workers=None, batch_shots=1000,
+                        max_shots=100000, target_relative_error=0.1, seed=1234, profile_directory=None):
+    # with profile_directory every point writes its profile there as <code>_<index>.prof
+    tasks = []
+    for code in codes:
+        for i, p in enumerate(physical_error_rates):
+            tasks.append({'code': code, 'p': float(p), 'error_type': error_type, 'batch_shots': batch_shots,
+                          'max_shots': max_shots, 'target_relative_error': target_relative_error,
+                          'seed': seed + 1000003 * i,
+                          'profile_filename': os.path.join(profile_directory, code + '_' + str(i) + '.prof') if profile_directory else None})
+
+    # the most expensive codes go first so the pool does not end on a long tail
+    tasks.sort(key=lambda task: -list(CODE_BUILDERS).index(task['code']))
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        points = list(pool.map(run_sweep_point, tasks))
+
+    points.sort(key=lambda point: (codes.index(point['code']), point['physical_error_rate']))
+    return points
+
+def fit_pseudo_threshold(points):
+    # crossing of logical = physical error rate, interpolated in log-log space between neighbouring points
+    # returns None when the curve never crosses within the swept range
+    usable = [point for point in points if point['logical_error_rate'] > 0]
+    for left, right in zip(usable, usable[1:]):
+        left_gap = math.log(left['logical_error_rate']) - math.log(left['physical_error_rate'])
+        right_gap = math.log(right['logical_error_rate']) - math.log(right['physical_error_rate'])
+        if left_gap <= 0 < right_gap or left_gap >= 0 > right_gap:
+            fraction = left_gap / (left_gap - right_gap)
+            log_p = math.log(left['physical_error_rate']) + fraction * (math.log(right['physical_error_rate']) - math.log(left['physical_error_rate']))
+            return math.exp(log_p)
+    return None
+
+def get_pseudo_thresholds(points, codes):
+    return {code: fit_pseudo_threshold([point for point in points if point['code'] == code]) for code in codes}
+
+def write_sweep_csv(points, filename):
+    fields = ['code', 'physical_error_rate', 'logical_error_rate', 'lower', 'upper', 'num_errors', 'num_shots', 'seconds']
+    with open(filename, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(points)
+
+def plot_sweep(points, codes, thresholds, filename):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    figure, axes = plt.subplots(figsize=(7, 5))
+    for code in codes:
+        code_points = [point for point in points if point['code'] == code and point['logical_error_rate'] > 0]
+        if not code_points:
+            continue
+        x = [point['physical_error_rate'] for point in code_points]
+        y = [point['logical_error_rate'] for point in code_points]
+        errors = [[point['logical_error_rate'] - point['lower'] for point in code_points],
+                  [point['upper'] - point['logical_error_rate'] for point in code_points]]
+        label = code if thresholds[code] is None else code + ' (p_th ~ ' + format(thresholds[code], '.2g') + ')'
+        axes.errorbar(x, y, yerr=errors, marker='o', capsize=2, label=label)
+
+    all_p = [point['physical_error_rate'] for point in points]
+    axes.plot([min(all_p), max(all_p)], [min(all_p), max(all_p)], 'k--', label='logical = physical')
+    axes.set_xscale('log')
+    axes.set_yscale('log')
+    axes.set_xlabel('physical error rate')
+    axes.set_ylabel('logical error rate')
+    axes.legend()
+    figure.tight_layout()
+    figure.savefig(filename)
+    plt.close(figure)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Logical vs. physical error rate sweep for the Bell state codes.')
+    parser.add_argument('--codes', nargs='+', default=list(CODE_BUILDERS), choices=list(CODE_BUILDERS))
+    parser.add_argument('--points', type=int, default=20, help='number of physical error rates')
+    parser.add_argument('--min-p', type=float, default=1e-4)
+    parser.add_argument('--max-p', type=float, default=0.3)
+    parser.add_argument('--error-type', default='bit_flip', choices=['bit_flip', 'depolarizing'])
+    parser.add_argument('--batch-shots', type=int, default=1000)
+    parser.add_argument('--max-shots', type=int, default=100000)
+    parser.add_argument('--target-relative-error', type=float, default=0.1)
+    parser.add_argument('--workers', type=int, default=None, help='default: one per CPU')
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--output', default='threshold_sweep', help='prefix for the .csv and .png files')
+    parser.add_argument('--profile', action='store_true', help='profile the simulation of every point and write the merged profile to <output>.prof')
+    args = parser.parse_args()
+
+    start_time = time.time()
+
+    profile_directory = None
+    if args.profile:
+        import tempfile
+        profile_directory = tempfile.mkdtemp(prefix='threshold_sweep_profiles_')
+
+    physical_error_rates = np.logspace(math.log10(args.min_p), math.log10(args.max_p), args.points)
+    points = run_threshold_sweep(args.codes, physical_error_rates, args.error_type, args.workers, args.batch_shots,
+                                 args.max_shots, args.target_relative_error, args.seed, profile_directory)
+
+    if profile_directory is not None:
+        import shutil
+        from profiling import get_stats, print_hotspots
+
+        stats = get_stats([os.path.join(profile_directory, filename) for filename in sorted(os.listdir(profile_directory))])
+        stats.dump_stats(args.output + '.prof')
+        shutil.rmtree(profile_directory)
+        print("Profile of every point written to " + args.output + '.prof')
+        print_hotspots(stats)
+        print("")
+    thresholds = get_pseudo_thresholds(points, args.codes)
+
+    write_sweep_csv(points, args.output + '.csv')
+    plot_sweep(points, args.codes, thresholds, args.output + '.png')
+
+    for code in args.codes:
+        print(code + ' pseudo-threshold: ' + (str(thresholds[code]) if thresholds[code] is not None else 'no crossing in range'))
+    print('Wrote ' + args.output + '.csv and ' + args.output + '.png')
+    print('Time elapsed: ' + str(time.time() - start_time) + ' seconds')